@@ -5,6 +5,7 @@ from flask_cors import CORS
 from .config import Config
 from .extensions import db, jwt, mail, migrate, socketio
 from .resources import initialize_routes
+from .commands import register_commands
 from . import events
 
 def create_app(config_object=None):
@@ -62,4 +63,7 @@ def create_app(config_object=None):
     #-----Create the established routes-----
     initialize_routes(app)
 
+    #-----Register the maintenance CLI commands-----
+    register_commands(app)
+
     return app
\ No newline at end of file
@@ -0,0 +1,16 @@
+"""
+    A package for the maintenance CLI commands (flask <group> <command>)
+"""
+
+from typing import TYPE_CHECKING
+from .trending_commands import trending_cli
+from .outbox_commands import outbox_cli
+from .counter_commands import counters_cli
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+def register_commands(app: 'Flask') -> None:
+    app.cli.add_command(trending_cli)
+    app.cli.add_command(outbox_cli)
+    app.cli.add_command(counters_cli)
@@ -0,0 +1,62 @@
+import time
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from app.extensions import db
+from app.services.counters.like_counter_service import flush_like_counters
+from app.services.counters.reconcile_service import reconcile_like_counts
+
+counters_cli = AppGroup('counters', help="Maintains the denormalized post counters.")
+
+
+@counters_cli.command('flush')
+@click.option('--once', is_flag=True, help="Flush the pending deltas and exit instead of polling.")
+def flush_command(once: bool):
+    """Applies pending like count deltas to posts.like_count in batches."""
+    config = current_app.config
+
+    click.echo("Counter flusher started.")
+    while True:
+        try:
+            flushed = flush_like_counters(db.session, config['LIKE_COUNTER_FLUSH_BATCH_SIZE'])
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.error(f"Like counter flush failed: {e}", exc_info=True)
+            flushed = 0
+        finally:
+            db.session.remove()
+
+        if flushed < config['LIKE_COUNTER_FLUSH_BATCH_SIZE']: # A full batch means more deltas are probably waiting
+            if once:
+                break
+            time.sleep(config['LIKE_COUNTER_FLUSH_INTERVAL_SECONDS'])
+
+
+@counters_cli.command('reconcile')
+@click.option('--restart', is_flag=True, help="Start from the first post instead of the checkpoint of an interrupted run.")
+@click.option('--chunk-size', type=int, default=None, help="Post ids corrected per transaction.")
+@click.option('--rows-per-second', type=int, default=None, help="Upper bound on post ids scanned per second.")
+def reconcile_command(restart: bool, chunk_size: int | None, rows_per_second: int | None):
+    """
+    Recomputes posts.like_count from post_likes and reports the drift it repaired.
+    Safe to schedule (e.g. nightly from cron) while the app is serving traffic.
+    """
+    config = current_app.config
+    chunk_size = chunk_size or config['COUNTER_RECONCILE_CHUNK_SIZE']
+    rows_per_second = rows_per_second or config['COUNTER_RECONCILE_MAX_ROWS_PER_SECOND']
+
+    def report_chunk(first_id: int, last_id: int, drifts: list[int]):
+        if drifts:
+            click.echo(f"Posts {first_id}-{last_id}: corrected {len(drifts)} like counts (net drift {sum(drifts)}).")
+
+    try:
+        stats = reconcile_like_counts(db.session, chunk_size, rows_per_second, restart=restart, on_chunk=report_chunk)
+    finally:
+        db.session.remove()
+
+    click.echo(
+        f"Reconciled like_count for post ids {stats['first_id']}-{stats['last_id']} in {stats['chunks']} chunks: "
+        f"{stats['posts_corrected']} posts corrected, total drift {stats['total_drift']}, "
+        f"net drift {stats['net_drift']}, largest drift {stats['max_drift']}."
+    )
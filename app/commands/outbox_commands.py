@@ -0,0 +1,35 @@
+import time
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from socketio import RedisManager
+
+from app.extensions import db
+from app.services.outbox.outbox_service import process_outbox_batch
+
+outbox_cli = AppGroup('outbox', help="Carries out the side effects recorded in the outbox table.")
+
+
+@outbox_cli.command('worker')
+@click.option('--once', is_flag=True, help="Drain the outbox and exit instead of polling.")
+def worker_command(once: bool):
+    """Emits committed outbox events through a write-only Socket.IO Redis manager."""
+    config = current_app.config
+    # Publishes on the channel Flask-SocketIO's own Redis manager listens to; it never subscribes.
+    emitter = RedisManager(config['MESSAGE_QUEUE'], channel='flask-socketio', write_only=True)
+
+    click.echo("Outbox worker started.")
+    while True:
+        try:
+            claimed = process_outbox_batch(db.session, emitter, config['OUTBOX_BATCH_SIZE'], config['OUTBOX_MAX_ATTEMPTS'])
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.error(f"Outbox batch failed: {e}", exc_info=True)
+            claimed = 0
+        finally:
+            db.session.remove()
+
+        if claimed < config['OUTBOX_BATCH_SIZE']: # A full batch means more rows are probably waiting
+            if once:
+                break
+            time.sleep(config['OUTBOX_POLL_INTERVAL_SECONDS'])
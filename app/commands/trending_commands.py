@@ -0,0 +1,16 @@
+import click
+from flask.cli import AppGroup
+
+from app.extensions import db
+from app.services.post.trending_service import rebuild_trending_buckets
+
+trending_cli = AppGroup('trending', help="Maintains the trending hashtag counters.")
+
+
+@trending_cli.command('rebuild')
+def rebuild_command():
+    """Rebuilds the trending hashtag buckets from Postgres, e.g. after a Redis flush."""
+    rebuilt = rebuild_trending_buckets(db.session)
+    db.session.rollback() # Read-only; ends the transaction
+    for level, bucket_count in rebuilt.items():
+        click.echo(f"Rebuilt {bucket_count} non-empty '{level}' buckets.")
@@ -28,4 +28,67 @@ class Config:
     GOOGLE_CLIENT_SECRET = os.getenv('GOOGLE_CLIENT_SECRET')
     GOOGLE_REDIRECT_URI = os.getenv('GOOGLE_REDIRECT_URI')
 
-    MESSAGE_QUEUE = os.getenv('REDIS_URL', 'redis://localhost:6379')
\ No newline at end of file
+    MESSAGE_QUEUE = os.getenv('REDIS_URL', 'redis://localhost:6379')
+
+    # ---------Home Timeline (fan-out-on-write) Configurations---------
+    TIMELINE_MAX_LENGTH = int(os.getenv('TIMELINE_MAX_LENGTH', 800)) # Post ids kept per user timeline
+    TIMELINE_TTL_SECONDS = int(os.getenv('TIMELINE_TTL_SECONDS', 7 * 24 * 3600)) # Idle timelines expire and are rebuilt lazily
+    TIMELINE_FOLLOW_BACKFILL = int(os.getenv('TIMELINE_FOLLOW_BACKFILL', 50)) # Posts copied into a timeline on follow
+    # Authors with more followers than this are not fanned out; their posts are merged in at read time.
+    TIMELINE_FANOUT_FOLLOWER_THRESHOLD = int(os.getenv('TIMELINE_FANOUT_FOLLOWER_THRESHOLD', 10000))
+    AUTHOR_RECENT_POSTS_LENGTH = int(os.getenv('AUTHOR_RECENT_POSTS_LENGTH', 200)) # Recent posts kept per author for pull
+
+    # ---------Public Feed Cache Configurations---------
+    PUBLIC_FEED_CACHE_LENGTH = int(os.getenv('PUBLIC_FEED_CACHE_LENGTH', 1000)) # Newest public post ids kept in the shared ring buffer
+
+    # ---------Post Cache Configurations---------
+    POST_CACHE_TTL_SECONDS = int(os.getenv('POST_CACHE_TTL_SECONDS', 600)) # Upper bound on staleness of author data in cached post bodies
+
+    # ---------Count Configurations---------
+    COUNTER_TTL_SECONDS = int(os.getenv('COUNTER_TTL_SECONDS', 3600)) # Maintained counters are recounted exactly after this
+
+    # ---------Liked Status Configurations---------
+    LIKED_SET_MAX_SIZE = int(os.getenv('LIKED_SET_MAX_SIZE', 5000)) # Users with more likes are answered from Postgres only
+    LIKED_SET_TTL_SECONDS = int(os.getenv('LIKED_SET_TTL_SECONDS', 24 * 3600))
+
+    # ---------Ranked Feed Configurations---------
+    RANKED_FEED_WINDOW_HOURS = int(os.getenv('RANKED_FEED_WINDOW_HOURS', 72)) # Only posts this recent are candidates
+    RANKED_FEED_CANDIDATES_PER_SOURCE = int(os.getenv('RANKED_FEED_CANDIDATES_PER_SOURCE', 1000)) # Followed and popular posts each
+    RANKED_FEED_AFFINITY_DAYS = int(os.getenv('RANKED_FEED_AFFINITY_DAYS', 30)) # Like history used for author affinity
+    # ---------Trending Hashtags Configurations---------
+    TRENDING_MAX_LIMIT = int(os.getenv('TRENDING_MAX_LIMIT', 50)) # Upper bound on hashtags returned per request
+
+    # ---------User Search Configurations---------
+    USER_SEARCH_MAX_PREFIX = int(os.getenv('USER_SEARCH_MAX_PREFIX', 3)) # Queries up to this length are answered from memory
+    USER_SEARCH_PREFIX_POPULAR_USERS = int(os.getenv('USER_SEARCH_PREFIX_POPULAR_USERS', 5000)) # Most-followed users in the prefix index
+    USER_SEARCH_PREFIX_REFRESH_SECONDS = int(os.getenv('USER_SEARCH_PREFIX_REFRESH_SECONDS', 300))
+    USER_SEARCH_MAX_LIMIT = int(os.getenv('USER_SEARCH_MAX_LIMIT', 20))
+
+    # ---------Mention Configurations---------
+    MAX_MENTIONS_PER_POST = int(os.getenv('MAX_MENTIONS_PER_POST', 20)) # Each mention creates a notification
+    MENTION_CACHE_TTL_SECONDS = int(os.getenv('MENTION_CACHE_TTL_SECONDS', 3600))
+    MENTION_CACHE_NEGATIVE_TTL_SECONDS = int(os.getenv('MENTION_CACHE_NEGATIVE_TTL_SECONDS', 300)) # Usernames that do not exist
+
+    # ---------Outbox Worker Configurations---------
+    OUTBOX_BATCH_SIZE = int(os.getenv('OUTBOX_BATCH_SIZE', 100)) # Events claimed and emitted per transaction
+    OUTBOX_POLL_INTERVAL_SECONDS = float(os.getenv('OUTBOX_POLL_INTERVAL_SECONDS', 0.5)) # Idle wait between polls
+    OUTBOX_MAX_ATTEMPTS = int(os.getenv('OUTBOX_MAX_ATTEMPTS', 5)) # A failing event is dropped after this many tries
+
+    # ---------Nearby Configurations---------
+    NEARBY_MAX_RADIUS_METERS = int(os.getenv('NEARBY_MAX_RADIUS_METERS', 50000))
+    NEARBY_CACHE_TTL_SECONDS = int(os.getenv('NEARBY_CACHE_TTL_SECONDS', 30)) # First pages of public nearby posts, per geohash tile
+    NEARBY_USERS_GRID_PRECISION = int(os.getenv('NEARBY_USERS_GRID_PRECISION', 5)) # Geohash cell (about 4.9 km) user locations are rounded to
+    NEARBY_USERS_MAX_RADIUS_METERS = int(os.getenv('NEARBY_USERS_MAX_RADIUS_METERS', 100000))
+    NEARBY_USERS_CACHE_TTL_SECONDS = int(os.getenv('NEARBY_USERS_CACHE_TTL_SECONDS', 300)) # Nearby people, per grid cell
+    NEARBY_USERS_MAX_LIMIT = int(os.getenv('NEARBY_USERS_MAX_LIMIT', 50))
+
+    # ---------Counter Configurations---------
+    LIKE_COUNTER_SHARDS = int(os.getenv('LIKE_COUNTER_SHARDS', 16)) # Delta rows per post that concurrent likes spread over
+    LIKE_COUNTER_FLUSH_BATCH_SIZE = int(os.getenv('LIKE_COUNTER_FLUSH_BATCH_SIZE', 1000)) # Delta rows applied per UPDATE
+    LIKE_COUNTER_FLUSH_INTERVAL_SECONDS = float(os.getenv('LIKE_COUNTER_FLUSH_INTERVAL_SECONDS', 2)) # Idle wait between flushes
+    COUNTER_RECONCILE_CHUNK_SIZE = int(os.getenv('COUNTER_RECONCILE_CHUNK_SIZE', 5000)) # Post ids corrected per transaction
+    COUNTER_RECONCILE_MAX_ROWS_PER_SECOND = int(os.getenv('COUNTER_RECONCILE_MAX_ROWS_PER_SECOND', 20000)) # Post ids scanned per second
+
+    # ---------Notification Configurations---------
+    NOTIFICATION_AGGREGATION_WINDOW_SECONDS = int(os.getenv('NOTIFICATION_AGGREGATION_WINDOW_SECONDS', 86400)) # Likes of a post in one window share a notification
+    NOTIFICATION_RECENT_ACTORS = int(os.getenv('NOTIFICATION_RECENT_ACTORS', 3)) # Actors named in an aggregated notification
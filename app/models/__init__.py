@@ -1,8 +1,10 @@
 from .base import Base
 from .follower_model import Follower
 from .hashtag_model import Hashtag, PostHashtag
+from .like_count_delta_model import LikeCountDelta
 from .mention_model import PostMentions
 from .notification_model import Notification
+from .outbox_model import OutboxEvent
 from .post_like_model import PostLike
 from .post_model import Post
 from .user_model import User
@@ -11,7 +13,9 @@ __all__ = [
     "Base",
     "Follower",
     "Hashtag",
+    "LikeCountDelta",
     "Notification",
+    "OutboxEvent",
     "Post",
     "PostHashtag",
     "PostLike",
@@ -22,7 +22,10 @@ class Follower(Base):
 
     __table_args__ = (
         PrimaryKeyConstraint('follower_id', 'followed_id'), # Composite Primary Key
-        Index('idx_followers_followed_id', 'followed_id'),
+        # Fan-out and follower lists read follower_id by followed_id without visiting the heap
+        Index('idx_followers_followed_created_at', 'followed_id', created_at.desc(), postgresql_include=['follower_id']),
+        # Following lists and timeline rebuilds, newest follows first
+        Index('idx_followers_follower_created_at', 'follower_id', created_at.desc(), postgresql_include=['followed_id']),
     )
 
 
@@ -1,7 +1,11 @@
-from sqlalchemy import Column, ForeignKey, Index, PrimaryKeyConstraint, select, Integer, String
+from sqlalchemy import (
+    Column, ForeignKey, Index, PrimaryKeyConstraint, select, update, func, Integer, String, DateTime, Enum as SqlEnum, bindparam, any_
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.orm import relationship, Session, Mapped
 
 from app.models.base import Base
+from utils.model_utils.enums import PostVisibility
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -13,16 +17,46 @@ if TYPE_CHECKING:
 class PostHashtag(Base):
     """
     Association table for the many-to-many relationship between Posts and Hashtags.
+
+    The post's created_at and visibility are copied onto each row, so a tag's timeline is
+    read from one index range without joining and sorting posts. They are kept in sync
+    with sync_post whenever a post's hashtags or visibility change.
     """
     __tablename__ = 'post_hashtags'
     post_id = Column(Integer, ForeignKey('posts.id', ondelete='CASCADE'), nullable=False)
     hashtag_id = Column(Integer, ForeignKey('hashtags.id', ondelete='CASCADE'), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False) # Copy of posts.created_at
+    visibility = Column( # Copy of posts.visibility
+        SqlEnum(PostVisibility, name="post_visibility_enum", create_type=False),
+        nullable=False,
+        server_default=PostVisibility.PUBLIC.name,
+    )
 
     __table_args__ = (
         PrimaryKeyConstraint('post_id', 'hashtag_id'),
-        Index('idx_posthashtags_hashtag_id', 'hashtag_id'),
+        # Tag timeline: hashtag_id = ? ORDER BY created_at DESC, post_id DESC (index-only for public posts)
+        Index(
+            'idx_posthashtags_hashtag_created_at', 'hashtag_id', created_at.desc(), post_id.desc(),
+            postgresql_include=['visibility']
+        ),
     )
 
+    @classmethod
+    def sync_post(cls, session: Session, post_id: int) -> None:
+        """
+        Copies a post's created_at and visibility onto its hashtag rows with one UPDATE ... FROM posts.
+        The post and its hashtags must be flushed first.
+        """
+        from .post_model import Post
+
+        stmt = (
+            update(cls)
+            .where(cls.post_id == Post.id, Post.id == post_id)
+            .values(created_at=Post.created_at, visibility=Post.visibility)
+            .execution_options(synchronize_session=False) # The copied columns are never read through the ORM
+        )
+        session.execute(stmt)
+
 # --- Main Hashtag Model ---
 
 class Hashtag(Base):
@@ -46,6 +80,50 @@ class Hashtag(Base):
         return f'<Hashtag id={self.id} tag_name="{self.tag_name}">'
 
     # --- Class Methods ---
+
+    @staticmethod
+    def normalize_tag_names(tag_names: list[str]) -> list[str]:
+        """
+        Cleans tag names and removes duplicates, keeping the first-seen order.
+        Raises ValueError for empty or over-long names.
+        """
+        clean_tags = []
+        for tag_name in tag_names:
+            clean_tag = tag_name.strip().lower()
+            if not clean_tag:
+                raise ValueError("Tag name cannot be empty.")
+            if len(clean_tag) > 100:
+                raise ValueError("Tag name cannot be longer than 100 characters.")
+            if clean_tag not in clean_tags:
+                clean_tags.append(clean_tag)
+        return clean_tags
+
+    @classmethod
+    def upsert_many(cls, session: Session, tag_names: list[str]) -> list['Hashtag']:
+        """
+        Resolves many hashtags at once, creating the missing ones, in two statements:
+        one INSERT ... ON CONFLICT (tag_name) DO NOTHING and one SELECT ... WHERE tag_name = ANY(...).
+        Concurrent posts creating the same tag cannot fail on the unique index.
+        Returns the hashtags in the order of the normalized names; hashtags inserted by this
+        call are flagged with was_created = True, as they only exist if the transaction commits.
+        """
+        clean_tags = cls.normalize_tag_names(tag_names)
+        if not clean_tags:
+            return []
+
+        insert_stmt = (
+            pg_insert(cls)
+            .values([{"tag_name": clean_tag} for clean_tag in clean_tags])
+            .on_conflict_do_nothing(index_elements=["tag_name"])
+            .returning(cls.tag_name)
+        )
+        created_tags = set(session.execute(insert_stmt).scalars().all())
+
+        select_stmt = select(cls).where(cls.tag_name == any_(bindparam("tag_names", clean_tags, type_=ARRAY(String))))
+        hashtags_by_name = {hashtag.tag_name: hashtag for hashtag in session.execute(select_stmt).scalars().all()}
+        for tag_name, hashtag in hashtags_by_name.items():
+            hashtag.was_created = tag_name in created_tags
+        return [hashtags_by_name[clean_tag] for clean_tag in clean_tags]
     
     @classmethod
     def find_or_create(cls, session: Session, tag_name: str) -> 'Hashtag':
@@ -0,0 +1,93 @@
+import random
+from sqlalchemy import Column, ForeignKey, Integer, SmallInteger, PrimaryKeyConstraint, select, delete, update, literal
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func, tuple_
+from app.models.base import Base
+from app.models.post_model import Post
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sqlalchemy import ColumnElement
+    from sqlalchemy.dialects.postgresql import Insert
+
+class LikeCountDelta(Base):
+    """
+    Like count changes not yet applied to posts.like_count (write-behind counter).
+    Likes add to one of several shard rows per post instead of updating the post row, so concurrent
+    likes of a popular post do not queue on one row lock. The counter flusher moves the deltas into
+    posts.like_count in batches; until then readers add them to the persisted count.
+    """
+    __tablename__ = 'like_count_deltas'
+
+    post_id = Column(Integer, ForeignKey('posts.id', ondelete='CASCADE'), nullable=False)
+    shard = Column(SmallInteger, nullable=False)
+    delta = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        PrimaryKeyConstraint('post_id', 'shard'),
+    )
+
+    def __repr__(self):
+        return f'<LikeCountDelta post_id={self.post_id} shard={self.shard} delta={self.delta}>'
+
+    # --- Class Methods ---
+    @classmethod
+    def add_statement(cls, post_ids: 'ColumnElement[int]', delta: int, shard_count: int) -> 'Insert':
+        """
+        Builds an atomic INSERT ... ON CONFLICT DO UPDATE adding delta to a random shard of each post
+        id selected by post_ids (e.g. a column of a CTE), to run as part of a larger statement.
+        """
+        stmt = pg_insert(cls).from_select(
+            ["post_id", "shard", "delta"],
+            select(post_ids, literal(random.randrange(shard_count)), literal(delta))
+        )
+        return stmt.on_conflict_do_update(
+            index_elements=[cls.post_id, cls.shard],
+            set_={"delta": cls.delta + stmt.excluded.delta}
+        )
+
+    @classmethod
+    def get_pending(cls, session: Session, post_ids: list[int]) -> dict[int, int]:
+        """Returns the unflushed like count change of each post that has one."""
+        if not post_ids:
+            return {}
+        query = (
+            select(cls.post_id, func.sum(cls.delta))
+            .where(cls.post_id.in_(post_ids))
+            .group_by(cls.post_id)
+        )
+        return {post_id: int(delta) for post_id, delta in session.execute(query).all()}
+
+    @classmethod
+    def flush_batch(cls, session: Session, limit: int) -> int:
+        """
+        Moves up to limit shard rows into posts.like_count with one statement: the rows are locked
+        (skipping rows held by in-flight likes), deleted, summed per post and applied in one
+        batched UPDATE. Returns the number of shard rows moved.
+        """
+        claimed_rows = (
+            select(cls.post_id, cls.shard)
+            .order_by(cls.post_id, cls.shard)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        claimed = (
+            delete(cls)
+            .where(tuple_(cls.post_id, cls.shard).in_(claimed_rows))
+            .returning(cls.post_id, cls.delta)
+            .cte("claimed")
+        )
+        totals = (
+            select(claimed.c.post_id, func.sum(claimed.c.delta).label("delta"), func.count().label("shard_rows"))
+            .group_by(claimed.c.post_id)
+            .cte("totals")
+        )
+        stmt = (
+            update(Post)
+            .where(Post.id == totals.c.post_id)
+            .values(like_count=func.greatest(Post.like_count + totals.c.delta, 0))
+            .returning(totals.c.shard_rows)
+            .execution_options(synchronize_session=False)
+        )
+        return sum(session.execute(stmt).scalars().all())
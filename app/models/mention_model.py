@@ -1,4 +1,6 @@
-from sqlalchemy import Table, Column, Integer, ForeignKey, Index
+from sqlalchemy import Table, Column, Integer, ForeignKey, Index, select, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
 from .base import Base
 
 class PostMentions(Base):
@@ -10,3 +12,22 @@ class PostMentions(Base):
         Index('idx_post_mentions_post_id', 'post_id'),
         Index('idx_post_mentions_user_id', 'user_id'),
     )
+
+    @classmethod
+    def get_user_ids(cls, session: Session, post_id: int) -> set[int]:
+        """Returns the ids of the users mentioned in a post."""
+        return set(session.execute(select(cls.user_id).where(cls.post_id == post_id)).scalars().all())
+
+    @classmethod
+    def replace_for_post(cls, session: Session, post_id: int, user_ids: list[int]) -> None:
+        """
+        Sets the users mentioned in a post by id, without loading User rows.
+        Removed mentions are deleted with one statement and new ones inserted with another.
+        """
+        session.execute(delete(cls).where(cls.post_id == post_id, cls.user_id.not_in(user_ids)))
+        if user_ids:
+            session.execute(
+                pg_insert(cls)
+                .values([{"post_id": post_id, "user_id": user_id} for user_id in user_ids])
+                .on_conflict_do_nothing(index_elements=["post_id", "user_id"])
+            )
@@ -1,6 +1,7 @@
+from datetime import datetime, timezone
 from uuid import uuid4, UUID
-from sqlalchemy import Column, ForeignKey, TIMESTAMP, Index, select, update, func, String, Boolean, Integer
-from sqlalchemy.dialects.postgresql import UUID as SqlUUID
+from sqlalchemy import Column, ForeignKey, TIMESTAMP, Index, select, insert, update, delete, func, String, Boolean, Integer, case
+from sqlalchemy.dialects.postgresql import UUID as SqlUUID, ARRAY, insert as pg_insert
 from sqlalchemy.orm import relationship, Session, Mapped
 
 from app.models.base import Base
@@ -37,9 +38,24 @@ class Notification(Base):
     is_read = Column(Boolean, nullable=False, server_default='f')
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
+    # --- Aggregation (e.g. "A, B and 40 others liked your post") ---
+    # A rollup row stands for every actor of the same action on the same target within one window.
+    # actor_user_id is the latest actor; recent_actor_ids holds the latest few, newest first.
+    actor_count = Column(Integer, nullable=False, server_default='1', default=1)
+    recent_actor_ids = Column(ARRAY(Integer), nullable=True)
+    aggregation_window_start = Column(TIMESTAMP(timezone=True), nullable=True) # Null for notifications that are never aggregated
+
     # --- Table Arguments for Indexes ---
     __table_args__ = (
-        Index('idx_notifications_recipient_is_read', 'recipient_user_id', 'is_read', created_at.desc()),
+        # Notification list: recipient_user_id = ? ORDER BY created_at DESC, id DESC
+        Index('idx_notifications_recipient_created_at', 'recipient_user_id', created_at.desc(), id.desc()),
+        # Unread badge and mark-all-as-read only touch the (small) unread subset
+        Index('idx_notifications_recipient_unread', 'recipient_user_id', postgresql_where=is_read == False),
+        # One rollup per (recipient, action, target, window); the conflict target of aggregate()
+        Index(
+            'uq_notifications_aggregation', 'recipient_user_id', 'action_type', 'target_type', 'target_id', 'aggregation_window_start',
+            unique=True, postgresql_where=aggregation_window_start.isnot(None)
+        ),
     )
 
     # --- Relationships ---
@@ -49,6 +65,12 @@ class Notification(Base):
     def __repr__(self):
             return f'<Notification id={self.id} recipient={self.recipient_user_id} action={self.action_type}>'
 
+    @staticmethod
+    def window_start(occurred_at: datetime, window_seconds: int) -> datetime:
+        """Returns the start of the aggregation window an action at occurred_at belongs to."""
+        timestamp = occurred_at.timestamp()
+        return datetime.fromtimestamp(timestamp - timestamp % window_seconds, tz=timezone.utc)
+
     # --- Class Methods ---
     @classmethod
     def create( cls, session: Session, recipient_user_id: int, *, actor_user_id: int | None = None,
@@ -75,6 +97,113 @@ class Notification(Base):
         session.add(new_notification)
         return new_notification
 
+    @classmethod
+    def create_many(cls, session: Session, recipient_user_ids: list[int], *, actor_user_id: int | None = None,
+        action_type: str, target_type: str | None = None, target_id: int | None = None
+    ) -> list['Notification']:
+        """
+        Creates the same notification for many recipients with one multi-row INSERT ... RETURNING.
+        Duplicate recipients and the actor themselves are skipped, as in create.
+        Returns the created notifications with their ids and created_at populated.
+        """
+        rows = [
+            {
+                "public_id": uuid4(),
+                "recipient_user_id": recipient_user_id,
+                "actor_user_id": actor_user_id,
+                "action_type": action_type,
+                "target_type": target_type,
+                "target_id": target_id,
+            }
+            for recipient_user_id in dict.fromkeys(recipient_user_ids)
+            if recipient_user_id != actor_user_id
+        ]
+        if not rows:
+            return []
+        return session.execute(insert(cls).values(rows).returning(cls)).scalars().all()
+
+    @classmethod
+    def aggregate(cls, session: Session, recipient_user_id: int, *, actor_user_id: int, action_type: str,
+        target_type: str, target_id: int, window_seconds: int, recent_limit: int, occurred_at: datetime | None = None
+    ) -> 'Notification | None':
+        """
+        Records an action in the rollup of (recipient, action, target) for the window of occurred_at
+        (default now) with one atomic INSERT ... ON CONFLICT DO UPDATE: the first action creates the
+        row, later ones raise actor_count, put the actor first in recent_actor_ids and mark the rollup
+        unread and new again. An actor already among the recent actors is not counted twice; an
+        action that is undone must be taken back with remove_actor.
+        Returns the rollup, or None for a self-notification.
+        """
+        if recipient_user_id == actor_user_id:
+            return None
+
+        window_start = cls.window_start(occurred_at or datetime.now(timezone.utc), window_seconds)
+        stmt = pg_insert(cls).values(
+            public_id=uuid4(),
+            recipient_user_id=recipient_user_id,
+            actor_user_id=actor_user_id,
+            action_type=action_type,
+            target_type=target_type,
+            target_id=target_id,
+            actor_count=1,
+            recent_actor_ids=[actor_user_id],
+            aggregation_window_start=window_start
+        )
+        already_recent = cls.recent_actor_ids.any(actor_user_id)
+        recent_actor_ids = func.array_prepend(actor_user_id, func.array_remove(cls.recent_actor_ids, actor_user_id), type_=ARRAY(Integer))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[cls.recipient_user_id, cls.action_type, cls.target_type, cls.target_id, cls.aggregation_window_start],
+            index_where=cls.aggregation_window_start.isnot(None),
+            set_={
+                "actor_user_id": actor_user_id,
+                "actor_count": case((already_recent, cls.actor_count), else_=cls.actor_count + 1),
+                "recent_actor_ids": recent_actor_ids[1:recent_limit],
+                "is_read": False,
+                "created_at": func.now(),
+            }
+        )
+        stmt = stmt.returning(cls).execution_options(populate_existing=True)
+        return session.execute(stmt).scalars().one()
+
+    @classmethod
+    def remove_actor(cls, session: Session, recipient_user_id: int, *, actor_user_id: int, action_type: str,
+        target_type: str, target_id: int, window_seconds: int, occurred_at: datetime
+    ) -> 'Notification | None':
+        """
+        Takes back an action that was recorded with aggregate at occurred_at (e.g. on unlike), so
+        that repeating it counts the actor once: lowers actor_count, drops the actor from
+        recent_actor_ids and, if they were the latest actor, promotes the next recent one.
+        A rollup left without actors is deleted.
+        Returns the updated rollup, or None if there was none or it was deleted.
+        """
+        if recipient_user_id == actor_user_id:
+            return None
+
+        remaining_actor_ids = func.array_remove(cls.recent_actor_ids, actor_user_id, type_=ARRAY(Integer))
+        stmt = (
+            update(cls)
+            .where(
+                cls.recipient_user_id == recipient_user_id,
+                cls.action_type == action_type,
+                cls.target_type == target_type,
+                cls.target_id == target_id,
+                cls.aggregation_window_start == cls.window_start(occurred_at, window_seconds)
+            )
+            .values(
+                actor_count=cls.actor_count - 1,
+                recent_actor_ids=remaining_actor_ids,
+                actor_user_id=case((cls.actor_user_id == actor_user_id, remaining_actor_ids[1]), else_=cls.actor_user_id)
+            )
+            .returning(cls)
+            .execution_options(populate_existing=True)
+        )
+        notification = session.execute(stmt).scalars().one_or_none()
+        if notification is not None and notification.actor_count <= 0:
+            session.execute(delete(cls).where(cls.id == notification.id))
+            session.expunge(notification)
+            return None
+        return notification
+
     # --- Finder Methods ---
 
     @classmethod
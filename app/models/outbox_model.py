@@ -0,0 +1,53 @@
+from sqlalchemy import Column, TIMESTAMP, BigInteger, Integer, String, Text, select, delete
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from app.models.base import Base
+
+class OutboxEvent(Base):
+    """
+    A side effect (e.g. a socket emit) recorded in the same transaction as the change that caused it.
+    Rows only become visible to the outbox worker once that transaction commits, so a rolled back
+    request never produces the side effect. The worker deletes a row once its side effect is done.
+    """
+    __tablename__ = 'outbox'
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True) # Also the delivery order
+    event_type = Column(String(50), nullable=False) # e.g. 'socket_emit'
+    payload = Column(JSONB, nullable=False)
+    attempts = Column(Integer, nullable=False, server_default='0', default=0)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f'<OutboxEvent id={self.id} type={self.event_type} attempts={self.attempts}>'
+
+    # --- Class Methods ---
+    @classmethod
+    def add(cls, session: Session, event_type: str, payload: dict) -> 'OutboxEvent':
+        """Records a side effect in the caller's transaction."""
+        event = cls(event_type=event_type, payload=payload)
+        session.add(event)
+        return event
+
+    @classmethod
+    def add_many(cls, session: Session, event_type: str, payloads: list[dict]) -> list['OutboxEvent']:
+        """Records many side effects at once; they are flushed as one multi-row INSERT."""
+        events = [cls(event_type=event_type, payload=payload) for payload in payloads]
+        session.add_all(events)
+        return events
+
+    @classmethod
+    def claim_batch(cls, session: Session, limit: int) -> list['OutboxEvent']:
+        """
+        Locks the oldest pending events for this transaction. Rows locked by another worker are
+        skipped instead of waited on (FOR UPDATE SKIP LOCKED), so several workers can run at once.
+        """
+        query = select(cls).order_by(cls.id).limit(limit).with_for_update(skip_locked=True)
+        return session.execute(query).scalars().all()
+
+    @classmethod
+    def delete_many(cls, session: Session, event_ids: list[int]) -> None:
+        """Removes events whose side effect was carried out."""
+        if event_ids:
+            session.execute(delete(cls).where(cls.id.in_(event_ids)).execution_options(synchronize_session=False))
@@ -1,4 +1,6 @@
-from sqlalchemy import Column, ForeignKey, TIMESTAMP, Index, PrimaryKeyConstraint, select, delete, exists, Integer, UUID as SqlUUID
+from uuid import UUID
+from sqlalchemy import Column, ForeignKey, TIMESTAMP, Index, PrimaryKeyConstraint, select, delete, exists, Integer, UUID as SqlUUID, Row, true
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import relationship, Session, Mapped
 from sqlalchemy.sql import func
 from app.models.base import Base
@@ -23,7 +25,8 @@ class PostLike(Base):
     # --- Table Arguments ---
     __table_args__ = (
         PrimaryKeyConstraint('user_id', 'post_id'),
-        Index('idx_post_likes_post_id', 'post_id'),
+        # Likers list: post_id = ? ORDER BY created_at DESC, user_id DESC (also serves the post_id foreign key)
+        Index('idx_post_likes_post_created_at', 'post_id', created_at.desc(), user_id.desc()),
     )
 
     # --- Relationships ---
@@ -69,4 +72,66 @@ class PostLike(Base):
         )
         return session.execute(select(exists(query))).scalar()
 
+    @classmethod
+    def add_by_public_id(cls, session: Session, user_id: int, post_public_id: UUID, shard_count: int) -> 'Row | None':
+        """
+        Likes a post in one statement: resolves the post's public id, inserts the like with
+        ON CONFLICT DO NOTHING and, only if a row was inserted, adds +1 to the post's like count delta.
+        A repeated or concurrent like of the same post changes nothing.
+
+        Returns None if the post does not exist. Otherwise a row with the post's id, user_id,
+        public_id and content, the liking user's username, display_name and profile_picture_url
+        (None if that user does not exist), 'changed' and the new like's 'liked_at'.
+        """
+        from .post_model import Post
+        from .user_model import User
+        from .like_count_delta_model import LikeCountDelta
+
+        target = select(Post.id, Post.user_id, Post.public_id, Post.content).where(Post.public_id == post_public_id).cte("target")
+        actor = select(User.id, User.username, User.display_name, User.profile_picture_url).where(User.id == user_id).cte("actor")
+        inserted = (
+            pg_insert(cls)
+            .from_select(["user_id", "post_id"], select(actor.c.id, target.c.id))
+            .on_conflict_do_nothing(index_elements=[cls.user_id, cls.post_id])
+            .returning(cls.post_id, cls.created_at)
+            .cte("inserted")
+        )
+        counted = LikeCountDelta.add_statement(inserted.c.post_id, 1, shard_count).returning(LikeCountDelta.post_id).cte("counted")
+
+        query = (
+            select(
+                target.c.id, target.c.user_id, target.c.public_id, target.c.content,
+                actor.c.username, actor.c.display_name, actor.c.profile_picture_url,
+                exists(select(counted.c.post_id)).label("changed"),
+                select(inserted.c.created_at).scalar_subquery().label("liked_at")
+            )
+            .select_from(target.outerjoin(actor, true()))
+        )
+        return session.execute(query).first()
 
+    @classmethod
+    def remove_by_public_id(cls, session: Session, user_id: int, post_public_id: UUID, shard_count: int) -> 'Row | None':
+        """
+        Unlikes a post in one statement: resolves the post's public id, deletes the like and, only
+        if a row was deleted, adds -1 to the post's like count delta.
+        Returns None if the post does not exist, otherwise a row with the post's id and user_id,
+        'changed' and the removed like's 'liked_at'.
+        """
+        from .post_model import Post
+        from .like_count_delta_model import LikeCountDelta
+
+        target = select(Post.id, Post.user_id).where(Post.public_id == post_public_id).cte("target")
+        deleted = (
+            delete(cls)
+            .where(cls.user_id == user_id, cls.post_id == select(target.c.id).scalar_subquery())
+            .returning(cls.post_id, cls.created_at)
+            .cte("deleted")
+        )
+        counted = LikeCountDelta.add_statement(deleted.c.post_id, -1, shard_count).returning(LikeCountDelta.post_id).cte("counted")
+
+        query = select(
+            target.c.id, target.c.user_id,
+            exists(select(counted.c.post_id)).label("changed"),
+            select(deleted.c.created_at).scalar_subquery().label("liked_at")
+        )
+        return session.execute(query).first()
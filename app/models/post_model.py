@@ -1,7 +1,8 @@
 from uuid import uuid4
-from sqlalchemy import Column, Integer, UUID as SqlUUID, ForeignKey, Text, String, Enum as SqlEnum, DateTime, CheckConstraint, Index, case
+from sqlalchemy import Column, Integer, UUID as SqlUUID, ForeignKey, Text, String, Enum as SqlEnum, DateTime, CheckConstraint, Index, Computed, case
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.sql import select, or_, and_, func, update, exists
-from sqlalchemy.orm import Session, relationship, Mapped
+from sqlalchemy.orm import Session, relationship, Mapped, joinedload, selectinload, deferred
 from geoalchemy2 import Geometry, WKTElement, Geography
 from geoalchemy2.functions import ST_DWithin, ST_MakePoint, ST_Distance
 
@@ -41,11 +42,14 @@ class Post(Base):
     reshare_count = Column(Integer, nullable=False, server_default="0", default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    # Full-text search document, generated by Postgres from content. Deferred: only search queries read it.
+    search_vector = deferred(Column(TSVECTOR, Computed("to_tsvector('english', coalesce(content, ''))", persisted=True)))
 
     #------ Define relationships -----
     user: Mapped['User'] = relationship("User", back_populates="posts")
     likes: Mapped[list['PostLike']] = relationship("PostLike", back_populates="post", cascade="all, delete-orphan")
-    hashtags: Mapped[list['Hashtag']] = relationship("Hashtag", secondary='post_hashtags', back_populates="posts", cascade="all, delete")
+    # Hashtags are shared by every post using them: deleting a post only removes its post_hashtags rows
+    hashtags: Mapped[list['Hashtag']] = relationship("Hashtag", secondary='post_hashtags', back_populates="posts", cascade="save-update, merge")
     mentioned_users: Mapped[list['User']] = relationship("User", secondary="post_mentions", back_populates="mentioned_in_posts")
     
     #------- Table arguments: constraints and indexes
@@ -53,12 +57,22 @@ class Post(Base):
         CheckConstraint("content IS NOT NULL OR media_url IS NOT NULL", name="ck_post_content_or_media_required"),
         
         #----- Indexes for performance optimization
-        Index("idx_posts_user_id", "user_id"), 
         Index("idx_posts_created_at_desc", created_at.desc()), 
+        # Profile list and timeline rebuilds: user_id = ? ORDER BY created_at DESC, id DESC (index-only)
+        Index("idx_posts_user_created_at", "user_id", created_at.desc(), id.desc(), postgresql_include=["visibility", "updated_at"]),
+        # Public feed and ring buffer rebuilds: visibility = PUBLIC ORDER BY created_at DESC, id DESC (index-only)
+        Index(
+            "idx_posts_public_created_at", created_at.desc(), id.desc(),
+            postgresql_include=["updated_at"], postgresql_where=visibility == PostVisibility.PUBLIC
+        ),
         Index("idx_posts_location_gist", "location", postgresql_using="gist", postgresql_where=location.isnot(None)), 
+        # Nearby posts: ST_DWithin and KNN (<->) in meters need the index on the geography cast
+        Index("idx_posts_location_geography", func.geography(location), postgresql_using="gist", postgresql_where=location.isnot(None)),
+        Index("idx_posts_search_vector", "search_vector", postgresql_using="gin"),
     )
 
     _stat_fields = ["like_count", "comment_count", "reshare_count"]
+    SEARCH_CONFIG = "english" # Text search configuration of search_vector; queries must use the same one
     
 
     #==============================
@@ -73,6 +87,30 @@ class Post(Base):
                 raise ValueError("Invalid longitude or latitude values.")
             return WKTElement(f"POINT({longitude} {latitude})", srid=4326)
         return None
+
+    @staticmethod
+    def _convert_visibility(visibility: 'PostVisibility | str') -> PostVisibility:
+        """Converts a visibility name or value sent by a client (e.g. 'PUBLIC' or 'public') to the enum."""
+        if isinstance(visibility, PostVisibility):
+            return visibility
+        if isinstance(visibility, str):
+            if visibility.upper() in PostVisibility.__members__:
+                return PostVisibility[visibility.upper()]
+            try:
+                return PostVisibility(visibility.lower())
+            except ValueError:
+                pass
+        raise ValueError("Invalid visibility value.")
+
+    @classmethod
+    def serialization_load_options(cls) -> tuple:
+        """
+        Loader options for everything serialize_post reads.
+        The author is a many-to-one, so joining it adds no rows. Hashtags are a collection:
+        joining them would repeat each post row once per tag, so they are fetched for the whole
+        batch with one extra 'WHERE post_id IN (...)' query instead.
+        """
+        return (joinedload(cls.user), selectinload(cls.hashtags))
     
     #=====================
     # 2. Query Methods
@@ -93,7 +131,7 @@ class Post(Base):
             user_id=user_id, 
             content=content, 
             media_url=media_url, 
-            visibility=kwargs.get("visibility", PostVisibility.PUBLIC), 
+            visibility=cls._convert_visibility(kwargs.get("visibility", PostVisibility.PUBLIC)), 
             location=cls._convert_coordinates_to_wkt(kwargs.get("location_coords")),
             post_type=kwargs.get("post_type", PostType.REGULAR),
             hashtags=kwargs.get("hashtags", []),
@@ -121,6 +159,8 @@ class Post(Base):
                 raise ValueError(f"Field '{key}' is not allowed for updates.") 
             if key == "location_coords":
                 setattr(post, "location", cls._convert_coordinates_to_wkt(value))
+            elif key == "visibility":
+                setattr(post, "visibility", cls._convert_visibility(value))
             else:
                 setattr(post, key, value)
         return post
@@ -141,6 +181,22 @@ class Post(Base):
     #==============================
     # Getter Class Methods with Visibility
     #==============================
+    @classmethod
+    def get_visible_visibilities(cls, session: Session, target_user_id: int, requesting_user_id: int | None = None) -> list[PostVisibility]:
+        """Returns the visibilities of target_user_id's posts that the requesting user is allowed to see."""
+        from .follower_model import Follower
+
+        if requesting_user_id is None:
+            return [PostVisibility.PUBLIC]
+        if requesting_user_id == target_user_id:
+            return [PostVisibility.PUBLIC, PostVisibility.FOLLOWERS_ONLY, PostVisibility.PRIVATE]
+        is_follower = session.execute(select(exists().where(
+            and_(Follower.follower_id == requesting_user_id, Follower.followed_id == target_user_id)
+        ))).scalar()
+        if is_follower:
+            return [PostVisibility.PUBLIC, PostVisibility.FOLLOWERS_ONLY]
+        return [PostVisibility.PUBLIC]
+
     @classmethod
     def get_post_by_id(cls, session: Session, post_id: int, requesting_user_id: int | None = None ) -> 'Post | None':
         """Retrieves a specific post from the database using its internal integer id. """
@@ -4,7 +4,7 @@ from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError, VerificationError
 from sqlalchemy import Column, Integer, UUID as SqlUUID, String, Enum as SqlEnum, Text, Date, Boolean, DateTime, Index
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.sql import func, select, exists, or_
+from sqlalchemy.sql import func, select, exists, or_, text
 from sqlalchemy.orm import Session, relationship, Mapped
 from app.models.base import Base
 from utils.model_utils import UserStatus, HasherConfig
@@ -89,6 +89,11 @@ class User(Base):
     __table_args__ = (
         Index('idx_users_username_lower', func.lower(username), unique=True),
         Index('idx_users_email_lower', func.lower(email), unique=True),
+        # User typeahead: LIKE 'q%' / '%q%' and similarity() on the lower-cased names (requires pg_trgm)
+        Index('idx_users_username_trgm', text('lower(username) gin_trgm_ops'), postgresql_using='gin'),
+        Index('idx_users_display_name_trgm', text('lower(display_name) gin_trgm_ops'), postgresql_using='gin'),
+        # Nearby people: ST_DWithin and KNN (<->) in meters on the geography cast, for users who shared a location
+        Index('idx_users_location_geography', func.geography(location), postgresql_using='gist', postgresql_where=location.isnot(None)),
     )
 
     @staticmethod
@@ -16,6 +16,9 @@ from .auth import (
 
 
 from .health_check.health_check import ReadinessProbe, LivenessProbe
+from .health_check.metrics import TimelineMetricsResource
+
+from .hashtags import TrendingHashtagsResource, HashtagPostsResource
 
 from .media import ProfilePictureResource
 
@@ -23,10 +26,12 @@ from .notitifications import NotificationListResource, MarkNotificationsAsReadRe
 
 from .posts import (
     UserPostListResource, PostListResource, CreatePostResource, DeletePostResource, UpdatePostResource, 
-    UserPostResource
+    UserPostResource, NearbyPostsResource, PostLikersResource
 )
 
 
+from .search import SearchPostsResource, SearchUsersResource
+
 from .social_interactions import (
     FollowResource, PostLikeResource, 
 )
@@ -34,7 +39,7 @@ from .social_interactions import (
 from .user_management import  (
     RegisterResource, RequestPasswordResetResource, ResetPasswordResource, OnboardingResource, UserProfileResource, 
     UserSettingsResource, VerifyEmailResource, ResendVerificationEmailResource, 
-    ResendVerificationForAuthenticatedUserResource, FollowerListResource, FollowingListResource
+    ResendVerificationForAuthenticatedUserResource, FollowerListResource, FollowingListResource, NearbyUsersResource
 )
 
 if TYPE_CHECKING:
@@ -61,6 +66,11 @@ def initialize_routes(app: 'Flask') -> None:
     # ----- Health Check Endpoints -----
     api.add_resource(LivenessProbe, '/live')
     api.add_resource(ReadinessProbe, '/ready')
+    api.add_resource(TimelineMetricsResource, '/metrics/timeline')
+
+    # ----- Hashtag Endpoints -----
+    api.add_resource(TrendingHashtagsResource, '/hashtags/trending')
+    api.add_resource(HashtagPostsResource, '/hashtags/<string:tag_name>/posts')
 
     # -----  Media Endpoints -----
     api.add_resource(ProfilePictureResource, '/settings/profile-picture')
@@ -69,9 +79,14 @@ def initialize_routes(app: 'Flask') -> None:
     api.add_resource(NotificationListResource, '/notifications')
     api.add_resource(MarkNotificationsAsReadResource, '/notifications/mark-as-read')
 
+    # ----- Search Endpoints -----
+    api.add_resource(SearchPostsResource, '/search/posts')
+    api.add_resource(SearchUsersResource, '/search/users')
+
     # ----- Social Interaction Endpoints -----
     api.add_resource(FollowResource, '/users/<string:username>/follow')
     api.add_resource(PostLikeResource, '/posts/<uuid:public_id>/like')
+    api.add_resource(PostLikersResource, '/posts/<uuid:public_id>/likes')
 
     # ----- Posts Endpoints -----
     api.add_resource(CreatePostResource, '/create-post')
@@ -80,6 +95,7 @@ def initialize_routes(app: 'Flask') -> None:
     api.add_resource(UpdatePostResource, '/posts/<uuid:public_id>')
     api.add_resource(UserPostResource, '/posts/<uuid:public_id>')
     api.add_resource(UserPostListResource, '/users/<string:username>/posts')
+    api.add_resource(NearbyPostsResource, '/posts/nearby')
 
     # ----- User Management Endpoints -----
     api.add_resource(FollowerListResource, '/profile/<string:username>/followers')
@@ -90,5 +106,6 @@ def initialize_routes(app: 'Flask') -> None:
     api.add_resource(ResendVerificationEmailResource, '/resend-verification')
     api.add_resource(ResetPasswordResource, '/reset-password/<string:token>')
     api.add_resource(UserProfileResource, '/users/<string:username>')
+    api.add_resource(NearbyUsersResource, '/users/nearby')
     api.add_resource(UserSettingsResource, '/settings')
     api.add_resource(VerifyEmailResource, '/verify-email')
\ No newline at end of file
@@ -0,0 +1,7 @@
+from .trending_hashtags_resource import TrendingHashtagsResource
+from .hashtag_posts_resource import HashtagPostsResource
+
+__all__ = [
+    "HashtagPostsResource",
+    "TrendingHashtagsResource"
+]
@@ -0,0 +1,42 @@
+from flask import current_app
+from flask_restful import Resource, reqparse
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from app.extensions import db
+from app.services import get_hashtag_posts_service
+
+
+class HashtagPostsResource(Resource):
+    """
+    API Resource for browsing the posts of a hashtag.
+    """
+    @jwt_required(optional=True)
+    def get(self, tag_name: str):
+        """
+        Processes a GET request for the posts with a hashtag, newest first.
+        Pages are requested with the 'nextCursor' of the previous page.
+        """
+        parser = reqparse.RequestParser()
+        parser.add_argument('per_page', type=int, default=20, location='args')
+        parser.add_argument('cursor', type=str, default=None, location='args')
+        args = parser.parse_args()
+
+        try:
+            requesting_user_id = get_jwt_identity()
+            if requesting_user_id:
+                requesting_user_id = int(requesting_user_id)
+
+            hashtag_posts = get_hashtag_posts_service(
+                session=db.session,
+                tag_name=tag_name,
+                requesting_user_id=requesting_user_id,
+                per_page=args['per_page'],
+                cursor=args['cursor']
+            )
+            return hashtag_posts, 200
+
+        except ValueError as e: # Catches a malformed pagination cursor
+            return {'message': str(e)}, 400
+        except Exception as e:
+            current_app.logger.error(f"Error fetching posts for hashtag {tag_name}: {e}", exc_info=True)
+            return {'message': 'An error occurred while fetching hashtag posts.'}, 500
@@ -0,0 +1,34 @@
+from flask import current_app
+from flask_restful import Resource, reqparse
+from flask_jwt_extended import jwt_required
+
+from app.services import get_trending_hashtags_service
+
+
+class TrendingHashtagsResource(Resource):
+    """
+    API Resource for the currently trending hashtags.
+    """
+    @jwt_required()
+    def get(self):
+        """
+        Processes a GET request for the top hashtags of a time window, ranked by decayed
+        velocity (recent uses per hour). Served from Redis only.
+        - window=1h (default) | 24h | 7d
+        """
+        parser = reqparse.RequestParser()
+        parser.add_argument('window', type=str, default='1h', choices=('1h', '24h', '7d'), location='args')
+        parser.add_argument('limit', type=int, default=10, location='args')
+        args = parser.parse_args()
+
+        limit = min(max(args['limit'], 1), current_app.config['TRENDING_MAX_LIMIT'])
+
+        try:
+            trending = get_trending_hashtags_service(window=args['window'], limit=limit)
+            return trending, 200
+
+        except ValueError as e:
+            return {'message': str(e)}, 400
+        except Exception as e:
+            current_app.logger.error(f"Error fetching trending hashtags: {e}", exc_info=True)
+            return {'message': 'An error occurred while fetching trending hashtags.'}, 500
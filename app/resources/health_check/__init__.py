@@ -1,6 +1,8 @@
 from .health_check import ReadinessProbe, LivenessProbe
+from .metrics import TimelineMetricsResource
 
 __all__ = [
     'ReadinessProbe',
-    'LivenessProbe'
+    'LivenessProbe',
+    'TimelineMetricsResource'
 ]
\ No newline at end of file
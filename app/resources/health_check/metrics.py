@@ -0,0 +1,28 @@
+from flask import current_app
+from flask_restful import Resource
+from flask_jwt_extended import jwt_required
+from app.services.redis.timeline_operation import get_timeline_metrics
+
+#---------------------------------------------
+# Operational Metrics Endpoints
+#---------------------------------------------
+class TimelineMetricsResource(Resource):
+    @jwt_required()
+    def get(self):
+        """
+        Returns the push vs. pull volume of the home timeline (authenticated users only).
+        - push_posts / push_deliveries: posts fanned out on write and the timeline writes they caused.
+        - pull_posts: posts by high-follower authors that were not fanned out.
+        - pull_reads / pull_entries: feed reads that merged pull authors and the entries merged.
+        - pull_to_push_backfills: authors who fell back below the threshold and were backfilled.
+        """
+        metrics = get_timeline_metrics()
+        return {
+            'fanoutFollowerThreshold': current_app.config['TIMELINE_FANOUT_FOLLOWER_THRESHOLD'],
+            'pushPosts': metrics.get('push_posts', 0),
+            'pushDeliveries': metrics.get('push_deliveries', 0),
+            'pullPosts': metrics.get('pull_posts', 0),
+            'pullReads': metrics.get('pull_reads', 0),
+            'pullEntries': metrics.get('pull_entries', 0),
+            'pullToPushBackfills': metrics.get('pull_to_push_backfills', 0),
+        }, 200
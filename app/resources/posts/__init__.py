@@ -4,6 +4,8 @@ from .create_post_resource import CreatePostResource
 from .delete_post_resource import DeletePostResource
 from .update_post_resource import UpdatePostResource
 from .get_post_resource import UserPostResource
+from .nearby_posts_resource import NearbyPostsResource
+from .post_likers_resource import PostLikersResource
 
 
 __all__ = [
@@ -12,5 +14,7 @@ __all__ = [
     "PostListResource",
     "UserPostListResource",
     "UpdatePostResource", 
-    "UserPostResource"
+    "UserPostResource",
+    "NearbyPostsResource",
+    "PostLikersResource"
 ]
\ No newline at end of file
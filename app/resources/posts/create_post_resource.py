@@ -22,7 +22,7 @@ class CreatePostResource(Resource):
         """
         Processes a POST request to create a new post.
 
-        Expects a JSON payload with keys like "content", "media_url", "tags", etc.
+        Expects a JSON payload with keys like "content", "media_url", "tags", "location", etc.
 
         Returns:
             - 201 Created: The newly created post object.
@@ -45,6 +45,15 @@ class CreatePostResource(Resource):
             # 3. If valid, safely convert the string to the PostType enum.
             post_type = PostType[post_type_str]
 
+            # 4. An optional geo-tag, sent as {"lat": ..., "lng": ...}; the model expects (longitude, latitude).
+            location_coords = None
+            location = data.get('location')
+            if location is not None:
+                try:
+                    location_coords = (float(location['lng']), float(location['lat']))
+                except (TypeError, KeyError, ValueError):
+                    return {'message': "Invalid location: expected an object with numeric 'lat' and 'lng'."}, 400
+
             # Delegate all business logic to the service layer.
             new_post = create_post(
                 session=db.session,
@@ -52,7 +61,8 @@ class CreatePostResource(Resource):
                 content=data.get('content'),
                 media_url=data.get('media_url'),
                 tag_names=data.get('tags', []),  # Expects a list of strings
-                post_type=post_type
+                post_type=post_type,
+                location_coords=location_coords
             )
             
             db.session.commit()
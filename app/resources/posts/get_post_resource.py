@@ -6,7 +6,6 @@ from uuid import UUID
 from app.services import get_post_by_public_id_service
 from app.exceptions import PostNotFoundError, PermissionDeniedError
 from app.extensions import db
-from app.resources.posts._helper import serialize_post
 
 class UserPostResource(Resource):
     """
@@ -30,7 +29,8 @@ class UserPostResource(Resource):
                 requesting_user_id=user_id
             )
             
-            return serialize_post(post), 200
+            # The service returns the already serialized post from the post cache
+            return post, 200
 
         except PermissionDeniedError as e:
             return {'message': str(e)}, 403
@@ -0,0 +1,47 @@
+from flask import current_app
+from flask_restful import Resource, reqparse
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from app.extensions import db
+from app.services import get_nearby_posts_service
+
+
+class NearbyPostsResource(Resource):
+    """
+    API Resource for geo-tagged posts near a location.
+    """
+    @jwt_required(optional=True)
+    def get(self):
+        """
+        Processes a GET request for posts within 'radius' meters of ('lat', 'lng'), nearest first.
+        Pages are requested with the 'nextCursor' of the previous page.
+        """
+        parser = reqparse.RequestParser()
+        parser.add_argument('lat', type=float, required=True, location='args', help="A latitude is required.")
+        parser.add_argument('lng', type=float, required=True, location='args', help="A longitude is required.")
+        parser.add_argument('radius', type=int, default=1000, location='args')
+        parser.add_argument('per_page', type=int, default=20, location='args')
+        parser.add_argument('cursor', type=str, default=None, location='args')
+        args = parser.parse_args()
+
+        try:
+            requesting_user_id = get_jwt_identity()
+            if requesting_user_id:
+                requesting_user_id = int(requesting_user_id)
+
+            nearby_posts = get_nearby_posts_service(
+                session=db.session,
+                latitude=args['lat'],
+                longitude=args['lng'],
+                radius=args['radius'],
+                requesting_user_id=requesting_user_id,
+                per_page=args['per_page'],
+                cursor=args['cursor']
+            )
+            return nearby_posts, 200
+
+        except ValueError as e: # Catches invalid coordinates, an invalid radius or a malformed pagination cursor
+            return {'message': str(e)}, 400
+        except Exception as e:
+            current_app.logger.error(f"Error fetching nearby posts: {e}", exc_info=True)
+            return {'message': 'An error occurred while fetching nearby posts.'}, 500
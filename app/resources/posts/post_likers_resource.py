@@ -0,0 +1,48 @@
+from flask import current_app
+from flask_restful import Resource, reqparse
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from uuid import UUID
+
+from app.extensions import db
+from app.exceptions import PostNotFoundError, PermissionDeniedError
+from app.services import get_post_likers_service
+
+
+class PostLikersResource(Resource):
+    """
+    API Resource for the list of users who liked a post.
+    """
+    @jwt_required(optional=True)
+    def get(self, public_id: UUID):
+        """
+        Processes a GET request for the users who liked a post, newest likes first.
+        Pages are requested with the 'nextCursor' of the previous page.
+        """
+        parser = reqparse.RequestParser()
+        parser.add_argument('per_page', type=int, default=20, location='args')
+        parser.add_argument('cursor', type=str, default=None, location='args')
+        args = parser.parse_args()
+
+        try:
+            requesting_user_id = get_jwt_identity()
+            if requesting_user_id:
+                requesting_user_id = int(requesting_user_id)
+
+            likers = get_post_likers_service(
+                session=db.session,
+                post_public_id=public_id,
+                requesting_user_id=requesting_user_id,
+                per_page=args['per_page'],
+                cursor=args['cursor']
+            )
+            return likers, 200
+
+        except PostNotFoundError as e:
+            return {'message': str(e)}, 404
+        except PermissionDeniedError as e:
+            return {'message': str(e)}, 403
+        except ValueError as e: # Catches a malformed pagination cursor
+            return {'message': str(e)}, 400
+        except Exception as e:
+            current_app.logger.error(f"Error fetching likers of post {public_id}: {e}", exc_info=True)
+            return {'message': 'An error occurred while fetching likes.'}, 500
@@ -4,8 +4,7 @@ from flask_restful import Resource, reqparse
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from app.extensions import db
-from app.services import get_post_feed_service # <-- Import the new service
-from app.resources.posts._helper import serialize_post
+from app.services import get_post_feed_service, get_following_feed_service, get_ranked_feed_service, COUNT_MODES
 
 class PostListResource(Resource):
     """
@@ -15,28 +14,42 @@ class PostListResource(Resource):
     def get(self):
         """
         Processes a GET request to fetch the current user's personalized feed.
+        - mode=public (default): every public post, newest first.
+        - mode=following: the user's own posts plus posts from followed users, read from their home timeline.
+        - mode=ranked: recent followed and popular posts ordered by score (page numbers only).
         """
         parser = reqparse.RequestParser()
         parser.add_argument('page', type=int, default=1, location='args')
         parser.add_argument('per_page', type=int, default=20, location='args')
+        parser.add_argument('cursor', type=str, default=None, location='args')
+        parser.add_argument('count', type=str, default=None, choices=COUNT_MODES, location='args') # How totals are computed; 'none' skips them
+        parser.add_argument('mode', type=str, default='public', choices=('public', 'following', 'ranked'), location='args')
         args = parser.parse_args()
 
+        feed_services = {
+            'public': get_post_feed_service,
+            'following': get_following_feed_service,
+            'ranked': get_ranked_feed_service,
+        }
+
         try:
             user_id = int(get_jwt_identity())
 
             # --- The resource now makes a single, clean call to the service layer ---
-            feed_data = get_post_feed_service(
+            # Both feeds return already serialized posts (the public feed serves them from a shared cache).
+            feed_data = feed_services[args['mode']](
                 session=db.session,
                 user_id=user_id,
                 page=args['page'],
-                per_page=args['per_page']
+                per_page=args['per_page'],
+                cursor=args['cursor'],
+                count_mode=args['count']
             )
-            
-            # Serialize the posts from the data returned by the service
-            feed_data['posts'] = [serialize_post(post) for post in feed_data['posts']]
-            
+
             return feed_data, 200
 
+        except ValueError as e: # Catches a malformed or unsupported pagination cursor
+            return {'message': str(e)}, 400
         except Exception as e:
             current_app.logger.error(f"Error fetching user feed: {e}", exc_info=True)
             return {'message': 'An error occurred while fetching posts.'}, 500
\ No newline at end of file
@@ -2,9 +2,8 @@ from flask import request, current_app
 from flask_restful import Resource, reqparse
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.extensions import db
-from app.services import get_posts_for_user_profile
+from app.services import get_posts_for_user_profile, COUNT_MODES
 from app.exceptions import UserNotFoundError
-from app.resources.posts._helper import serialize_post
     
 
 class UserPostListResource(Resource):
@@ -16,6 +15,8 @@ class UserPostListResource(Resource):
         parser = reqparse.RequestParser()
         parser.add_argument('page', type=int, default=1, location='args')
         parser.add_argument('per_page', type=int, default=20, location='args')
+        parser.add_argument('cursor', type=str, default=None, location='args')
+        parser.add_argument('count', type=str, default=None, choices=COUNT_MODES, location='args') # How totals are computed; 'none' skips them
         args = parser.parse_args()
 
         try:
@@ -28,15 +29,18 @@ class UserPostListResource(Resource):
                 username=username,
                 requesting_user_id=requesting_user_id,
                 page=args['page'],
-                per_page=args['per_page']
+                per_page=args['per_page'],
+                cursor=args['cursor'],
+                count_mode=args['count']
             )
 
-            serialized_posts = [serialize_post(post) for post in paginated_data['posts']]
-            paginated_data['posts'] = serialized_posts
+            # The service returns already serialized posts from the post cache
             return paginated_data, 200
 
         except UserNotFoundError:
             return {'message': 'User not found'}, 404
+        except ValueError as e: # Catches a malformed pagination cursor
+            return {'message': str(e)}, 400
         except Exception as e:
             current_app.logger.error(f"Error fetching posts for {username}: {e}", exc_info=True)
             return {'message': 'An error occurred while fetching user posts.'}, 500
\ No newline at end of file
@@ -0,0 +1,7 @@
+from .search_posts_resource import SearchPostsResource
+from .search_users_resource import SearchUsersResource
+
+__all__ = [
+    "SearchPostsResource",
+    "SearchUsersResource"
+]
@@ -0,0 +1,44 @@
+from flask import current_app
+from flask_restful import Resource, reqparse
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from app.extensions import db
+from app.services import search_posts_service
+
+
+class SearchPostsResource(Resource):
+    """
+    API Resource for searching posts.
+    """
+    @jwt_required(optional=True)
+    def get(self):
+        """
+        Processes a GET request to search posts.
+        - q: free text (ranked by relevance, with highlighted snippets) and/or '#tag' terms.
+        Pages are requested with the 'nextCursor' of the previous page.
+        """
+        parser = reqparse.RequestParser()
+        parser.add_argument('q', type=str, required=True, location='args', help="A search query is required.")
+        parser.add_argument('per_page', type=int, default=20, location='args')
+        parser.add_argument('cursor', type=str, default=None, location='args')
+        args = parser.parse_args()
+
+        try:
+            requesting_user_id = get_jwt_identity()
+            if requesting_user_id:
+                requesting_user_id = int(requesting_user_id)
+
+            search_results = search_posts_service(
+                session=db.session,
+                query_text=args['q'],
+                requesting_user_id=requesting_user_id,
+                per_page=args['per_page'],
+                cursor=args['cursor']
+            )
+            return search_results, 200
+
+        except ValueError as e: # Catches an empty query or a malformed pagination cursor
+            return {'message': str(e)}, 400
+        except Exception as e:
+            current_app.logger.error(f"Error searching posts: {e}", exc_info=True)
+            return {'message': 'An error occurred while searching posts.'}, 500
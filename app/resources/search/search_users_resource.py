@@ -0,0 +1,43 @@
+from flask import current_app
+from flask_restful import Resource, reqparse
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from app.extensions import db
+from app.services import search_users_service
+
+
+class SearchUsersResource(Resource):
+    """
+    API Resource for the user typeahead.
+    """
+    @jwt_required(optional=True)
+    def get(self):
+        """
+        Processes a GET request to find users by a username or display name prefix.
+        Accounts the requester follows are listed first.
+        """
+        parser = reqparse.RequestParser()
+        parser.add_argument('q', type=str, required=True, location='args', help="A search query is required.")
+        parser.add_argument('limit', type=int, default=10, location='args')
+        args = parser.parse_args()
+
+        limit = min(max(args['limit'], 1), current_app.config['USER_SEARCH_MAX_LIMIT'])
+
+        try:
+            requesting_user_id = get_jwt_identity()
+            if requesting_user_id:
+                requesting_user_id = int(requesting_user_id)
+
+            search_results = search_users_service(
+                session=db.session,
+                query_text=args['q'],
+                requesting_user_id=requesting_user_id,
+                limit=limit
+            )
+            return search_results, 200
+
+        except ValueError as e: # Catches an empty query
+            return {'message': str(e)}, 400
+        except Exception as e:
+            current_app.logger.error(f"Error searching users: {e}", exc_info=True)
+            return {'message': 'An error occurred while searching users.'}, 500
@@ -4,7 +4,7 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 from uuid import UUID
 
 from app.services import like_post_service, unlike_post_service
-from app.exceptions import PostNotFoundError
+from app.exceptions import PostNotFoundError, UserNotFoundError
 from app.extensions import db
 
 
@@ -20,21 +20,21 @@ class PostLikeResource(Resource):
             user_id = int(get_jwt_identity())
 
             # --- 2. CALL THE SERVICE FUNCTION TO LIKE THE POST ---
-            like_post_service(
+            # Liking is idempotent, so a double click is not an error
+            was_liked = like_post_service(
                 session=db.session,
                 user_id=user_id,
                 post_public_id=public_id
             )
             
             db.session.commit()
+            if not was_liked:
+                return {'message': 'Post already liked.'}, 200
             return {'message': 'Post liked successfully.'}, 201
 
-        except PostNotFoundError as e:
+        except (PostNotFoundError, UserNotFoundError) as e:
             db.session.rollback()
             return {'message': str(e)}, 404
-        except ValueError as e: # Catches if the post is already liked
-            db.session.rollback()
-            return {'message': str(e)}, 400
         except Exception as e:
             db.session.rollback()
             current_app.logger.error(f"Error liking post {public_id}: {e}", exc_info=True)
@@ -48,22 +48,21 @@ class PostLikeResource(Resource):
             user_id = int(get_jwt_identity())
 
             # --- 2. CALL THE SERVICE FUNCTION TO UNLIKE THE POST ---
-            unlike_post_service(
+            was_unliked = unlike_post_service(
                 session=db.session,
                 user_id=user_id,
                 post_public_id=public_id
             )
             
             db.session.commit()
+            if not was_unliked:
+                return {'message': 'Post was not liked.'}, 200
             # A 204 response is standard for a successful DELETE and has no body.
             return '', 204
 
         except PostNotFoundError as e:
             db.session.rollback()
             return {'message': str(e)}, 404
-        except ValueError as e: # Catches if the user hasn't liked the post
-            db.session.rollback()
-            return {'message': str(e)}, 400
         except Exception as e:
             db.session.rollback()
             current_app.logger.error(f"Error unliking post {public_id}: {e}", exc_info=True)
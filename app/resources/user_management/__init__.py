@@ -7,6 +7,7 @@ from .user_onboarding_resource import OnboardingResource
 from .user_profile_resource import UserProfileResource
 from .user_settings_resource import UserSettingsResource
 from .verify_email_resource import VerifyEmailResource
+from .nearby_users_resource import NearbyUsersResource
 
 
 
@@ -20,4 +21,5 @@ __all__ = [
     "UserProfileResource",
     "UserSettingsResource",
     "VerifyEmailResource",
+    "NearbyUsersResource",
 ]
\ No newline at end of file
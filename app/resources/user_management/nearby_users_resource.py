@@ -0,0 +1,46 @@
+from flask import current_app
+from flask_restful import Resource, reqparse
+from flask_jwt_extended import jwt_required
+
+from app.extensions import db
+from app.models import User
+from app.services import get_nearby_users_service
+from utils.app_utils.decorators import require_active_user
+
+
+class NearbyUsersResource(Resource):
+    """
+    API Resource for discovering people nearby.
+    """
+    @jwt_required()
+    @require_active_user
+    def get(self, current_user: User):
+        """
+        Processes a GET request for users within 'radius' meters who the current user does not follow.
+        'lat' and 'lng' default to the current user's saved location. Distances are rounded to a coarse grid.
+        """
+        parser = reqparse.RequestParser()
+        parser.add_argument('lat', type=float, default=None, location='args')
+        parser.add_argument('lng', type=float, default=None, location='args')
+        parser.add_argument('radius', type=int, default=10000, location='args')
+        parser.add_argument('limit', type=int, default=20, location='args')
+        args = parser.parse_args()
+
+        limit = min(max(args['limit'], 1), current_app.config['NEARBY_USERS_MAX_LIMIT'])
+
+        try:
+            nearby_users = get_nearby_users_service(
+                session=db.session,
+                requesting_user_id=current_user.id,
+                radius=args['radius'],
+                limit=limit,
+                latitude=args['lat'],
+                longitude=args['lng']
+            )
+            return nearby_users, 200
+
+        except ValueError as e: # Catches a missing or invalid location, or an invalid radius
+            return {'message': str(e)}, 400
+        except Exception as e:
+            current_app.logger.error(f"Error fetching nearby users: {e}", exc_info=True)
+            return {'message': 'An error occurred while fetching nearby users.'}, 500
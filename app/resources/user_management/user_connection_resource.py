@@ -3,7 +3,7 @@ from flask_restful import Resource, reqparse
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from sqlalchemy.orm import Session
 from app.extensions import db
-from app.services import get_user_connections_service
+from app.services import get_user_connections_service, COUNT_MODES
 from app.exceptions import UserNotFoundError
 from app.models import User, Follower
 
@@ -39,6 +39,8 @@ class FollowerListResource(Resource):
         parser = reqparse.RequestParser()
         parser.add_argument('page', type=int, default=1, location='args')
         parser.add_argument('per_page', type=int, default=20, location='args')
+        parser.add_argument('cursor', type=str, default=None, location='args')
+        parser.add_argument('count', type=str, default=None, choices=COUNT_MODES, location='args') # How totals are computed; 'none' skips them
         args = parser.parse_args()
         
         requesting_user_id = get_jwt_identity()
@@ -51,7 +53,9 @@ class FollowerListResource(Resource):
                 target_username=username,
                 connection_type='followers',
                 page=args['page'],
-                per_page=args['per_page']
+                per_page=args['per_page'],
+                cursor=args['cursor'],
+                count_mode=args['count']
             )
             
             data['users'] = [
@@ -61,6 +65,8 @@ class FollowerListResource(Resource):
             return data, 200
         except UserNotFoundError as e:
             return {'message': str(e)}, 404
+        except ValueError as e: # Catches a malformed pagination cursor
+            return {'message': str(e)}, 400
         except Exception as e:
             return {'message': str(e)}, 500
 
@@ -73,6 +79,8 @@ class FollowingListResource(Resource):
         parser = reqparse.RequestParser()
         parser.add_argument('page', type=int, default=1, location='args')
         parser.add_argument('per_page', type=int, default=20, location='args')
+        parser.add_argument('cursor', type=str, default=None, location='args')
+        parser.add_argument('count', type=str, default=None, choices=COUNT_MODES, location='args') # How totals are computed; 'none' skips them
         args = parser.parse_args()
         
         requesting_user_id = get_jwt_identity()
@@ -85,7 +93,9 @@ class FollowingListResource(Resource):
                 target_username=username,
                 connection_type='following',
                 page=args['page'],
-                per_page=args['per_page']
+                per_page=args['per_page'],
+                cursor=args['cursor'],
+                count_mode=args['count']
             )
             
             data['users'] = [
@@ -95,5 +105,7 @@ class FollowingListResource(Resource):
             return data, 200
         except UserNotFoundError as e:
             return {'message': str(e)}, 404
+        except ValueError as e: # Catches a malformed pagination cursor
+            return {'message': str(e)}, 400
         except Exception as e:
             return {'message': str(e)}, 500
\ No newline at end of file
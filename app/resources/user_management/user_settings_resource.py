@@ -65,6 +65,14 @@ class UserSettingsResource(Resource):
             # 2. Pass through non-mapped fields like JSONB objects
             if "notification_preferences" in data:
                 service_data["notification_preferences"] = data["notification_preferences"]
+
+            # 3. The location is sent as {"lat": ..., "lng": ...}, or null to clear it
+            if "location" in data:
+                location = data["location"]
+                try:
+                    service_data["location_coords"] = None if location is None else (float(location["lng"]), float(location["lat"]))
+                except (TypeError, KeyError, ValueError):
+                    return {'message': "Invalid location: expected an object with numeric 'lat' and 'lng'."}, 400
             
             # Delegate all business logic to the service layer.
             updated_user = update_user_settings_service(
@@ -80,6 +88,9 @@ class UserSettingsResource(Resource):
         except UserNotFoundError as e:
             db.session.rollback()
             return {'message': str(e)}, 404
+        except ValueError as e: # Catches out-of-range coordinates
+            db.session.rollback()
+            return {'message': str(e)}, 400
         except Exception as e:
             db.session.rollback()
             current_app.logger.error(f"Error updating settings: {e}", exc_info=True)
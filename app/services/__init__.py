@@ -5,6 +5,8 @@ from .account_management import (
 )
 from .auth import login_user, get_user_by_id, refresh_user_tokens, login_or_register_google_user
 
+from .counts import COUNT_MODES
+
 from .media import update_profile_picture_service, delete_profile_picture_service
 
 from .notitifcation import (
@@ -13,7 +15,9 @@ from .notitifcation import (
 )
 from .post import (
     get_posts_for_user_profile, create_post, delete_post_service, 
-    update_post_service, get_post_by_public_id_service, get_post_feed_service
+    update_post_service, get_post_by_public_id_service, get_post_feed_service, get_following_feed_service,
+    get_ranked_feed_service, get_trending_hashtags_service, get_hashtag_posts_service,
+    search_posts_service, get_nearby_posts_service, get_post_likers_service
 )
 from .redis import add_token_to_blocklist, is_token_blocklisted
 
@@ -23,7 +27,8 @@ from .social_interactions import (
 from .user_management import (
     get_user_profile_by_username, register_new_user, request_password_reset, reset_user_password, 
     update_user_settings_service, delete_user_service, get_user_details_service, verify_email_with_token, 
-    resend_verification_email, complete_user_onboarding, get_user_connections_service
+    resend_verification_email, complete_user_onboarding, get_user_connections_service, search_users_service,
+    get_nearby_users_service
 )
 
 
@@ -35,6 +40,9 @@ __all__ = [
     # ----- auth_service -----
     'login_user', 'get_user_by_id', 'refresh_user_tokens', 'login_or_register_google_user',
 
+    # ----- count_service -----
+    'COUNT_MODES',
+
     # ----- media_service -----
     'update_profile_picture_service', 'delete_profile_picture_service',
 
@@ -44,7 +52,9 @@ __all__ = [
 
     # ----- post_service -----
     'get_posts_for_user_profile', 'create_post',  'delete_post_service', 'update_post_service',
-    'get_post_by_public_id_service', 'get_post_feed_service',
+    'get_post_by_public_id_service', 'get_post_feed_service', 'get_following_feed_service', 'get_ranked_feed_service',
+    'get_trending_hashtags_service', 'get_hashtag_posts_service', 'search_posts_service', 'get_nearby_posts_service',
+    'get_post_likers_service',
 
     # ----- redis_service -----
     'add_token_to_blocklist', 'is_token_blocklisted',
@@ -57,5 +67,5 @@ __all__ = [
     'get_user_profile_by_username', 'register_new_user', 'request_password_reset',
     'reset_user_password', 'update_user_settings_service', 'delete_user_service', 
     'get_user_details_service', 'verify_email_with_token', 'resend_verification_email',
-    'complete_user_onboarding', 'get_user_connections_service',
+    'complete_user_onboarding', 'get_user_connections_service', 'search_users_service', 'get_nearby_users_service',
 ]
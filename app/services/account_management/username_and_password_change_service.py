@@ -4,6 +4,7 @@ from app.exceptions import (
     UserNotFoundError, InvalidCredentialsError, 
     UserAlreadyExistsError
 )
+from app.services.mentions.mention_service import invalidate_mention_cache
 from utils.app_utils import validate_password, PASSWORD_ERROR_STRING
 
 def change_username_service(session: Session, user_id: int, password: str, new_username: str) -> User:
@@ -33,7 +34,10 @@ def change_username_service(session: Session, user_id: int, password: str, new_u
     if existing_user:
         raise UserAlreadyExistsError("This username is already taken.")
 
+    old_username = user.username
     user.username = new_username
+    # The old name no longer resolves to this user, and the new one may be cached as missing
+    invalidate_mention_cache(session, old_username, new_username)
     return user
 
 def change_password_service(session: Session, user_id: int, old_password: str, new_password: str) -> bool:
@@ -7,6 +7,7 @@ from datetime import datetime
 from flask_jwt_extended import create_access_token, create_refresh_token
 from app.models import User
 from app.exceptions import InvalidCredentialsError
+from app.services.mentions.mention_service import invalidate_mention_cache
 from utils.app_utils import TokenUtil
 from utils.model_utils import UserStatus
 
@@ -71,6 +72,7 @@ def login_or_register_google_user(session: Session, code: str) -> dict:
             session.add(user)
             # We must flush to get the user.id for token creation
             session.flush() 
+            invalidate_mention_cache(session, user.username) # The name may be cached as missing
         
         # 4. --- Generate this app's tokens (copied from login_service.py) ---
         token_util = TokenUtil() 
@@ -0,0 +1,7 @@
+from .like_counter_service import apply_pending_like_counts, flush_like_counters
+from .reconcile_service import reconcile_like_counts
+
+
+__all__ = [
+    'apply_pending_like_counts', 'flush_like_counters', 'reconcile_like_counts',
+]
@@ -0,0 +1,28 @@
+from sqlalchemy.orm import Session
+from app.models import LikeCountDelta
+
+# This service layer keeps posts.like_count as a write-behind counter. A like or unlike adds +1/-1
+# to a sharded delta row (like_count_deltas) in the same statement that writes the like
+# (PostLike.add_by_public_id / remove_by_public_id), so the change commits or rolls back with the
+# like itself and concurrent likes never read-modify-write the post row.
+# The counter flusher (flask counters flush) applies the accumulated deltas to posts.like_count
+# in batches, and readers add the pending deltas to the persisted count.
+
+
+def apply_pending_like_counts(session: Session, bodies: dict[int, dict]) -> None:
+    """Adds the unflushed like count changes to serialized post bodies with one query."""
+    pending = LikeCountDelta.get_pending(session, list(bodies.keys()))
+    for post_id, delta in pending.items():
+        body = bodies[post_id]
+        body["likeCount"] = max(body["likeCount"] + delta, 0)
+
+
+def flush_like_counters(session: Session, batch_size: int) -> int:
+    """
+    Applies up to batch_size shard rows to posts.like_count and commits.
+    The posts' updated_at changes with their count, which retires their cached bodies.
+    Returns the number of shard rows applied.
+    """
+    flushed = LikeCountDelta.flush_batch(session, batch_size)
+    session.commit()
+    return flushed
@@ -0,0 +1,99 @@
+import logging
+import time
+from typing import Callable
+from sqlalchemy import select, update, func
+from sqlalchemy.orm import Session
+from app.models import Post, PostLike, LikeCountDelta
+from app.services.redis.reconcile_checkpoint_operation import get_checkpoint, set_checkpoint, delete_checkpoint
+
+logger = logging.getLogger(__name__)
+
+# This service layer repairs drift in the denormalized post counters by recomputing them from
+# their source rows (flask counters reconcile). Posts are walked in ranges of ids; each range is
+# corrected with one set-based UPDATE ... FROM of aggregates and committed on its own, so a run
+# holds no long transaction, is throttled between ranges, and resumes from a checkpoint.
+#
+# like_count is expected to equal the post's post_likes rows minus its unflushed like_count_deltas
+# (see like_counter_service). The correction is applied as a delta (like_count + drift) rather than
+# an assignment, so a counter flush committing in the meantime is not overwritten.
+
+LIKE_COUNT = 'like_count'
+
+
+def _reconcile_like_count_range(session: Session, first_id: int, last_id: int) -> list[int]:
+    """Corrects like_count for the posts with ids in [first_id, last_id]. Returns the drift of each corrected post."""
+    likes = (
+        select(PostLike.post_id, func.count().label("like_rows"))
+        .where(PostLike.post_id.between(first_id, last_id))
+        .group_by(PostLike.post_id)
+        .subquery()
+    )
+    pending = (
+        select(LikeCountDelta.post_id, func.sum(LikeCountDelta.delta).label("pending"))
+        .where(LikeCountDelta.post_id.between(first_id, last_id))
+        .group_by(LikeCountDelta.post_id)
+        .subquery()
+    )
+    expected = func.coalesce(likes.c.like_rows, 0) - func.coalesce(pending.c.pending, 0)
+    drifts = (
+        select(Post.id, (expected - Post.like_count).label("drift"))
+        .outerjoin(likes, likes.c.post_id == Post.id)
+        .outerjoin(pending, pending.c.post_id == Post.id)
+        .where(Post.id.between(first_id, last_id), expected != Post.like_count)
+        .subquery("drifts")
+    )
+    stmt = (
+        update(Post)
+        .where(Post.id == drifts.c.id)
+        .values(like_count=Post.like_count + drifts.c.drift)
+        .returning(drifts.c.drift)
+        .execution_options(synchronize_session=False)
+    )
+    return [int(drift) for drift in session.execute(stmt).scalars().all()]
+
+
+def reconcile_like_counts(
+    session: Session, chunk_size: int, max_rows_per_second: int, restart: bool = False,
+    on_chunk: Callable[[int, int, list[int]], None] | None = None
+) -> dict:
+    """
+    Recomputes posts.like_count from post_likes for every post, chunk_size post ids at a time,
+    scanning at most max_rows_per_second post ids per second. Continues from the checkpoint of an
+    interrupted run unless restart is set. Corrected posts get a new updated_at, which retires
+    their cached bodies.
+
+    on_chunk, if given, is called after each committed chunk with (first_id, last_id, drifts).
+    Returns drift statistics for the run.
+    """
+    max_id = session.execute(select(func.max(Post.id))).scalar() or 0
+    session.commit()
+    first_id = 1 if restart else (get_checkpoint(LIKE_COUNT) or 1)
+
+    stats = {"first_id": first_id, "last_id": max_id, "chunks": 0, "posts_corrected": 0, "total_drift": 0, "net_drift": 0, "max_drift": 0}
+    while first_id <= max_id:
+        chunk_started = time.monotonic()
+        last_id = min(first_id + chunk_size - 1, max_id)
+
+        drifts = _reconcile_like_count_range(session, first_id, last_id)
+        session.commit()
+        set_checkpoint(LIKE_COUNT, last_id + 1)
+
+        stats["chunks"] += 1
+        stats["posts_corrected"] += len(drifts)
+        stats["total_drift"] += sum(abs(drift) for drift in drifts)
+        stats["net_drift"] += sum(drifts)
+        stats["max_drift"] = max([stats["max_drift"], *(abs(drift) for drift in drifts)])
+        if drifts:
+            logger.info(f"Corrected like_count of {len(drifts)} posts with ids {first_id}-{last_id} (net drift {sum(drifts)}).")
+        if on_chunk:
+            on_chunk(first_id, last_id, drifts)
+
+        # Throttle: a chunk may not finish faster than max_rows_per_second allows
+        min_seconds = (last_id - first_id + 1) / max_rows_per_second
+        elapsed = time.monotonic() - chunk_started
+        if elapsed < min_seconds:
+            time.sleep(min_seconds - elapsed)
+        first_id = last_id + 1
+
+    delete_checkpoint(LIKE_COUNT)
+    return stats
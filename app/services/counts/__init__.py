@@ -0,0 +1,6 @@
+from .count_service import COUNT_MODES, COUNT_EXACT, COUNT_ESTIMATED, COUNT_NONE
+
+
+__all__ = [
+    'COUNT_MODES', 'COUNT_EXACT', 'COUNT_ESTIMATED', 'COUNT_NONE',
+]
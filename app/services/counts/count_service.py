@@ -0,0 +1,144 @@
+import json
+import math
+from flask import current_app
+from sqlalchemy import select, func, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from app.models import Post, Follower
+from app.services.outbox.outbox_service import run_after_commit
+from app.services.redis.counter_operation import get_counters, get_counter_versions, init_counters, increment_counters
+from utils.model_utils.enums import PostVisibility
+
+# This service layer decides how the totals of paginated lists are computed.
+# - 'exact': a maintained counter when the list has one, otherwise SELECT count(*).
+#   Counters are adjusted once the write commits; a counter recomputed while a write was
+#   in flight is discarded rather than stored, so a rollback or a concurrent write cannot
+#   leave it wrong. What remains is a write whose adjustment is lost (the process dies
+#   right after commit, or Redis is down) or one whose adjustment runs just after a
+#   recompute that already saw its commit; COUNTER_TTL_SECONDS bounds such drift.
+# - 'estimated': the planner's row estimate from EXPLAIN (pg_class.reltuples scaled by
+#   the filter's selectivity), for very large sets.
+# - 'none': no total at all; clients page with nextCursor.
+
+COUNT_EXACT = 'exact'
+COUNT_ESTIMATED = 'estimated'
+COUNT_NONE = 'none'
+COUNT_MODES = (COUNT_EXACT, COUNT_ESTIMATED, COUNT_NONE)
+
+
+#----------------------------------------------------------------
+# Counter keys for maintained counts
+#----------------------------------------------------------------
+def public_posts_counter() -> str:
+    return "count:posts:public"
+
+
+def user_posts_counter(user_id: int, visibility: PostVisibility) -> str:
+    return f"count:posts:{user_id}:{visibility.name}"
+
+
+def followers_counter(user_id: int) -> str:
+    return f"count:followers:{user_id}"
+
+
+def following_counter(user_id: int) -> str:
+    return f"count:following:{user_id}"
+
+
+def post_counter_keys(post: Post) -> list[str]:
+    """Returns the maintained counters a post is counted in, for write-path adjustments."""
+    keys = [user_posts_counter(post.user_id, post.visibility)]
+    if post.visibility == PostVisibility.PUBLIC:
+        keys.append(public_posts_counter())
+    return keys
+
+
+def user_posts_counters(user_id: int, visibilities: list[PostVisibility]) -> dict[str, Select]:
+    """Returns the per-visibility post counters of a user with their recompute queries."""
+    return {
+        user_posts_counter(user_id, visibility): select(Post.id).where(Post.user_id == user_id, Post.visibility == visibility)
+        for visibility in visibilities
+    }
+
+
+def follow_counters(user_id: int, connection_type: str) -> dict[str, Select]:
+    """Returns the followers or following counter of a user with its recompute query."""
+    if connection_type == 'followers':
+        return {followers_counter(user_id): select(Follower.follower_id).where(Follower.followed_id == user_id)}
+    return {following_counter(user_id): select(Follower.followed_id).where(Follower.follower_id == user_id)}
+
+
+#----------------------------------------------------------------
+# Count strategies
+#----------------------------------------------------------------
+def exact_count(session: Session, query: Select) -> int:
+    """Counts the rows of a query exactly."""
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    return session.execute(count_query).scalar() or 0
+
+
+def estimated_count(session: Session, query: Select) -> int:
+    """
+    Returns the planner's row estimate for a query without executing it.
+    Accuracy depends on table statistics, so this is only meant for large sets
+    where an approximate 'about N results' is acceptable.
+    """
+    compiled = query.order_by(None).compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    plan = session.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def maintained_count(session: Session, counters: dict[str, Select]) -> int:
+    """
+    Sums maintained counters, each given with the query that recomputes it.
+    Counters missing from Redis are counted exactly and stored for the next reader,
+    unless a write adjusted them while they were being counted.
+    """
+    cached = get_counters(list(counters.keys()))
+    missing_keys = [key for key in counters if key not in cached]
+    # Read before counting, so any write committed after the count's snapshot changes it
+    versions = get_counter_versions(missing_keys)
+    missing = {key: exact_count(session, counters[key]) for key in missing_keys}
+    if versions:
+        init_counters(missing, versions, current_app.config['COUNTER_TTL_SECONDS'])
+    return sum(cached.values()) + sum(missing.values())
+
+
+def adjust_counts(session: Session, amounts: dict[str, int]) -> None:
+    """
+    Applies write-path deltas to maintained counters once the transaction commits,
+    e.g. {followers_counter(5): 1}. Nothing is applied if it rolls back.
+    """
+    run_after_commit(session, increment_counters, dict(amounts), current_app.config['COUNTER_TTL_SECONDS'])
+
+
+def resolve_count(session: Session, mode: str, query: Select, counters: dict[str, Select] | None = None) -> int | None:
+    """
+    Computes the total for a list with the requested strategy.
+
+    Arguments:
+        session: The database session.
+        mode: One of COUNT_MODES.
+        query: The list query (without pagination) to count or estimate.
+        counters: Maintained counters that add up to the exact total, with their recompute queries.
+
+    Returns:
+        The total, or None for mode 'none'.
+    """
+    if mode == COUNT_NONE:
+        return None
+    if mode == COUNT_ESTIMATED:
+        return estimated_count(session, query)
+    if mode == COUNT_EXACT:
+        return maintained_count(session, counters) if counters else exact_count(session, query)
+    raise ValueError("Invalid count mode.")
+
+
+def page_totals(total_items: int | None, per_page: int) -> tuple[int | None, int | None]:
+    """Returns (totalItems, totalPages) for a resolved total; both are None when no total was requested."""
+    if total_items is None:
+        return None, None
+    return total_items, math.ceil(total_items / per_page) if per_page > 0 else 0
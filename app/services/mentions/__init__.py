@@ -0,0 +1,6 @@
+from .mention_service import MentionedUser, resolve_mentions, invalidate_mention_cache
+
+
+__all__ = [
+    'MentionedUser', 'resolve_mentions', 'invalidate_mention_cache',
+]
@@ -0,0 +1,60 @@
+from typing import NamedTuple
+from flask import current_app
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session
+from app.models import User
+from app.services.outbox.outbox_service import run_after_commit
+from app.services.redis.mention_cache_operation import get_mention_entries, set_mention_entries, delete_mention_entries
+from utils.app_utils.regex_patterns import MENTION_REGEX
+
+# This service layer resolves @mentions in post content to users. Usernames are matched
+# case-insensitively through the lower(username) unique index, and the lower-cased
+# username -> (id, display name) mapping is cached in Redis, including usernames that do
+# not exist. Only the columns a mention needs are selected; no User rows are loaded.
+
+
+class MentionedUser(NamedTuple):
+    id: int
+    display_name: str
+
+
+def resolve_mentions(session: Session, content: str | None) -> list[MentionedUser]:
+    """
+    Returns the existing users mentioned in the content, in order of first mention.
+    Raises ValueError if more than MAX_MENTIONS_PER_POST distinct usernames are mentioned.
+    """
+    usernames = list(dict.fromkeys(username.lower() for username in MENTION_REGEX.findall(content or "")))
+    if not usernames:
+        return []
+    max_mentions = current_app.config['MAX_MENTIONS_PER_POST']
+    if len(usernames) > max_mentions:
+        raise ValueError(f"A post can mention at most {max_mentions} users.")
+
+    entries = get_mention_entries(usernames)
+    missing_usernames = [username for username in usernames if username not in entries]
+    if missing_usernames:
+        lower_username = func.lower(User.username)
+        query = select(lower_username, User.id, User.display_name).where(lower_username.in_(missing_usernames))
+        loaded = {username: None for username in missing_usernames}
+        for username, user_id, display_name in session.execute(query).all():
+            loaded[username] = {"id": user_id, "displayName": display_name}
+        config = current_app.config
+        set_mention_entries(loaded, config['MENTION_CACHE_TTL_SECONDS'], config['MENTION_CACHE_NEGATIVE_TTL_SECONDS'])
+        entries.update(loaded)
+
+    mentioned_users, seen_ids = [], set()
+    for username in usernames:
+        entry = entries[username]
+        if entry is not None and entry["id"] not in seen_ids:
+            seen_ids.add(entry["id"])
+            mentioned_users.append(MentionedUser(entry["id"], entry["displayName"]))
+    return mentioned_users
+
+
+def invalidate_mention_cache(session: Session, *usernames: str | None) -> None:
+    """
+    Drops cached mention entries after a username was taken, changed or its account deleted.
+    The drop runs once the transaction commits, so a concurrent lookup cannot cache the old row
+    again after it.
+    """
+    run_after_commit(session, delete_mention_entries, [username.lower() for username in usernames if username])
@@ -1,34 +1,56 @@
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import select, update, func
+from sqlalchemy import select, update, func, tuple_
 from app.models import Notification, User, Post
-import math
+from app.services.post.post_cache_service import get_many
+from app.services.notitifcation.notification_actor_service import attach_recent_actors
+from app.services.counts.count_service import COUNT_EXACT, resolve_count, page_totals
+from utils.app_utils.pagination_utils import encode_cursor, decode_cursor
 
 
-def get_notifications_service(session: Session, user_id: int, page: int, per_page: int) -> dict:
+def get_notifications_service(
+    session: Session, user_id: int, page: int, per_page: int, cursor: str | None = None, count_mode: str | None = None
+) -> dict:
     """
     Handles the business logic for fetching a user's notifications.
+    Uses keyset pagination on (created_at, id) when a cursor is given, page number otherwise.
     """
-    # --- 1 & 2: Count and Pagination Logic (Unchanged) ---
-    unread_count_query = (
-        select(func.count(Notification.id))
-        .where(Notification.recipient_user_id == user_id, Notification.is_read == False)
-    )
-    total_unread_before_fetch = session.execute(unread_count_query).scalar() or 0
-
-    total_items_query = select(func.count(Notification.id)).where(Notification.recipient_user_id == user_id)
-    total_items = session.execute(total_items_query).scalar() or 0
-    total_pages = math.ceil(total_items / per_page) if per_page > 0 else 0
+    # --- 1 & 2: Count and Pagination Logic ---
+    count_mode = count_mode or COUNT_EXACT
+    user_notifications_query = select(Notification.id).where(Notification.recipient_user_id == user_id)
+    if count_mode == COUNT_EXACT:
+        # The unread badge and the exact total are counted in a single pass.
+        counts_query = (
+            select(func.count(Notification.id).filter(Notification.is_read == False), func.count(Notification.id))
+            .where(Notification.recipient_user_id == user_id)
+        )
+        total_unread_before_fetch, total_items = session.execute(counts_query).one()
+    else:
+        unread_count_query = (
+            select(func.count(Notification.id))
+            .where(Notification.recipient_user_id == user_id, Notification.is_read == False)
+        )
+        total_unread_before_fetch = session.execute(unread_count_query).scalar() or 0
+        total_items = resolve_count(session, count_mode, user_notifications_query)
+    total_items, total_pages = page_totals(total_items, per_page)
 
-    # --- 3. Fetch Paginated Notifications (Unchanged) ---
+    # --- 3. Fetch Paginated Notifications ---
     query = (
         select(Notification)
         .where(Notification.recipient_user_id == user_id)
         .options(joinedload(Notification.actor))
         .order_by(Notification.created_at.desc(), Notification.id.desc())
-        .limit(per_page)
-        .offset((page - 1) * per_page)
+        .limit(per_page + 1)
     )
+    if cursor:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        query = query.where(tuple_(Notification.created_at, Notification.id) < tuple_(cursor_created_at, cursor_id))
+    else:
+        query = query.offset((page - 1) * per_page)
+
     notifications = session.execute(query).scalars().all()
+    has_more = len(notifications) > per_page
+    notifications = notifications[:per_page]
+    next_cursor = encode_cursor(notifications[-1].created_at, notifications[-1].id) if has_more and notifications else None
 
     # STEP A: Collect all target IDs in a single loop
     post_ids_to_fetch = []
@@ -36,11 +58,8 @@ def get_notifications_service(session: Session, user_id: int, page: int, per_pag
         if n.target_type == 'post' and n.target_id:
             post_ids_to_fetch.append(n.target_id)
 
-    # STEP B: Fetch all target objects in bulk (to prevent N+1 queries)
-    posts_by_id = {}
-    if post_ids_to_fetch:
-        posts = session.query(Post).filter(Post.id.in_(post_ids_to_fetch)).all()
-        posts_by_id = {post.id: post for post in posts}
+    # STEP B: Fetch all target post bodies in bulk from the post cache (to prevent N+1 queries)
+    posts_by_id = get_many(session, list(set(post_ids_to_fetch)))
 
 
     # STEP C: Attach all objects in a single, final loop
@@ -48,10 +67,15 @@ def get_notifications_service(session: Session, user_id: int, page: int, per_pag
         if n.target_type == 'post':
             n.target_object = posts_by_id.get(n.target_id)
 
-    # --- 5. Return All Data (Unchanged) ---
+    # STEP D: Load the recent actors of aggregated notifications in one query
+    attach_recent_actors(session, notifications)
+
+    # --- 5. Return All Data ---
     return {
         "notifications": notifications,
         "unread_count": total_unread_before_fetch,
         "current_page": page,
-        "total_pages": total_pages
+        "total_pages": total_pages,
+        "total_items": total_items,
+        "next_cursor": next_cursor
     }
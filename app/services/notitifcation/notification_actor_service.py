@@ -0,0 +1,22 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.models import Notification, User
+
+
+def attach_recent_actors(session: Session, notifications: list[Notification]) -> None:
+    """
+    Sets 'recent_actors' on aggregated notifications, in recent_actor_ids order, for serialize_notification.
+    The actors of all notifications are loaded with one query; deleted users are left out.
+    """
+    actor_ids = {actor_id for n in notifications for actor_id in (n.recent_actor_ids or [])}
+    if not actor_ids:
+        return
+
+    query = select(User.id, User.username, User.display_name, User.profile_picture_url).where(User.id.in_(actor_ids))
+    actors = {
+        row.id: {"username": row.username, "displayName": row.display_name, "avatarUrl": row.profile_picture_url, "isDeleted": False}
+        for row in session.execute(query).all()
+    }
+    for n in notifications:
+        if n.recent_actor_ids:
+            n.recent_actors = [actors[actor_id] for actor_id in n.recent_actor_ids if actor_id in actors]
@@ -0,0 +1,62 @@
+from app.models import Notification
+
+# Serializes notifications for the list endpoint and for the socket emits queued by the write services.
+# It lives in the service layer and imports only models, so those services can use it without
+# importing the resources package (which imports app.services at load time).
+
+
+# Helper function to serialize the notification data for the frontend.
+def serialize_notification(notification: Notification) -> dict:
+    # Create the nested 'fromUser' object
+    from_user = None
+    if notification.actor:
+        from_user = {
+            "username": notification.actor.username,
+            "displayName": notification.actor.display_name,
+            "avatarUrl": notification.actor.profile_picture_url,
+            "isDeleted": False
+        }
+    else:
+        # "Ghost User" placeholder for deleted users
+        from_user = {
+            "username": "deleted_user",
+            "displayName": "A deleted user",
+            "avatarUrl": None,  # Frontend will use DEFAULT_AVATAR_URL
+            "isDeleted": True
+        }
+    
+    # Create the nested 'post' object if the target is a post
+    post_data = None
+    
+    # This handles notifications where the Post is the direct target (e.g., post like)
+    if notification.target_type == 'post' and hasattr(notification, 'target_object') and notification.target_object:
+        post = notification.target_object
+        # The list service attaches cached post bodies; the socket emitters attach Post objects.
+        if isinstance(post, dict):
+            post_id, content = post["id"], post["content"]
+        else:
+            post_id, content = str(post.public_id), post.content
+        post_data = {
+            "id": post_id,
+            # Truncate content for the notification preview
+            "content": (content[:75] + '...') if content and len(content) > 75 else content
+        }
+
+    # Aggregated notifications (e.g. likes) name their latest actors and count the rest.
+    # 'recent_actors' is attached by attach_recent_actors; otherwise the latest actor is the only one shown.
+    actor_count = notification.actor_count or 1
+    recent_actors = getattr(notification, 'recent_actors', None)
+    if recent_actors is None:
+        recent_actors = [] if from_user["isDeleted"] else [from_user]
+
+    return {
+        "id": str(notification.public_id),
+        "type": notification.action_type,
+        "isRead": notification.is_read,   
+        "createdAt": notification.created_at.isoformat(),
+        "fromUser": from_user,
+        "post": post_data, 
+        "actorCount": actor_count,
+        "recentActors": recent_actors,
+        "otherActorCount": max(actor_count - len(recent_actors), 0),
+    }
@@ -0,0 +1,6 @@
+from .outbox_service import enqueue_socket_emit, enqueue_socket_emits, process_outbox_batch
+
+
+__all__ = [
+    'enqueue_socket_emit', 'enqueue_socket_emits', 'process_outbox_batch',
+]
@@ -0,0 +1,103 @@
+import logging
+from typing import Callable
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.models import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+# This service layer records post-commit side effects in the outbox table and carries them out.
+# Request handlers only insert a row in their own transaction; the outbox worker
+# (flask outbox worker) claims committed rows in batches and performs them off the request path.
+# Delivery is at least once: a worker that dies after emitting but before committing the delete
+# emits that batch again.
+#
+# Cache writes (Redis timelines, counters, ...) that must only follow a committed change but need
+# no durable delivery are run in-process instead, right after COMMIT (run_after_commit).
+
+SOCKET_EMIT = 'socket_emit'
+
+
+def enqueue_socket_emit(session: Session, event: str, data: dict, room: str, namespace: str = '/') -> None:
+    """Records a Socket.IO emit that the outbox worker sends once the current transaction commits."""
+    OutboxEvent.add(session, SOCKET_EMIT, {"event": event, "data": data, "room": room, "namespace": namespace})
+
+
+def enqueue_socket_emits(session: Session, event: str, emits: list[tuple[str, dict]], namespace: str = '/') -> None:
+    """Records one Socket.IO emit per (room, data) pair with a single insert."""
+    OutboxEvent.add_many(session, SOCKET_EMIT, [
+        {"event": event, "data": data, "room": room, "namespace": namespace} for room, data in emits
+    ])
+
+
+def _emit(emitter, payload: dict) -> None:
+    emitter.emit(payload["event"], payload["data"], namespace=payload.get("namespace", '/'), room=payload["room"])
+
+
+_HANDLERS = {
+    SOCKET_EMIT: _emit,
+}
+
+
+def process_outbox_batch(session: Session, emitter, batch_size: int, max_attempts: int) -> int:
+    """
+    Claims up to batch_size events, carries them out and deletes them in one transaction.
+    A failed event is kept for a retry with its attempt count raised, and dropped after
+    max_attempts. Returns the number of claimed events.
+
+    Arguments:
+        emitter: A write-only Socket.IO manager (anything with emit(event, data, namespace, room)).
+    """
+    events = OutboxEvent.claim_batch(session, batch_size)
+    done_ids = []
+    for outbox_event in events:
+        try:
+            _HANDLERS[outbox_event.event_type](emitter, outbox_event.payload)
+            done_ids.append(outbox_event.id)
+        except Exception as e:
+            outbox_event.attempts += 1
+            outbox_event.last_error = str(e)[:1000]
+            if outbox_event.attempts >= max_attempts:
+                logger.error(f"Dropping outbox event {outbox_event.id} ({outbox_event.event_type}) after {outbox_event.attempts} attempts: {e}")
+                done_ids.append(outbox_event.id)
+            else:
+                logger.warning(f"Outbox event {outbox_event.id} ({outbox_event.event_type}) failed, will retry: {e}")
+
+    OutboxEvent.delete_many(session, done_ids)
+    session.commit()
+    return len(events)
+
+
+#----------------------------------------------------------------
+# In-process post-commit hooks. They run in the committing process right after COMMIT and are
+# discarded if the transaction rolls back, so a rolled back request never touches the caches.
+# A hook lost to a crash between COMMIT and the hook only leaves a cache stale until it
+# expires or is rebuilt, which is why hooks are used for cache writes only.
+#----------------------------------------------------------------
+_AFTER_COMMIT_KEY = 'after_commit_callbacks'
+
+
+def run_after_commit(session: Session, callback: Callable, *args, **kwargs) -> None:
+    """
+    Calls callback(*args, **kwargs) once the session's current transaction commits.
+    The session cannot run queries at that point, so everything the callback needs
+    must be passed in as plain values.
+    """
+    session.info.setdefault(_AFTER_COMMIT_KEY, []).append((callback, args, kwargs))
+
+
+@event.listens_for(Session, 'after_commit')
+def _run_after_commit_callbacks(session: Session) -> None:
+    for callback, args, kwargs in session.info.pop(_AFTER_COMMIT_KEY, []):
+        try:
+            callback(*args, **kwargs)
+        except Exception as e:
+            # The change is already committed; a failed cache write must not fail the request.
+            logger.error(f"After-commit hook {callback.__name__} failed: {e}", exc_info=True)
+
+
+@event.listens_for(Session, 'after_transaction_end')
+def _discard_after_commit_callbacks(session: Session, transaction) -> None:
+    # Runs after after_commit, so only the hooks of a rolled back or closed transaction are left.
+    if transaction.parent is None:
+        session.info.pop(_AFTER_COMMIT_KEY, None)
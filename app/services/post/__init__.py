@@ -4,10 +4,19 @@ from .delete_post_service import delete_post_service
 from .update_post_service import update_post_service
 from .get_post_service import get_post_by_public_id_service
 from .get_post_feed_service import get_post_feed_service
+from .get_followed_user_posts import get_following_feed_service
+from .get_ranked_feed_service import get_ranked_feed_service
+from .trending_service import get_trending_hashtags_service
+from .hashtag_timeline_service import get_hashtag_posts_service
+from .search_service import search_posts_service
+from .nearby_service import get_nearby_posts_service
+from .post_likers_service import get_post_likers_service
 
 
 
 _all__ = [
     'get_posts_for_user_profile', 'create_post',  'delete_post_service', 'update_post_service', 'get_post_by_public_id_service',
-    'get_post_feed_service'
+    'get_post_feed_service', 'get_following_feed_service', 'get_ranked_feed_service', 'get_trending_hashtags_service',
+    'get_hashtag_posts_service', 'search_posts_service', 'get_nearby_posts_service',
+    'get_post_likers_service'
 ]
\ No newline at end of file
@@ -1,12 +1,16 @@
 import re
 from sqlalchemy.orm import Session
-from sqlalchemy import select
-from app.models import Post, Hashtag, User, Notification
+from app.models import Post, PostHashtag, PostMentions, User, Notification
 from app.exceptions import UserNotFoundError
 from utils.model_utils.enums import PostType, PostVisibility
-from utils.app_utils.regex_patterns import MENTION_REGEX
-from app.extensions import socketio
-from app.resources.notitifications.notification_list_resource import serialize_notification
+from app.services.outbox.outbox_service import enqueue_socket_emits
+from app.services.notitifcation.notification_serializer import serialize_notification
+from app.services.post.timeline_service import fan_out_post
+from app.services.post.hashtag_service import resolve_hashtags
+from app.services.mentions.mention_service import resolve_mentions
+from app.services.post.public_feed_service import add_post_to_public_feed
+from app.services.post.trending_service import record_post_hashtags
+from app.services.counts.count_service import adjust_counts, post_counter_keys
 
 
 def create_post(
@@ -36,17 +40,12 @@ def create_post(
     # 2. --- Handle Hashtags ---
     hashtag_objects = []
     if tag_names:
-        unique_tag_names = set(tag_names)
-        hashtag_objects = [Hashtag.find_or_create(session, name) for name in unique_tag_names]
+        # Resolved in bulk: cached ids need no query, the rest one upsert and one select
+        hashtag_objects = resolve_hashtags(session, tag_names)
 
     # 3. --- Parse Mentions ---
-    mentioned_users = []
-    if content: # Only parse if there is content
-    # Regex now includes dots and hyphens
-        mention_usernames = list(set(MENTION_REGEX.findall(content or "")))
-        if mention_usernames:
-            query = select(User).where(User.username.in_(mention_usernames))
-            mentioned_users = session.execute(query).scalars().all()
+    # Resolved case-insensitively from the mention cache, as (id, display_name) only
+    mentioned_users = resolve_mentions(session, content)
     
     # 4. --- Create the Post ---
     new_post = Post.create(
@@ -55,43 +54,42 @@ def create_post(
         content=content,
         media_url=media_url,
         hashtags=hashtag_objects,
-        mentioned_users=mentioned_users,
         visibility=kwargs.get("visibility", PostVisibility.PUBLIC),
         location_coords=kwargs.get("location_coords"),
         post_type=post_type
     )
 
     session.flush()
+    if hashtag_objects:
+        PostHashtag.sync_post(session, new_post.id)
+    if mentioned_users:
+        PostMentions.replace_for_post(session, new_post.id, [mentioned_user.id for mentioned_user in mentioned_users])
 
-    # 5. --- Create Notifications for Mentions ---
-    for mentioned_user in mentioned_users:
-        if mentioned_user.id != user_id: # Don't notify on self-mention
-            new_notification = Notification.create(
-                session=session,
-                recipient_user_id=mentioned_user.id,
-                actor_user_id=user_id,
-                action_type='mention',
-                target_type='post',
-                target_id=new_post.id
-            )
-    
-            if new_notification:
-                # A. Flush to get the notification's relationships ready
-                session.flush()
-                
-                # B. Manually attach objects for the serializer to work
-                # This mimics the logic in get_notifications_service
-                new_notification.actor = user # The user who created the post
-                new_notification.target_object = new_post # The post that was created
-                
-                # C. Serialize the notification
-                serialized_data = serialize_notification(new_notification)
-                
-                # D. Emit the event ONLY to the mentioned user's personal room
-                socketio.emit(
-                    'new_notification',
-                    serialized_data,
-                    to=f"user_{mentioned_user.id}"
-                )
+    # 5. --- Push the post into the home timelines of the author and their followers ---
+    fan_out_post(session, new_post)
+    add_post_to_public_feed(session, new_post)
+    record_post_hashtags(session, new_post, hashtag_objects)
+    adjust_counts(session, {key: 1 for key in post_counter_keys(new_post)})
+
+    # 6. --- Create Notifications for Mentions ---
+    # One multi-row INSERT ... RETURNING for every mentioned user (self-mentions are skipped)
+    new_notifications = Notification.create_many(
+        session,
+        [mentioned_user.id for mentioned_user in mentioned_users],
+        actor_user_id=user_id,
+        action_type='mention',
+        target_type='post',
+        target_id=new_post.id
+    )
+    if new_notifications:
+        emits = []
+        for new_notification in new_notifications:
+            # Every notification is serialized against the same author and post
+            new_notification.actor = user
+            new_notification.target_object = new_post
+            emits.append((f"user_{new_notification.recipient_user_id}", serialize_notification(new_notification)))
+
+        # Queued for the mentioned users' personal rooms in one insert; they are emitted after commit
+        enqueue_socket_emits(session, 'new_notification', emits)
 
     return new_post
\ No newline at end of file
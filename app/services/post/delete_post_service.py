@@ -2,6 +2,11 @@ from sqlalchemy.orm import Session
 from app.models import Post
 from app.exceptions import PostNotFoundError, PermissionDeniedError
 from uuid import UUID
+from app.services.post.timeline_service import remove_post_from_timelines
+from app.services.post.public_feed_service import remove_post_from_public_feed
+from app.services.post.post_cache_service import invalidate_cached_posts
+from app.services.counts.count_service import adjust_counts, post_counter_keys
+from app.services.post.trending_service import public_tag_names, adjust_post_hashtags
 
 # This service layer contains the business logic for deleting a post.
 
@@ -21,6 +26,9 @@ def delete_post_service(session: Session, post_public_id: UUID, requesting_user_
     if not post_to_delete:
         raise PostNotFoundError("Post not found.")
 
+    # Read before the delete, while the post's hashtags can still be loaded
+    old_tag_names = public_tag_names(post_to_delete)
+
     # 2. --- Delegate to the Model's Delete Method ---
     # The Post.delete method already contains the necessary permission check
     # to ensure the requesting user is the owner of the post.
@@ -31,6 +39,13 @@ def delete_post_service(session: Session, post_public_id: UUID, requesting_user_
             post_id=post_to_delete.id, 
             requesting_user_id=requesting_user_id
         )
+        if was_deleted:
+            # 3. --- Prune the post from the home timelines it was fanned out to ---
+            remove_post_from_timelines(session, post_to_delete)
+            remove_post_from_public_feed(session, post_to_delete)
+            invalidate_cached_posts(session, [post_to_delete.id])
+            adjust_counts(session, {key: -1 for key in post_counter_keys(post_to_delete)})
+            adjust_post_hashtags(session, post_to_delete, old_tag_names, set())
         return was_deleted
     except PermissionDeniedError:
         # Re-raise the specific error to be handled by the API layer.
@@ -1,66 +1,118 @@
-import math
+import heapq
+from datetime import datetime, timezone
+from flask import current_app
 from sqlalchemy.orm import Session
-from sqlalchemy import func, select, or_, and_, literal
-from sqlalchemy.orm import joinedload
-from app.extensions import db
-from app.models import Post, Follower, PostLike
-from utils.model_utils.enums import PostVisibility
+from sqlalchemy import select
+from app.models import Post, Follower
+from app.services.redis.timeline_operation import (
+    get_timeline_page, get_author_recent_posts, get_pull_author_ids, increment_timeline_metrics
+)
+from app.services.post.timeline_service import rebuild_timeline, FOLLOWER_VISIBLE
+from app.services.post.post_cache_service import get_many, apply_liked_overlay
+from app.services.counts.count_service import COUNT_NONE, page_totals
+from utils.app_utils.pagination_utils import encode_cursor, decode_cursor
 
-def get_post_feed_service(session: Session, user_id: int, page: int, per_page: int) -> dict:
+
+def _get_followed_pull_authors(session: Session, user_id: int) -> list[int]:
+    """Returns the pull (high-follower) authors that the user follows."""
+    pull_author_ids = get_pull_author_ids()
+    if not pull_author_ids:
+        return []
+    query = select(Follower.followed_id).where(
+        Follower.follower_id == user_id, Follower.followed_id.in_(pull_author_ids)
+    )
+    return list(session.execute(query).scalars().all())
+
+
+def _merge_entries(*sources: list[tuple[int, float]]) -> list[tuple[int, float]]:
     """
-    Handles all business logic for fetching a user's personalized post feed.
+    K-way merges newest-first (post_id, score) lists into one newest-first list.
+    A post can appear in several sources (e.g. pushed before its author crossed the
+    fan-out threshold), so duplicates are dropped.
     """
-    # 1. --- Subquery to check if the requester has liked each post ---
-    is_liked_subquery = (
-        select(literal(True))
-        .where(and_(PostLike.post_id == Post.id, PostLike.user_id == user_id))
-        .exists()
-        .label("is_liked_by_requester")
-    )
+    merged = []
+    seen = set()
+    for post_id, score in heapq.merge(*sources, key=lambda entry: (entry[1], entry[0]), reverse=True):
+        if post_id not in seen:
+            seen.add(post_id)
+            merged.append((post_id, score))
+    return merged
 
-    # 2. --- Subquery to get IDs of users the requester follows ---
-    followed_users_subquery = select(Follower.followed_id).where(Follower.follower_id == user_id).scalar_subquery()
-
-    # 3. --- Define the conditions for the feed using the subquery ---
-    final_filter = or_(
-        # Condition 1: User's own posts (any visibility is allowed)
-        Post.user_id == user_id,
-        
-        # Condition 2: Followed users' posts (public or followers-only)
-        and_(
-            Post.user_id.in_(followed_users_subquery),
-            Post.visibility.in_([PostVisibility.PUBLIC, PostVisibility.FOLLOWERS_ONLY])
-        )
-    )
-    
-    # 4. --- Build the main query for posts ---
-    base_query = select(Post, is_liked_subquery).where(final_filter)
-
-    # 5. --- Calculate pagination ---
-    count_query = select(func.count(Post.id)).select_from(Post).where(final_filter)
-    total_items = session.execute(count_query).scalar() or 0
-    total_pages = math.ceil(total_items / per_page) if per_page > 0 else 0
-
-    # 6. --- Fetch the paginated posts ---
-    posts_query = (
-        base_query
-        .options(joinedload(Post.user), joinedload(Post.hashtags))
-        .order_by(Post.created_at.desc())
-        .limit(per_page)
-        .offset((page - 1) * per_page)
-    )
-    results = session.execute(posts_query).unique().all()
-    
-    posts = []
-    for post, is_liked in results:
-        post.is_liked_by_requester = is_liked
-        post.comment_preview = []
-        posts.append(post)
 
+def get_following_feed_service(
+    session: Session, user_id: int, page: int, per_page: int, cursor: str | None = None, count_mode: str | None = None
+) -> dict:
+    """
+    Handles all business logic for fetching a user's personalized post feed
+    (their own posts plus posts from the users they follow).
+
+    Post ids are read from the user's Redis timeline (push) and merged with the recent posts
+    of followed high-follower authors (pull), then hydrated from the post cache.
+    If the timeline is missing (new user, expired, Redis flushed) it is rebuilt from Postgres.
+    The total is the timeline length, which is already known and needs no count query.
+    """
+    ttl_seconds = current_app.config['TIMELINE_TTL_SECONDS']
+    offset = (page - 1) * per_page
+    before = None # The cursor's (score, post_id); posts sharing a score are ordered by id, as in SQL
+    if cursor:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        before = (cursor_created_at.timestamp(), cursor_id)
+
+    pull_author_ids = _get_followed_pull_authors(session, user_id)
+
+    # When pull sources have to be merged in, every source is read from its newest entry
+    # (or from the cursor) and the page offset is applied after the merge.
+    read_offset = 0 if pull_author_ids else offset
+    read_count = per_page + 1 + (offset if pull_author_ids and before is None else 0)
+
+    # 1. --- Read post ids from the timeline ---
+    timeline_page = get_timeline_page(user_id, read_count, ttl_seconds, offset=read_offset, before=before)
+    if timeline_page is None:
+        all_entries = rebuild_timeline(session, user_id)
+        timeline_length = len(all_entries)
+        if before is not None:
+            entries = [(post_id, score) for post_id, score in all_entries if (score, post_id) < before][:read_count]
+        else:
+            entries = all_entries[read_offset:read_offset + read_count]
+    else:
+        entries, timeline_length = timeline_page
+
+    # 2. --- Merge in the recent posts of followed pull authors ---
+    if pull_author_ids:
+        author_entries = get_author_recent_posts(pull_author_ids, read_count, before=before)
+        entries = _merge_entries(entries, *author_entries.values())
+        if before is None:
+            entries = entries[offset:]
+        entries = entries[:per_page + 1]
+        increment_timeline_metrics(pull_reads=1, pull_entries=sum(len(author_list) for author_list in author_entries.values()))
+
+    has_more = len(entries) > per_page
+    entries = entries[:per_page]
+    post_ids = [post_id for post_id, _ in entries]
+
+    # 3. --- Drop posts that were deleted or made private since fan-out ---
+    visible_versions = {}
+    if post_ids:
+        rows_query = select(Post.id, Post.updated_at, Post.user_id, Post.visibility).where(Post.id.in_(post_ids))
+        for row in session.execute(rows_query).all():
+            if row.user_id == user_id or row.visibility in FOLLOWER_VISIBLE:
+                visible_versions[row.id] = row.updated_at
+
+    # 4. --- Hydrate the posts from the post cache and overlay the user's liked status ---
+    bodies = get_many(session, post_ids, versions=visible_versions)
+    apply_liked_overlay(session, user_id, bodies)
+    posts = [bodies[post_id] for post_id in post_ids if post_id in bodies]
+
+    next_cursor = None
+    if has_more and entries:
+        last_post_id, last_score = entries[-1]
+        next_cursor = encode_cursor(datetime.fromtimestamp(last_score, tz=timezone.utc), last_post_id)
+
+    total_items, total_pages = page_totals(None if count_mode == COUNT_NONE else timeline_length, per_page)
     return {
         "posts": posts,
         "totalPages": total_pages,
         "currentPage": page,
-        "totalItems": total_items
+        "totalItems": total_items,
+        "nextCursor": next_cursor
     }
-
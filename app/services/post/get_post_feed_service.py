@@ -1,55 +1,108 @@
-import math
+from datetime import datetime, timezone
 from sqlalchemy.orm import Session
-from sqlalchemy import func, select, or_, and_, literal
-from sqlalchemy.orm import joinedload
-from app.extensions import db
-from app.models import Post, Follower, PostLike
+from sqlalchemy import select, tuple_
+from app.models import Post
+from app.services.redis.public_feed_operation import get_public_page
+from app.services.post.public_feed_service import rebuild_public_feed, get_public_feed_payloads
+from app.services.post.post_cache_service import get_many, apply_liked_overlay
+from app.services.counts.count_service import COUNT_ESTIMATED, resolve_count, page_totals, public_posts_counter
 from utils.model_utils.enums import PostVisibility
+from utils.app_utils.pagination_utils import encode_cursor, decode_cursor
 
-def get_post_feed_service(session: Session, user_id: int, page: int, per_page: int) -> dict:
+
+def _get_uncached_page(session: Session, page: int, per_page: int, cursor: str | None) -> tuple[dict[int, dict], str | None]:
     """
-    Handles all business logic for fetching a user's personalized post feed.
+    Fetches a page of public posts straight from Postgres, for pages older than the ring buffer.
+    If a cursor is given the page is fetched by keyset on (created_at, id),
+    otherwise the page number is used as a LIMIT/OFFSET fallback.
     """
-    # 1. --- Build the subquery to check if the user has liked each post ---
-    is_liked_subquery = (
-        select(literal(True))
-        .where(PostLike.post_id == Post.id)
-        .where(PostLike.user_id == user_id)
-        .exists().label("is_liked_by_requester")
+    posts_query = (
+        select(Post.id, Post.created_at, Post.updated_at)
+        .where(Post.visibility == PostVisibility.PUBLIC)
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .limit(per_page + 1)
     )
+    if cursor:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        posts_query = posts_query.where(tuple_(Post.created_at, Post.id) < tuple_(cursor_created_at, cursor_id))
+    else:
+        posts_query = posts_query.offset((page - 1) * per_page)
 
-    # 2. --- Build the main query for posts ---
-    visibility_condition = (Post.visibility == PostVisibility.PUBLIC)
-    
-    base_query = select(Post, is_liked_subquery).where(
-        visibility_condition
-    )
-    # 3. --- Calculate pagination ---
-    count_query = select(func.count(Post.id)).where(visibility_condition)
-    total_items = session.execute(count_query).scalar() or 0
-    total_pages = math.ceil(total_items / per_page) if per_page > 0 else 0
+    rows = session.execute(posts_query).all()
 
-    # 4. --- Fetch the paginated posts ---
-    posts_query = (
-        base_query
-        .options(joinedload(Post.user), joinedload(Post.hashtags))
-        .order_by(Post.created_at.desc())
-        .limit(per_page)
-        .offset((page - 1) * per_page)
+    # The extra row only tells us whether another page exists.
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    bodies = get_many(session, [row.id for row in rows], versions={row.id: row.updated_at for row in rows})
+    payloads = {row.id: bodies[row.id] for row in rows if row.id in bodies}
+    next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id) if has_more and rows else None
+    return payloads, next_cursor
+
+
+def get_post_feed_service(
+    session: Session, user_id: int, page: int, per_page: int, cursor: str | None = None, count_mode: str | None = None
+) -> dict:
+    """
+    Handles all business logic for fetching the public post feed.
+
+    The feed is the same for every viewer, so post ids are read from a shared Redis ring buffer
+    and the serialized posts from the shared post cache. Only the viewer's liked status is
+    computed per request. Pages older than the ring buffer are read from Postgres.
+    The total defaults to the planner's estimate, as counting every public post is expensive.
+    """
+    offset = (page - 1) * per_page
+    before = None
+    if cursor:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        before = (cursor_created_at.timestamp(), cursor_id)
+
+    # 1. --- Calculate pagination ---
+    public_posts_query = select(Post.id).where(Post.visibility == PostVisibility.PUBLIC)
+    total_items, total_pages = page_totals(
+        resolve_count(session, count_mode or COUNT_ESTIMATED, public_posts_query, counters={public_posts_counter(): public_posts_query}),
+        per_page
     )
-    results = session.execute(posts_query).unique().all()
-    
-    posts = []
-    for post, is_liked in results:
-        post.is_liked_by_requester = is_liked
-        post.comment_preview = []
-        posts.append(post)
 
-    # 5. --- Fetch comment previews for the posts ---
+    # 2. --- Read post ids from the ring buffer ---
+    ring_page = get_public_page(per_page + 1, offset=offset, before=before)
+    if ring_page is None:
+        all_entries, ring_complete = rebuild_public_feed(session)
+        if before is not None:
+            entries = [(post_id, score) for post_id, score in all_entries if (score, post_id) < before][:per_page + 1]
+        else:
+            entries = all_entries[offset:offset + per_page + 1]
+    else:
+        entries, ring_complete = ring_page
+
+    # 3. --- A ring that does not hold every public post cannot end the feed; older pages come from Postgres ---
+    if not ring_complete and len(entries) <= per_page:
+        payloads, next_cursor = _get_uncached_page(session, page, per_page, cursor)
+        apply_liked_overlay(session, user_id, payloads)
+        return {
+            "posts": list(payloads.values()),
+            "totalPages": total_pages,
+            "currentPage": page,
+            "totalItems": total_items,
+            "nextCursor": next_cursor
+        }
+
+    has_more = len(entries) > per_page
+    entries = entries[:per_page]
+    post_ids = [post_id for post_id, _ in entries]
+
+    # 4. --- Load the shared post bodies and overlay the viewer's liked status ---
+    payloads = get_public_feed_payloads(session, post_ids)
+    apply_liked_overlay(session, user_id, payloads)
+
+    next_cursor = None
+    if has_more and entries:
+        last_post_id, last_score = entries[-1]
+        next_cursor = encode_cursor(datetime.fromtimestamp(last_score, tz=timezone.utc), last_post_id)
 
     return {
-        "posts": posts,
+        "posts": [payloads[post_id] for post_id in post_ids if post_id in payloads],
         "totalPages": total_pages,
         "currentPage": page,
-        "totalItems": total_items
-    }
\ No newline at end of file
+        "totalItems": total_items,
+        "nextCursor": next_cursor
+    }
@@ -1,66 +1,52 @@
-from sqlalchemy import select, literal, exists, and_
-from sqlalchemy.orm import Session, joinedload
-from app.models import Post, Hashtag, User, Follower, PostLike # Import PostLike
+from sqlalchemy import select, exists, and_
+from sqlalchemy.orm import Session
+from app.models import Post, Follower
 from app.exceptions import PostNotFoundError, PermissionDeniedError
+from app.services.post.post_cache_service import get_many, apply_liked_overlay
 from uuid import UUID
 from utils.model_utils.enums import PostVisibility
 
-def get_post_by_public_id_service(session: Session, post_public_id: UUID, requesting_user_id: int | None) -> Post:
+def get_post_by_public_id_service(session: Session, post_public_id: UUID, requesting_user_id: int | None) -> dict:
     """
-    Handles fetching a single post, including whether the current user has liked it.
+    Handles fetching a single serialized post, including whether the current user has liked it.
+    Only the columns needed for the visibility check are queried; the body comes from the post cache.
     """
     # --- QUERY LOGIC ---
+    query = select(Post.id, Post.user_id, Post.visibility, Post.updated_at).filter(Post.public_id == post_public_id)
+    post = session.execute(query).first()
 
-    # Define the fields to select. We always want the Post object.
-    query_fields = [Post]
+    if not post:
+        raise PostNotFoundError("Post not found.")
 
-    # If a user is logged in, create a subquery to check if they've liked the post.
-    if requesting_user_id:
-        is_liked_subquery = (
-            select(literal(True))
-            .where(PostLike.post_id == Post.id)
-            .where(PostLike.user_id == requesting_user_id)
-            .exists()
-        )
-        query_fields.append(is_liked_subquery.label("is_liked_by_requester"))
+    # The visibility check logic remains unchanged and operates on the selected columns.
+    if not can_view_post(session, post, requesting_user_id):
+        if requesting_user_id is None:
+            raise PermissionDeniedError("You must be logged in to view this post.")
+        raise PermissionDeniedError("You do not have permission to view this post.")
 
-    # Build the main query using the selected fields.
-    query = (
-        select(*query_fields)
-        .options(joinedload(Post.user), joinedload(Post.hashtags))
-        .filter(Post.public_id == post_public_id)
-    )
-    
-    # Execute the query to get a single result row.
-    result_row = session.execute(query).first()
-    
-    if not result_row:
+    bodies = get_many(session, [post.id], versions={post.id: post.updated_at})
+    if post.id not in bodies:
         raise PostNotFoundError("Post not found.")
+    apply_liked_overlay(session, requesting_user_id, bodies)
+    return bodies[post.id]
 
-    # Process the result: extract the post and attach the 'is_liked' status.
-    post = result_row[0]
-    if requesting_user_id:
-        post.is_liked_by_requester = result_row.is_liked_by_requester
-    
 
-    # The visibility check logic remains unchanged and now operates on the post object.
+def can_view_post(session: Session, post, requesting_user_id: int | None) -> bool:
+    """Checks whether the requesting user may see a post with the given visibility."""
     if post.visibility == PostVisibility.PUBLIC:
-        return post
+        return True
 
     if requesting_user_id is None:
-        raise PermissionDeniedError("You must be logged in to view this post.")
-        
+        return False
+
     if post.user_id == requesting_user_id:
-        return post
-        
+        return True
+
     if post.visibility == PostVisibility.FOLLOWERS_ONLY:
-        is_follower = session.query(
+        return session.query(
             exists().where(
                 and_(Follower.follower_id == requesting_user_id, Follower.followed_id == post.user_id)
             )
         ).scalar()
-        
-        if is_follower:
-            return post
 
-    raise PermissionDeniedError("You do not have permission to view this post.")
\ No newline at end of file
+    return False
@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta, timezone
+import numpy as np
+from flask import current_app
+from sqlalchemy import select, func, union
+from sqlalchemy.orm import Session
+from app.models import Post, PostLike, Follower
+from app.services.post.post_cache_service import get_many, apply_liked_overlay
+from app.services.post.ranking import score_candidates, top_k, POST_TYPE_BOOST
+from app.services.post.timeline_service import FOLLOWER_VISIBLE
+from app.services.counts.count_service import COUNT_NONE, page_totals
+from utils.model_utils.enums import PostVisibility
+
+
+def _get_candidates(session: Session, user_id: int, since: datetime, limit: int) -> list:
+    """
+    Pulls the candidate set: recent posts from followed users plus the most liked recent public posts.
+    Only the columns needed for scoring are selected.
+    """
+    followed_users = select(Follower.followed_id).where(Follower.follower_id == user_id).scalar_subquery()
+    columns = (Post.id, Post.user_id, Post.created_at, Post.updated_at, Post.like_count, Post.post_type)
+
+    followed_posts = (
+        select(*columns)
+        .where(Post.user_id.in_(followed_users), Post.visibility.in_(FOLLOWER_VISIBLE), Post.created_at >= since)
+        .order_by(Post.created_at.desc())
+        .limit(limit)
+    )
+    popular_posts = (
+        select(*columns)
+        .where(Post.visibility == PostVisibility.PUBLIC, Post.created_at >= since, Post.user_id != user_id)
+        .order_by(Post.like_count.desc())
+        .limit(limit)
+    )
+    # UNION also removes posts that are in both sources.
+    return session.execute(union(followed_posts.subquery().select(), popular_posts.subquery().select())).all()
+
+
+def _get_author_affinity(session: Session, user_id: int, author_ids: list[int], since: datetime) -> tuple[dict[int, int], set[int]]:
+    """
+    Returns how many posts of each author the user liked since the given time,
+    and which of the authors the user follows.
+    """
+    likes_query = (
+        select(Post.user_id, func.count())
+        .select_from(PostLike)
+        .join(Post, Post.id == PostLike.post_id)
+        .where(PostLike.user_id == user_id, PostLike.created_at >= since, Post.user_id.in_(author_ids))
+        .group_by(Post.user_id)
+    )
+    author_likes = dict(session.execute(likes_query).all())
+
+    followed_query = select(Follower.followed_id).where(Follower.follower_id == user_id, Follower.followed_id.in_(author_ids))
+    followed_ids = set(session.execute(followed_query).scalars().all())
+    return author_likes, followed_ids
+
+
+def get_ranked_feed_service(
+    session: Session, user_id: int, page: int, per_page: int, cursor: str | None = None, count_mode: str | None = None
+) -> dict:
+    """
+    Handles all business logic for the ranked ("For You") feed.
+
+    A candidate set of recent followed and popular public posts is scored in one vectorized
+    pass (like velocity, recency decay, author affinity, post type) and the top
+    page * per_page posts are kept. Ranking is recomputed per request, so only page-number
+    pagination is supported.
+    """
+    if cursor:
+        raise ValueError("Cursor pagination is not supported for the ranked feed.")
+
+    config = current_app.config
+    now = datetime.now(timezone.utc)
+    since = now - timedelta(hours=config['RANKED_FEED_WINDOW_HOURS'])
+
+    # 1. --- Pull the candidate set ---
+    candidates = _get_candidates(session, user_id, since, config['RANKED_FEED_CANDIDATES_PER_SOURCE'])
+
+    # 2. --- Gather the viewer's affinity to the candidates' authors ---
+    author_ids = list({row.user_id for row in candidates})
+    author_likes, followed_ids = _get_author_affinity(
+        session, user_id, author_ids, now - timedelta(days=config['RANKED_FEED_AFFINITY_DAYS'])
+    ) if author_ids else ({}, set())
+
+    # 3. --- Score every candidate in one vectorized pass and keep the top of the list ---
+    scores = score_candidates(
+        like_counts=np.fromiter((row.like_count for row in candidates), dtype=np.float64, count=len(candidates)),
+        age_hours=np.fromiter(((now - row.created_at).total_seconds() / 3600 for row in candidates), dtype=np.float64, count=len(candidates)),
+        author_like_counts=np.fromiter((author_likes.get(row.user_id, 0) for row in candidates), dtype=np.float64, count=len(candidates)),
+        is_followed=np.fromiter((row.user_id in followed_ids for row in candidates), dtype=np.float64, count=len(candidates)),
+        type_boosts=np.fromiter((POST_TYPE_BOOST.get(row.post_type, 0.0) for row in candidates), dtype=np.float64, count=len(candidates)),
+    )
+    offset = (page - 1) * per_page
+    page_rows = [candidates[index] for index in top_k(scores, offset + per_page)[offset:]]
+
+    # 4. --- Hydrate from the post cache and overlay the viewer's liked status ---
+    bodies = get_many(session, [row.id for row in page_rows], versions={row.id: row.updated_at for row in page_rows})
+    apply_liked_overlay(session, user_id, bodies)
+
+    total_items, total_pages = page_totals(None if count_mode == COUNT_NONE else len(candidates), per_page)
+    return {
+        "posts": [bodies[row.id] for row in page_rows if row.id in bodies],
+        "totalPages": total_pages,
+        "currentPage": page,
+        "totalItems": total_items,
+        "nextCursor": None
+    }
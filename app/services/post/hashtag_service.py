@@ -0,0 +1,50 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session, make_transient_to_detached
+from app.models import Hashtag
+from utils.app_utils.lru_cache import LRUCache
+
+# This service layer resolves hashtag names to Hashtag rows for create and update post.
+# Hashtag rows are never renamed or deleted (deleting a post only removes its post_hashtags
+# rows), so tag_name -> id is cached in-process; a post whose tags are all cached attaches
+# them without any query.
+
+_tag_id_cache = LRUCache(maxsize=10000)
+
+
+def _attach_cached(session: Session, hashtag_id: int, tag_name: str) -> Hashtag:
+    """Attaches a known hashtag to the session as a persistent object without loading it."""
+    hashtag = Hashtag(id=hashtag_id, tag_name=tag_name)
+    make_transient_to_detached(hashtag)
+    return session.merge(hashtag, load=False)
+
+
+def resolve_hashtags(session: Session, tag_names: list[str]) -> list[Hashtag]:
+    """
+    Returns the Hashtag rows for the given names, creating missing ones in bulk.
+    Raises ValueError for empty or over-long names.
+    """
+    clean_tags = Hashtag.normalize_tag_names(tag_names)
+    cached_ids = {clean_tag: _tag_id_cache.get(clean_tag) for clean_tag in clean_tags}
+
+    missing_tags = [clean_tag for clean_tag, hashtag_id in cached_ids.items() if hashtag_id is None]
+    resolved = {hashtag.tag_name: hashtag for hashtag in Hashtag.upsert_many(session, missing_tags)}
+    for tag_name, hashtag in resolved.items():
+        # A tag created in this transaction would be rolled back with it, so it is cached next time.
+        if not hashtag.was_created:
+            _tag_id_cache.set(tag_name, hashtag.id)
+
+    return [
+        resolved[clean_tag] if clean_tag in resolved else _attach_cached(session, cached_ids[clean_tag], clean_tag)
+        for clean_tag in clean_tags
+    ]
+
+
+def get_hashtag_id(session: Session, tag_name: str) -> int | None:
+    """Returns the id of an existing hashtag, or None if the tag was never used."""
+    clean_tag = tag_name.strip().lower()
+    hashtag_id = _tag_id_cache.get(clean_tag)
+    if hashtag_id is None:
+        hashtag_id = session.execute(select(Hashtag.id).where(Hashtag.tag_name == clean_tag)).scalar_one_or_none()
+        if hashtag_id is not None:
+            _tag_id_cache.set(clean_tag, hashtag_id)
+    return hashtag_id
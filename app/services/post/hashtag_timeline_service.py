@@ -0,0 +1,70 @@
+from sqlalchemy import select, exists, and_, or_, tuple_
+from sqlalchemy.orm import Session, aliased
+from app.models import Post, PostHashtag, Follower
+from app.services.post.hashtag_service import get_hashtag_id
+from app.services.post.post_cache_service import get_many, apply_liked_overlay
+from utils.app_utils.pagination_utils import encode_cursor, decode_cursor
+from utils.model_utils.enums import PostVisibility
+
+
+def get_hashtag_posts_service(
+    session: Session, tag_name: str, requesting_user_id: int | None, per_page: int, cursor: str | None = None
+) -> dict:
+    """
+    Fetches a page of serialized posts with the given hashtag, newest first.
+
+    The page is read from post_hashtags alone through its (hashtag_id, created_at DESC, post_id DESC)
+    index, with keyset pagination on (created_at, post_id), so it costs the same for any tag size
+    and page depth. Public posts are answered from the index; only non-public rows are checked
+    against the post's author (the requester's own posts, or followers-only posts of followed users).
+    """
+    hashtag_id = get_hashtag_id(session, tag_name)
+    if hashtag_id is None:
+        return {"posts": [], "nextCursor": None}
+    return get_tagged_posts(session, [hashtag_id], requesting_user_id, per_page, cursor)
+
+
+def get_tagged_posts(
+    session: Session, hashtag_ids: list[int], requesting_user_id: int | None, per_page: int, cursor: str | None = None
+) -> dict:
+    """
+    Fetches a page of serialized posts carrying all of the given hashtags, newest first.
+    The index range of the first hashtag drives the scan; the others are checked per row.
+    """
+    visibility_condition = PostHashtag.visibility == PostVisibility.PUBLIC
+    if requesting_user_id is not None:
+        followed_users = select(Follower.followed_id).where(Follower.follower_id == requesting_user_id)
+        visible_to_requester = exists().where(
+            Post.id == PostHashtag.post_id,
+            or_(
+                Post.user_id == requesting_user_id,
+                and_(Post.visibility == PostVisibility.FOLLOWERS_ONLY, Post.user_id.in_(followed_users))
+            )
+        )
+        visibility_condition = or_(visibility_condition, visible_to_requester)
+
+    other_tags = aliased(PostHashtag)
+    query = (
+        select(PostHashtag.post_id, PostHashtag.created_at)
+        .where(PostHashtag.hashtag_id == hashtag_ids[0], visibility_condition)
+        .order_by(PostHashtag.created_at.desc(), PostHashtag.post_id.desc())
+        .limit(per_page + 1)
+    )
+    for hashtag_id in hashtag_ids[1:]:
+        query = query.where(exists().where(other_tags.post_id == PostHashtag.post_id, other_tags.hashtag_id == hashtag_id))
+    if cursor:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        query = query.where(tuple_(PostHashtag.created_at, PostHashtag.post_id) < tuple_(cursor_created_at, cursor_id))
+
+    results = session.execute(query).all()
+    has_more = len(results) > per_page
+    results = results[:per_page]
+
+    bodies = get_many(session, [row.post_id for row in results])
+    apply_liked_overlay(session, requesting_user_id, bodies)
+    next_cursor = encode_cursor(results[-1].created_at, results[-1].post_id) if has_more and results else None
+
+    return {
+        "posts": [bodies[row.post_id] for row in results if row.post_id in bodies],
+        "nextCursor": next_cursor
+    }
@@ -0,0 +1,64 @@
+from flask import current_app
+from sqlalchemy import select, bindparam, any_, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+from app.models import PostLike
+from app.services.outbox.outbox_service import run_after_commit
+from app.services.redis.liked_set_operation import (
+    get_liked_flags, get_liked_set_generation, replace_liked_set, add_liked_post, remove_liked_post
+)
+
+# This service layer answers "which of these N post ids has user U liked" for every post list.
+# It replaces the per-row correlated EXISTS subplans with one lookup per page, served from a
+# per-user Redis set of liked post ids when it is materialized, otherwise from post_likes.
+# Likes and unlikes patch the set once they commit; a set loaded while one was in flight
+# is discarded instead of stored (see liked_set_operation).
+
+
+def _query_liked_post_ids(session: Session, user_id: int, post_ids: list[int]) -> set[int]:
+    """Runs a single 'post_id = ANY(:post_ids)' lookup against post_likes."""
+    query = select(PostLike.post_id).where(
+        PostLike.user_id == user_id,
+        PostLike.post_id == any_(bindparam("post_ids", post_ids, type_=ARRAY(Integer)))
+    )
+    return set(session.execute(query).scalars().all())
+
+
+def _materialize_liked_set(session: Session, user_id: int) -> None:
+    """
+    Loads a user's liked post ids into Redis, or marks the user as too large to cache.
+    The load is bounded, so users with very many likes cost one capped scan per TTL.
+    """
+    config = current_app.config
+    max_size = config['LIKED_SET_MAX_SIZE']
+    # Read before the query, so a like committed after the query's snapshot changes it
+    generation = get_liked_set_generation(user_id)
+    if generation is None:
+        return
+    query = select(PostLike.post_id).where(PostLike.user_id == user_id).limit(max_size + 1)
+    post_ids = list(session.execute(query).scalars().all())
+    replace_liked_set(user_id, post_ids if len(post_ids) <= max_size else None, generation, config['LIKED_SET_TTL_SECONDS'])
+
+
+def record_liked_status(session: Session, user_id: int, post_id: int, is_liked: bool) -> None:
+    """Patches the user's liked set once the like or unlike commits."""
+    update = add_liked_post if is_liked else remove_liked_post
+    run_after_commit(session, update, user_id, post_id, current_app.config['LIKED_SET_TTL_SECONDS'])
+
+
+def get_liked_post_ids(session: Session, user_id: int | None, post_ids: list[int]) -> set[int]:
+    """
+    Returns the subset of post_ids that the user has liked.
+    Anonymous users have liked nothing.
+    """
+    if not user_id or not post_ids:
+        return set()
+
+    flags, needs_materializing = get_liked_flags(user_id, post_ids)
+    if flags is not None:
+        return {post_id for post_id, is_liked in zip(post_ids, flags) if is_liked}
+
+    liked_post_ids = _query_liked_post_ids(session, user_id, post_ids)
+    if needs_materializing:
+        _materialize_liked_set(session, user_id)
+    return liked_post_ids
@@ -0,0 +1,137 @@
+from flask import current_app
+from sqlalchemy import select, func, and_, or_, tuple_
+from sqlalchemy.orm import Session
+from geoalchemy2.functions import ST_DWithin, ST_MakePoint, ST_SetSRID
+from app.models import Post, Follower
+from app.services.post.post_cache_service import get_many, apply_liked_overlay
+from app.services.redis.nearby_cache_operation import get_nearby_page, set_nearby_page
+from utils.app_utils.geohash_utils import encode_geohash, decode_geohash_center
+from utils.app_utils.pagination_utils import encode_cursor, decode_cursor
+from utils.model_utils.enums import PostVisibility
+
+# This service layer finds geo-tagged posts near a point. Posts within the radius are matched with
+# ST_DWithin and ordered nearest first with the KNN operator (<->), both in meters on the geography
+# cast of posts.location, which idx_posts_location_geography serves.
+#
+# The query point is snapped to the center of a geohash tile, so every request from the same tile
+# runs the same query: the first page of public posts is cached per tile in Redis, and only the
+# requester's own and followed users' followers-only posts are queried per request.
+
+# Geohash precisions and the approximate width of their cells in meters.
+_GEOHASH_CELL_METERS = [(5, 4900), (6, 1220), (7, 153), (8, 38)]
+
+
+def _tile_precision(radius: int) -> int:
+    """Picks the coarsest tile at most a quarter of the radius wide, so snapping moves the circle only slightly."""
+    for precision, cell_meters in _GEOHASH_CELL_METERS:
+        if cell_meters * 4 <= radius:
+            return precision
+    return _GEOHASH_CELL_METERS[-1][0]
+
+
+def _nearby_query(point, radius: int, limit: int, cursor: str | None = None):
+    location = func.geography(Post.location)
+    distance = location.op("<->")(point)
+    query = (
+        select(Post.id, Post.updated_at, distance.label("distance"))
+        .where(Post.location.isnot(None), ST_DWithin(location, point, radius))
+        .order_by(distance, Post.id)
+        .limit(limit)
+    )
+    if cursor:
+        cursor_distance, cursor_id = decode_cursor(cursor)
+        query = query.where(tuple_(distance, Post.id) > tuple_(cursor_distance, cursor_id))
+    return query
+
+
+def _followers_only_of_followed(requesting_user_id: int):
+    followed_users = select(Follower.followed_id).where(Follower.follower_id == requesting_user_id)
+    return and_(Post.visibility == PostVisibility.FOLLOWERS_ONLY, Post.user_id.in_(followed_users))
+
+
+def _visible_to(requesting_user_id: int | None):
+    """Public, the requester's own, or followers-only of followed users (as get_post_by_public_id_service)."""
+    if requesting_user_id is None:
+        return Post.visibility == PostVisibility.PUBLIC
+    return or_(
+        Post.visibility == PostVisibility.PUBLIC,
+        Post.user_id == requesting_user_id,
+        _followers_only_of_followed(requesting_user_id)
+    )
+
+
+def _first_page_rows(session: Session, tile: str, point, radius: int, requesting_user_id: int | None, limit: int) -> list[tuple[int, float]]:
+    """Merges the tile's cached public rows with the requester's non-public rows, nearest first."""
+    rows = get_nearby_page(tile, radius, limit)
+    if rows is None:
+        public_query = _nearby_query(point, radius, limit).where(Post.visibility == PostVisibility.PUBLIC)
+        rows = [(row.id, row.distance) for row in session.execute(public_query).all()]
+        set_nearby_page(tile, radius, limit, rows, current_app.config['NEARBY_CACHE_TTL_SECONDS'])
+
+    if requesting_user_id is not None:
+        private_query = _nearby_query(point, radius, limit).where(
+            Post.visibility != PostVisibility.PUBLIC,
+            or_(Post.user_id == requesting_user_id, _followers_only_of_followed(requesting_user_id))
+        )
+        rows = rows + [(row.id, row.distance) for row in session.execute(private_query).all()]
+        rows.sort(key=lambda row: (row[1], row[0]))
+    return rows[:limit]
+
+
+def get_nearby_posts_service(
+    session: Session, latitude: float, longitude: float, radius: int,
+    requesting_user_id: int | None, per_page: int, cursor: str | None = None
+) -> dict:
+    """
+    Returns the posts the requester may see within radius meters of a point, nearest first,
+    with keyset pagination on (distance, id). Each post gets a 'distance' in meters, measured
+    from the center of the point's geohash tile.
+
+    Raises ValueError for invalid coordinates, a radius out of range, or a malformed cursor.
+    """
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        raise ValueError("Invalid latitude or longitude values.")
+    max_radius = current_app.config['NEARBY_MAX_RADIUS_METERS']
+    if not 0 < radius <= max_radius:
+        raise ValueError(f"Radius must be between 1 and {max_radius} meters.")
+
+    # 1. --- Snap the point to its tile ---
+    tile = encode_geohash(latitude, longitude, _tile_precision(radius))
+    tile_latitude, tile_longitude = decode_geohash_center(tile)
+    point = func.geography(ST_SetSRID(ST_MakePoint(tile_longitude, tile_latitude), 4326))
+
+    # 2. --- Find the page: the first from the tile cache, later ones with one visibility-filtered query ---
+    if cursor is None:
+        rows = _first_page_rows(session, tile, point, radius, requesting_user_id, per_page + 1)
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
+        # Cached rows may be stale, so re-check visibility while reading the versions for the post cache
+        page_ids = [post_id for post_id, _ in rows]
+        version_query = select(Post.id, Post.updated_at).where(Post.id.in_(page_ids), _visible_to(requesting_user_id))
+        versions = dict(session.execute(version_query).all()) if page_ids else {}
+    else:
+        query = _nearby_query(point, radius, per_page + 1, cursor).where(_visible_to(requesting_user_id))
+        results = session.execute(query).all()
+        has_more = len(results) > per_page
+        results = results[:per_page]
+        rows = [(row.id, row.distance) for row in results]
+        versions = {row.id: row.updated_at for row in results}
+
+    if not rows:
+        return {"posts": [], "nextCursor": None}
+
+    # 3. --- Hydrate from the post cache ---
+    bodies = get_many(session, [post_id for post_id, _ in rows if post_id in versions], versions=versions)
+    apply_liked_overlay(session, requesting_user_id, bodies)
+    posts = []
+    for post_id, distance in rows:
+        if post_id in bodies:
+            bodies[post_id]["distance"] = round(distance)
+            posts.append(bodies[post_id])
+
+    # The cursor follows the last row found, even if it was dropped while hydrating
+    next_cursor = encode_cursor(rows[-1][1], rows[-1][0]) if has_more else None
+    return {
+        "posts": posts,
+        "nextCursor": next_cursor
+    }
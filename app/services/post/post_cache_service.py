@@ -0,0 +1,111 @@
+import time
+from datetime import datetime
+from flask import current_app
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.models import Post
+from app.services.outbox.outbox_service import run_after_commit
+from app.services.redis.post_cache_operation import get_post_bodies, set_post_bodies, delete_post_bodies
+from app.services.post.liked_status_service import get_liked_post_ids
+from app.services.counters.like_counter_service import apply_pending_like_counts
+from utils.app_utils.lru_cache import LRUCache
+
+# This service layer caches serialized post bodies in two levels: an in-process LRU in
+# front of Redis. Entries are versioned by the post's updated_at, so a body is only served
+# for the exact row version the caller is about to show; a stale entry left in another
+# process's LRU is never returned. Author name and avatar changes do not bump the post's
+# updated_at, so every entry also expires POST_CACHE_TTL_SECONDS after it was built, in
+# both levels. Bodies are shared by all viewers, so 'isLiked' must be applied per request
+# with apply_liked_overlay.
+
+_local_cache = LRUCache(maxsize=4096)
+
+
+def _serialize(post: Post) -> dict:
+    # Imported here because the resources package imports app.services at load time.
+    from app.resources.posts._helper import serialize_post
+    return serialize_post(post)
+
+
+def _version(updated_at: datetime) -> str:
+    return updated_at.isoformat()
+
+
+def get_many(session: Session, post_ids: list[int], versions: dict[int, datetime] | None = None) -> dict[int, dict]:
+    """
+    Returns serialized bodies for the given posts, keyed by post id.
+
+    Arguments:
+        session: The database session.
+        post_ids: The internal ids of the posts.
+        versions: The updated_at of each post, if the caller already selected it. Otherwise
+            it is read with one narrow query. Ids without a version (e.g. deleted posts) are left out.
+
+    Misses in both cache levels are loaded with one query for the posts and their authors,
+    plus one batched query for their hashtags. Unflushed like count changes are added with one more query.
+    Every returned body is a fresh copy that the caller may modify.
+    """
+    if not post_ids:
+        return {}
+    if versions is None:
+        version_query = select(Post.id, Post.updated_at).where(Post.id.in_(post_ids))
+        versions = dict(session.execute(version_query).all())
+    wanted = {post_id: _version(versions[post_id]) for post_id in post_ids if post_id in versions}
+
+    # 1. --- In-process LRU ---
+    now = time.time()
+    bodies = {}
+    for post_id, version in wanted.items():
+        cached = _local_cache.get(post_id)
+        if cached and cached[0] == version and cached[2] > now:
+            bodies[post_id] = cached[1]
+
+    # 2. --- Redis ---
+    remote_ids = [post_id for post_id in wanted if post_id not in bodies]
+    for post_id, entry in get_post_bodies(remote_ids).items():
+        if entry[0] == wanted[post_id] and entry[2] > now:
+            _local_cache.set(post_id, entry)
+            bodies[post_id] = entry[1]
+
+    # 3. --- Postgres, for everything still missing ---
+    missing_ids = [post_id for post_id in wanted if post_id not in bodies]
+    if missing_ids:
+        posts_query = (
+            select(Post)
+            .where(Post.id.in_(missing_ids))
+            .options(*Post.serialization_load_options())
+        )
+        ttl_seconds = current_app.config['POST_CACHE_TTL_SECONDS']
+        loaded = {}
+        for post in session.execute(posts_query).scalars().all():
+            entry = (_version(post.updated_at), _serialize(post), now + ttl_seconds)
+            loaded[post.id] = entry
+            _local_cache.set(post.id, entry)
+            bodies[post.id] = entry[1]
+        set_post_bodies(loaded, ttl_seconds)
+
+    # 4. --- Like counts still waiting for the counter flusher ---
+    bodies = {post_id: dict(body) for post_id, body in bodies.items()}
+    apply_pending_like_counts(session, bodies)
+    return bodies
+
+
+def _drop_cached_posts(post_ids: list[int]) -> None:
+    for post_id in post_ids:
+        _local_cache.delete(post_id)
+    delete_post_bodies(post_ids)
+
+
+def invalidate_cached_posts(session: Session, post_ids: list[int]) -> None:
+    """
+    Drops cached bodies of updated or deleted posts once the transaction commits, so a
+    concurrent reader cannot cache the old row again after the drop.
+    """
+    run_after_commit(session, _drop_cached_posts, list(post_ids))
+
+
+def apply_liked_overlay(session: Session, user_id: int | None, bodies: dict[int, dict]) -> None:
+    """Sets the viewer-specific 'isLiked' flag on shared post bodies with one liked-status lookup."""
+    liked_post_ids = get_liked_post_ids(session, user_id, list(bodies.keys()))
+    for post_id, body in bodies.items():
+        body["isLiked"] = post_id in liked_post_ids
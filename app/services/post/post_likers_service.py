@@ -0,0 +1,68 @@
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+from uuid import UUID
+from app.models import Post, PostLike, User, Follower
+from app.exceptions import PostNotFoundError, PermissionDeniedError
+from app.services.post.get_post_service import can_view_post
+from utils.app_utils.pagination_utils import encode_cursor, decode_cursor
+
+# This service layer lists the users who liked a post, newest likes first. Pages are read from
+# idx_post_likes_post_created_at with keyset pagination on (created_at, user_id), so a page costs
+# the same on a post with millions of likes as on one with ten; no total is counted.
+
+
+def get_post_likers_service(
+    session: Session, post_public_id: UUID, requesting_user_id: int | None, per_page: int, cursor: str | None = None
+) -> dict:
+    """
+    Returns a page of the users who liked a post the requester may see, with whether the requester
+    follows each of them. Raises PostNotFoundError, PermissionDeniedError, or ValueError for a malformed cursor.
+    """
+    post = session.execute(
+        select(Post.id, Post.user_id, Post.visibility).where(Post.public_id == post_public_id)
+    ).first()
+    if not post:
+        raise PostNotFoundError("Post not found.")
+    if not can_view_post(session, post, requesting_user_id):
+        raise PermissionDeniedError("You do not have permission to view this post.")
+
+    # 1. --- The page of likes, with the likers' profile columns ---
+    query = (
+        select(PostLike.user_id, PostLike.created_at, User.username, User.display_name, User.profile_picture_url)
+        .join(User, User.id == PostLike.user_id)
+        .where(PostLike.post_id == post.id)
+        .order_by(PostLike.created_at.desc(), PostLike.user_id.desc())
+        .limit(per_page + 1)
+    )
+    if cursor:
+        cursor_created_at, cursor_user_id = decode_cursor(cursor)
+        query = query.where(tuple_(PostLike.created_at, PostLike.user_id) < tuple_(cursor_created_at, cursor_user_id))
+
+    rows = session.execute(query).all()
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+
+    # 2. --- isFollowing for the whole page in one query ---
+    followed_ids = set()
+    if requesting_user_id is not None and rows:
+        followed_query = select(Follower.followed_id).where(
+            Follower.follower_id == requesting_user_id,
+            Follower.followed_id.in_([row.user_id for row in rows])
+        )
+        followed_ids = set(session.execute(followed_query).scalars().all())
+
+    next_cursor = encode_cursor(rows[-1].created_at, rows[-1].user_id) if has_more else None
+    return {
+        "users": [
+            {
+                "username": row.username,
+                "authorName": row.display_name,
+                "authorAvatarUrl": row.profile_picture_url,
+                "isFollowing": row.user_id in followed_ids,
+                "isSelf": row.user_id == requesting_user_id,
+                "likedAt": row.created_at.isoformat(),
+            }
+            for row in rows
+        ],
+        "nextCursor": next_cursor
+    }
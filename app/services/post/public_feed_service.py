@@ -0,0 +1,57 @@
+from flask import current_app
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.models import Post
+from app.services.outbox.outbox_service import run_after_commit
+from app.services.redis.public_feed_operation import add_public_post, remove_public_posts, replace_public_ring
+from app.services.post.post_cache_service import get_many
+from utils.model_utils.enums import PostVisibility
+
+# This service layer keeps the shared public feed ring buffer in Redis in sync with Postgres.
+# The ring buffer holds the newest public post ids; the serialized posts come from the
+# shared post cache, with the viewer's liked status applied as an overlay on read.
+# Ring writes run once the transaction commits, so a rolled back post is never listed.
+
+
+def add_post_to_public_feed(session: Session, post: Post) -> None:
+    """Adds a post to the public feed ring buffer once the transaction commits, if it is public."""
+    if post.visibility == PostVisibility.PUBLIC:
+        run_after_commit(
+            session, add_public_post, post.id, post.created_at.timestamp(), current_app.config['PUBLIC_FEED_CACHE_LENGTH']
+        )
+
+
+def remove_post_from_public_feed(session: Session, post: Post) -> None:
+    """Removes a post from the public feed ring buffer once the transaction commits."""
+    run_after_commit(session, remove_public_posts, [post.id])
+
+
+def rebuild_public_feed(session: Session) -> tuple[list[tuple[int, float]], bool]:
+    """
+    Rebuilds the public feed ring buffer from Postgres.
+    Returns the (post_id, score) entries, newest first, and whether they are every public post.
+    """
+    cache_length = current_app.config['PUBLIC_FEED_CACHE_LENGTH']
+    query = (
+        select(Post.id, Post.created_at)
+        .where(Post.visibility == PostVisibility.PUBLIC)
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .limit(cache_length + 1)
+    )
+    entries = [(post_id, created_at.timestamp()) for post_id, created_at in session.execute(query).all()]
+    # The extra row only tells us whether older public posts exist.
+    complete = len(entries) <= cache_length
+    entries = entries[:cache_length]
+    replace_public_ring(entries, complete)
+    return entries, complete
+
+
+def get_public_feed_payloads(session: Session, post_ids: list[int]) -> dict[int, dict]:
+    """
+    Returns the shared serialized bodies for the given posts from the post cache.
+    Posts that were deleted or are no longer public are left out.
+    """
+    if not post_ids:
+        return {}
+    version_query = select(Post.id, Post.updated_at).where(Post.id.in_(post_ids), Post.visibility == PostVisibility.PUBLIC)
+    return get_many(session, post_ids, versions=dict(session.execute(version_query).all()))
@@ -0,0 +1,115 @@
+import html
+from sqlalchemy import select, func, cast, and_, or_, tuple_, exists, REAL
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.orm import Session
+from app.models import Post, PostHashtag, Follower
+from app.services.post.hashtag_service import get_hashtag_id
+from app.services.post.hashtag_timeline_service import get_tagged_posts
+from app.services.post.post_cache_service import get_many, apply_liked_overlay
+from utils.app_utils.pagination_utils import encode_cursor, decode_cursor
+from utils.model_utils.enums import PostVisibility
+
+# This service layer searches posts. Words are matched against the generated posts.search_vector
+# (GIN index) and ranked with ts_rank_cd; '#tag' terms are matched through post_hashtags instead,
+# since hashtags are not part of the text. A query of only tags is served newest first from the
+# tag timeline index.
+
+# Highlight markers passed to ts_headline. The snippet is HTML-escaped before they are turned
+# into <mark> tags, so post content can never inject markup.
+_START_SEL, _STOP_SEL = "\x02", "\x03"
+_HEADLINE_OPTIONS = f"StartSel={_START_SEL}, StopSel={_STOP_SEL}, MaxWords=25, MinWords=10, MaxFragments=2, FragmentDelimiter=\" ... \""
+
+
+def _parse_query(query_text: str) -> tuple[str, list[str]]:
+    """Splits a search query into its free text and its '#tag' terms."""
+    words, tag_names = [], []
+    for term in query_text.split():
+        if term.startswith('#') and len(term) > 1:
+            tag_names.append(term[1:])
+        else:
+            words.append(term)
+    return " ".join(words), tag_names
+
+
+def _highlight(snippet: str | None) -> str | None:
+    if snippet is None:
+        return None
+    return html.escape(snippet).replace(_START_SEL, "<mark>").replace(_STOP_SEL, "</mark>")
+
+
+def search_posts_service(
+    session: Session, query_text: str, requesting_user_id: int | None, per_page: int, cursor: str | None = None
+) -> dict:
+    """
+    Searches posts the requester may see (the same rules as get_post_by_public_id_service).
+
+    Text matches are ordered by ts_rank_cd with keyset pagination on (rank, id), and each post
+    gets a 'snippet' with the matched words wrapped in <mark>. Raises ValueError for an empty
+    query or a malformed cursor.
+    """
+    words, tag_names = _parse_query(query_text or "")
+    if not words and not tag_names:
+        raise ValueError("Search query cannot be empty.")
+
+    hashtag_ids = [get_hashtag_id(session, tag_name) for tag_name in tag_names]
+    if None in hashtag_ids: # A tag nobody used cannot match
+        return {"posts": [], "nextCursor": None}
+    if not words:
+        return get_tagged_posts(session, hashtag_ids, requesting_user_id, per_page, cursor)
+
+    # 1. --- Match and rank against the text index ---
+    search_config = cast(Post.SEARCH_CONFIG, REGCONFIG)
+    ts_query = func.websearch_to_tsquery(search_config, words)
+    rank = func.ts_rank_cd(Post.search_vector, ts_query)
+
+    query = (
+        select(Post.id, Post.updated_at, rank.label("rank"))
+        .where(Post.search_vector.op("@@")(ts_query))
+        .order_by(rank.desc(), Post.id.desc())
+        .limit(per_page + 1)
+    )
+
+    # 2. --- Visibility: public, the requester's own, or followers-only of followed users ---
+    if requesting_user_id is None:
+        query = query.where(Post.visibility == PostVisibility.PUBLIC)
+    else:
+        followed_users = select(Follower.followed_id).where(Follower.follower_id == requesting_user_id)
+        query = query.where(or_(
+            Post.visibility == PostVisibility.PUBLIC,
+            Post.user_id == requesting_user_id,
+            and_(Post.visibility == PostVisibility.FOLLOWERS_ONLY, Post.user_id.in_(followed_users))
+        ))
+
+    for hashtag_id in hashtag_ids:
+        query = query.where(exists().where(PostHashtag.post_id == Post.id, PostHashtag.hashtag_id == hashtag_id))
+
+    if cursor:
+        cursor_rank, cursor_id = decode_cursor(cursor)
+        # ts_rank_cd returns a real; compare as a real so the float round trip cannot skip rows
+        query = query.where(tuple_(rank, Post.id) < tuple_(cast(cursor_rank, REAL), cursor_id))
+
+    results = session.execute(query).all()
+    has_more = len(results) > per_page
+    results = results[:per_page]
+    if not results:
+        return {"posts": [], "nextCursor": None}
+
+    # 3. --- Snippets for the page only; ts_headline re-parses the content, so it never runs per match ---
+    page_ids = [row.id for row in results]
+    snippet_query = select(Post.id, func.ts_headline(search_config, Post.content, ts_query, _HEADLINE_OPTIONS)).where(Post.id.in_(page_ids))
+    snippets = dict(session.execute(snippet_query).all())
+
+    # 4. --- Hydrate from the post cache ---
+    bodies = get_many(session, page_ids, versions={row.id: row.updated_at for row in results})
+    apply_liked_overlay(session, requesting_user_id, bodies)
+    posts = []
+    for row in results:
+        if row.id in bodies:
+            bodies[row.id]["snippet"] = _highlight(snippets.get(row.id))
+            posts.append(bodies[row.id])
+
+    next_cursor = encode_cursor(results[-1].rank, results[-1].id) if has_more else None
+    return {
+        "posts": posts,
+        "nextCursor": next_cursor
+    }
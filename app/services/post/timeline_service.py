@@ -0,0 +1,154 @@
+from flask import current_app
+from sqlalchemy import select, or_, and_, func, literal
+from sqlalchemy.orm import Session
+from app.models import Post, Follower
+from app.services.outbox.outbox_service import run_after_commit
+from app.services.redis.timeline_operation import (
+    push_post_to_timelines, push_entries_to_timelines, add_entries_to_timeline, remove_posts_from_timelines, replace_timeline,
+    add_to_author_recent_posts, remove_from_author_recent_posts, get_author_recent_posts, set_pull_author, increment_timeline_metrics
+)
+from utils.model_utils.enums import PostVisibility
+
+# This service layer keeps the per-user home timelines in Redis in sync with Postgres.
+# A timeline is a capped sorted set of post ids scored by the post's creation time.
+# Authors above TIMELINE_FANOUT_FOLLOWER_THRESHOLD are "pull" authors: their posts are
+# not pushed to followers but merged in from their recent-posts list at read time.
+# An author's mode is re-checked whenever they post. One who falls back below the threshold
+# has their newest posts pushed into followers' timelines, as on a new follow, since their
+# posts from the pull period were never pushed and are no longer merged in.
+#
+# The write paths read what they need from Postgres in the caller's transaction, but only
+# change Redis once it commits (run_after_commit), so a rolled back write leaves no ghost ids.
+
+FOLLOWER_VISIBLE = (PostVisibility.PUBLIC, PostVisibility.FOLLOWERS_ONLY)
+
+
+def is_follower_visible(visibility: PostVisibility) -> bool:
+    """Checks whether posts with this visibility belong in followers' timelines."""
+    return visibility in FOLLOWER_VISIBLE
+
+
+def _get_follower_ids(session: Session, user_id: int) -> list[int]:
+    """Returns the ids of every user following the given user."""
+    query = select(Follower.follower_id).where(Follower.followed_id == user_id)
+    return list(session.execute(query).scalars().all())
+
+
+def is_pull_author(session: Session, user_id: int) -> bool:
+    """
+    Checks whether an author has more followers than the fan-out threshold.
+    The count stops at the threshold, so the cost is bounded even for very large accounts.
+    """
+    threshold = current_app.config['TIMELINE_FANOUT_FOLLOWER_THRESHOLD']
+    bounded_followers = select(literal(1)).where(Follower.followed_id == user_id).limit(threshold + 1).subquery()
+    follower_count = session.execute(select(func.count()).select_from(bounded_followers)).scalar() or 0
+    return follower_count > threshold
+
+
+def _push_follower_visible_post(
+    author_id: int, follower_ids: list[int], post_id: int, score: float, pull: bool,
+    max_length: int, recent_length: int, backfill_length: int
+) -> None:
+    """Post-commit half of fan_out_post for a public or followers-only post."""
+    # Every author keeps a recent-posts list, so that becoming a pull author needs no backfill.
+    add_to_author_recent_posts(author_id, post_id, score, recent_length)
+    if set_pull_author(author_id, pull) and not pull:
+        # Back to push: the recent-posts list holds the posts of the pull period
+        recent_entries = get_author_recent_posts([author_id], backfill_length).get(author_id, [])
+        push_entries_to_timelines(follower_ids, recent_entries, max_length)
+        increment_timeline_metrics(pull_to_push_backfills=1)
+    push_post_to_timelines([author_id] + follower_ids, post_id, score, max_length)
+    if pull:
+        increment_timeline_metrics(pull_posts=1)
+    else:
+        increment_timeline_metrics(push_posts=1, push_deliveries=len(follower_ids))
+
+
+def _remove_post(author_id: int, recipient_ids: list[int], post_id: int) -> None:
+    """Post-commit half of remove_post_from_timelines."""
+    remove_from_author_recent_posts(author_id, [post_id])
+    remove_posts_from_timelines(recipient_ids, [post_id])
+
+
+def fan_out_post(session: Session, post: Post) -> None:
+    """
+    Pushes a newly created post into its author's timeline and, unless the post is
+    private, either into the timeline of every follower (push) or into the author's
+    recent-posts list for read-time merging (pull), once the transaction commits.
+    The post must be flushed.
+    """
+    config = current_app.config
+    post_id, author_id, score = post.id, post.user_id, post.created_at.timestamp()
+
+    if not is_follower_visible(post.visibility):
+        run_after_commit(session, push_post_to_timelines, [author_id], post_id, score, config['TIMELINE_MAX_LENGTH'])
+        return
+
+    pull = is_pull_author(session, author_id)
+    follower_ids = [] if pull else _get_follower_ids(session, author_id)
+    run_after_commit(
+        session, _push_follower_visible_post, author_id, follower_ids, post_id, score, pull,
+        config['TIMELINE_MAX_LENGTH'], config['AUTHOR_RECENT_POSTS_LENGTH'], config['TIMELINE_FOLLOW_BACKFILL']
+    )
+
+
+def remove_post_from_timelines(session: Session, post: Post) -> None:
+    """
+    Removes a post from its author's timeline, recent-posts list and the timelines of all
+    followers, once the transaction commits.
+    """
+    recipient_ids = [post.user_id]
+    # Pull authors' posts are not in follower timelines; deleted ids left over from
+    # before the author crossed the threshold are dropped at hydration time.
+    if not is_pull_author(session, post.user_id):
+        recipient_ids += _get_follower_ids(session, post.user_id)
+    run_after_commit(session, _remove_post, post.user_id, recipient_ids, post.id)
+
+
+def prune_author_from_timeline(session: Session, follower_id: int, author_id: int) -> None:
+    """Removes an author's recent posts from a follower's timeline after an unfollow commits."""
+    query = (
+        select(Post.id)
+        .where(Post.user_id == author_id)
+        .order_by(Post.created_at.desc())
+        .limit(current_app.config['TIMELINE_MAX_LENGTH'])
+    )
+    post_ids = list(session.execute(query).scalars().all())
+    run_after_commit(session, remove_posts_from_timelines, [follower_id], post_ids)
+
+
+def backfill_author_into_timeline(session: Session, follower_id: int, author_id: int) -> None:
+    """Copies an author's most recent visible posts into a follower's timeline after a follow commits."""
+    if is_pull_author(session, author_id):
+        return # Merged in at read time instead
+    query = (
+        select(Post.id, Post.created_at)
+        .where(Post.user_id == author_id, Post.visibility.in_(FOLLOWER_VISIBLE))
+        .order_by(Post.created_at.desc())
+        .limit(current_app.config['TIMELINE_FOLLOW_BACKFILL'])
+    )
+    entries = [(post_id, created_at.timestamp()) for post_id, created_at in session.execute(query).all()]
+    run_after_commit(session, add_entries_to_timeline, follower_id, entries, current_app.config['TIMELINE_MAX_LENGTH'])
+
+
+def rebuild_timeline(session: Session, user_id: int) -> list[tuple[int, float]]:
+    """
+    Rebuilds a user's timeline from Postgres and stores it in Redis.
+    Returns the (post_id, score) entries, newest first.
+    """
+    followed_users_subquery = select(Follower.followed_id).where(Follower.follower_id == user_id).scalar_subquery()
+    feed_filter = or_(
+        # User's own posts (any visibility is allowed)
+        Post.user_id == user_id,
+        # Followed users' posts (public or followers-only)
+        and_(Post.user_id.in_(followed_users_subquery), Post.visibility.in_(FOLLOWER_VISIBLE))
+    )
+    query = (
+        select(Post.id, Post.created_at)
+        .where(feed_filter)
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .limit(current_app.config['TIMELINE_MAX_LENGTH'])
+    )
+    entries = [(post_id, created_at.timestamp()) for post_id, created_at in session.execute(query).all()]
+    replace_timeline(user_id, entries, current_app.config['TIMELINE_TTL_SECONDS'])
+    return entries
@@ -0,0 +1,113 @@
+import heapq
+import time
+from sqlalchemy import select, func, extract, Integer
+from sqlalchemy.orm import Session
+from app.models import Post, Hashtag, PostHashtag
+from app.services.outbox.outbox_service import run_after_commit
+from app.services.redis.trending_operation import (
+    BUCKET_LEVELS, bucket_start, record_hashtag_usage, get_bucket_counts, replace_buckets
+)
+from utils.model_utils.enums import PostVisibility
+
+# This service layer ranks hashtags by how fast they are being used, from the time-bucketed
+# counters in Redis only. Each window is read from one bucket level:
+#   score = sum(bucket uses * 2^(-bucket age / half-life)) / window hours
+# i.e. a decayed uses-per-hour velocity, so a tag that is used now beats one that was used
+# as often earlier in the window. Only public posts are counted, in the buckets of their
+# creation time; edits and deletes take uses back from those same buckets. Counters are
+# written once the transaction commits.
+
+TRENDING_WINDOWS = {
+    # window: (bucket level, number of buckets, half-life in seconds)
+    "1h": ("m", 60, 15 * 60),
+    "24h": ("h", 24, 6 * 3600),
+    "7d": ("d", 7, 2 * 86400),
+}
+
+
+def public_tag_names(post: Post) -> set[str]:
+    """Returns the tags a post is counted under: its hashtags if it is public, otherwise none."""
+    if post.visibility != PostVisibility.PUBLIC:
+        return set()
+    return {hashtag.tag_name for hashtag in post.hashtags}
+
+
+def record_post_hashtags(session: Session, post: Post, hashtags: list[Hashtag]) -> None:
+    """Counts the hashtags of a newly created public post once the transaction commits."""
+    if hashtags and post.visibility == PostVisibility.PUBLIC:
+        run_after_commit(session, record_hashtag_usage, [hashtag.tag_name for hashtag in hashtags], post.created_at.timestamp())
+
+
+def adjust_post_hashtags(session: Session, post: Post, old_tag_names: set[str], new_tag_names: set[str]) -> None:
+    """
+    Moves a post's counted uses from its old to its new public tags (see public_tag_names)
+    once the transaction commits, e.g. after an edit, a visibility change or a delete.
+    """
+    timestamp = post.created_at.timestamp()
+    added, removed = sorted(new_tag_names - old_tag_names), sorted(old_tag_names - new_tag_names)
+    if added:
+        run_after_commit(session, record_hashtag_usage, added, timestamp)
+    if removed:
+        run_after_commit(session, record_hashtag_usage, removed, timestamp, -1)
+
+
+def get_trending_hashtags_service(window: str, limit: int) -> dict:
+    """
+    Returns the top hashtags of the window by decayed velocity, without touching Postgres.
+    Raises ValueError for an unknown window.
+    """
+    if window not in TRENDING_WINDOWS:
+        raise ValueError(f"Unknown trending window '{window}'.")
+    level, bucket_count, half_life = TRENDING_WINDOWS[window]
+    size = BUCKET_LEVELS[level][0]
+
+    now = time.time()
+    current = bucket_start(level, now)
+    starts = [current - index * size for index in range(bucket_count)]
+    buckets = get_bucket_counts(level, starts) or []
+
+    scores, uses = {}, {}
+    for start, counts in zip(starts, buckets):
+        # Age is taken at the middle of the part of the bucket that has elapsed
+        age = max(now - (start + min(size, now - start) / 2), 0.0)
+        weight = 2 ** (-age / half_life)
+        for tag_name, count in counts.items():
+            scores[tag_name] = scores.get(tag_name, 0.0) + count * weight
+            uses[tag_name] = uses.get(tag_name, 0) + count
+
+    window_hours = bucket_count * size / 3600
+    top_tags = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], item[0]))
+    return {
+        "window": window,
+        "hashtags": [
+            {"tagName": tag_name, "uses": uses[tag_name], "velocity": round(score / window_hours, 4)}
+            for tag_name, score in top_tags
+        ],
+    }
+
+
+def rebuild_trending_buckets(session: Session) -> dict[str, int]:
+    """
+    Reconstructs every bucket still within retention from post_hashtags and posts.created_at,
+    e.g. after a Redis flush. Returns the number of non-empty buckets rebuilt per level.
+    """
+    now = time.time()
+    rebuilt = {}
+    for level, (size, retention) in BUCKET_LEVELS.items():
+        first_start = bucket_start(level, now - retention + size)
+        # Bucketed in SQL on the epoch, exactly like bucket_start, so no time zone is involved
+        start_column = (func.floor(extract('epoch', Post.created_at) / size) * size).cast(Integer)
+        query = (
+            select(start_column, Hashtag.tag_name, func.count())
+            .select_from(PostHashtag)
+            .join(Post, Post.id == PostHashtag.post_id)
+            .join(Hashtag, Hashtag.id == PostHashtag.hashtag_id)
+            .where(Post.visibility == PostVisibility.PUBLIC, Post.created_at >= func.to_timestamp(first_start))
+            .group_by(start_column, Hashtag.tag_name)
+        )
+        buckets = {start: {} for start in range(first_start, bucket_start(level, now) + 1, size)}
+        for start, tag_name, count in session.execute(query).all():
+            buckets.setdefault(start, {})[tag_name] = count
+        replace_buckets(level, buckets)
+        rebuilt[level] = sum(1 for counts in buckets.values() if counts)
+    return rebuilt
@@ -1,14 +1,19 @@
 import re
 from datetime import datetime, timedelta, timezone
-from sqlalchemy import select
 from sqlalchemy.orm import Session
-from app.models import Post, User, Notification
+from app.models import Post, PostHashtag, PostMentions, User, Notification
 from app.exceptions import PermissionDeniedError, PostNotFoundError
 from uuid import UUID
-from app.models import Hashtag
-from utils.app_utils.regex_patterns import MENTION_REGEX
-from app.extensions import socketio
-from app.resources.notitifications.notification_list_resource import serialize_notification
+from app.services.outbox.outbox_service import enqueue_socket_emits
+from app.services.notitifcation.notification_serializer import serialize_notification
+from app.services.post.timeline_service import fan_out_post, remove_post_from_timelines, is_follower_visible
+from app.services.post.hashtag_service import resolve_hashtags
+from app.services.mentions.mention_service import resolve_mentions
+from app.services.post.public_feed_service import add_post_to_public_feed, remove_post_from_public_feed
+from app.services.post.post_cache_service import invalidate_cached_posts
+from app.services.post.trending_service import public_tag_names, adjust_post_hashtags
+from app.services.counts.count_service import adjust_counts, post_counter_keys
+from utils.model_utils.enums import PostVisibility
 
 
 
@@ -46,28 +51,26 @@ def update_post_service(
         raise PermissionDeniedError("Posts cannot be edited after one hour.")
     
     # 3. Get old mention IDs (to prevent re-notifying)
-    old_mention_ids = {user.id for user in post_to_update.mentioned_users}
+    old_mention_ids = PostMentions.get_user_ids(session, post_to_update.id)
+    was_follower_visible = is_follower_visible(post_to_update.visibility)
+    was_public = post_to_update.visibility == PostVisibility.PUBLIC
+    old_counter_keys = post_counter_keys(post_to_update)
+    counts_toward_trending = 'hashtags' in update_data or 'visibility' in update_data
+    old_tag_names = public_tag_names(post_to_update) if counts_toward_trending else set()
 
     # 4. Handle Hashtag translation
     # The client sends 'hashtags' as a list of strings
     hashtag_names = update_data.pop('hashtags', None)
     if hashtag_names is not None: # An empty list [] is a valid update
-        unique_tag_names = set(hashtag_names)
-        hashtag_objects = [Hashtag.find_or_create(session, name) for name in unique_tag_names]
+        hashtag_objects = resolve_hashtags(session, hashtag_names)
         # Put the list of *objects* back into update_data
         update_data['hashtags'] = hashtag_objects
 
     # 5. Handle Mentions translation (based on new content)
+    # Resolved from the mention cache as (id, display_name) and stored directly as post_mentions rows
+    mentioned_users = None
     if 'content' in update_data:
-        new_content = update_data['content']
-        # Regex to find @username, @user.name, @user-name
-        mention_usernames = list(set(MENTION_REGEX.findall(new_content or "")))
-        mentioned_users = []
-        if mention_usernames:
-            query = select(User).where(User.username.in_(mention_usernames))
-            mentioned_users = session.execute(query).scalars().all()
-
-        update_data['mentioned_users'] = mentioned_users
+        mentioned_users = resolve_mentions(session, update_data['content'])
 
     # 6. Delegate the core update to the model's method
     updated_post = Post.update(
@@ -76,40 +79,64 @@ def update_post_service(
         requesting_user_id=requesting_user_id,
         **update_data
     )
+
+    if mentioned_users is not None:
+        PostMentions.replace_for_post(session, updated_post.id, [user.id for user in mentioned_users])
+
+    # 6a. Copy the post's created_at and visibility onto its (possibly new) hashtag rows
+    if 'hashtags' in update_data or 'visibility' in update_data:
+        session.flush()
+        PostHashtag.sync_post(session, updated_post.id)
+
+    # 6b. Keep follower timelines in sync when the post is made private or un-private
+    now_follower_visible = is_follower_visible(updated_post.visibility)
+    if was_follower_visible and not now_follower_visible:
+        remove_post_from_timelines(session, updated_post)
+        fan_out_post(session, updated_post) # Keep it in the author's own timeline
+    elif now_follower_visible and not was_follower_visible:
+        fan_out_post(session, updated_post)
+
+    # 6c. Drop the stale cached body and keep the public feed ring buffer in sync
+    invalidate_cached_posts(session, [updated_post.id])
+    now_public = updated_post.visibility == PostVisibility.PUBLIC
+    if was_public and not now_public:
+        remove_post_from_public_feed(session, updated_post)
+    elif now_public and not was_public:
+        add_post_to_public_feed(session, updated_post)
+
+    # 6d. Move the post between the maintained per-visibility counters
+    new_counter_keys = post_counter_keys(updated_post)
+    if new_counter_keys != old_counter_keys:
+        deltas = {key: -1 for key in old_counter_keys}
+        for key in new_counter_keys:
+            deltas[key] = deltas.get(key, 0) + 1
+        adjust_counts(session, deltas)
+
+    # 6e. Move the post's trending uses to its new public tags
+    if counts_toward_trending:
+        adjust_post_hashtags(session, updated_post, old_tag_names, public_tag_names(updated_post))
         
     # 7. --- Create Notifications for *New* Mentions ---
-    # Check if 'mentioned_users' was part of this update
-    if 'mentioned_users' in update_data:
-        new_mentioned_users = update_data['mentioned_users']
-        for user in new_mentioned_users:
-            # Don't notify self-mentions
-            # Don't notify users who were *already* mentioned
-            if user.id != requesting_user_id and user.id not in old_mention_ids:
-                new_notification = Notification.create(
-                    session=session,
-                    recipient_user_id=user.id,
-                    actor_user_id=requesting_user_id,
-                    action_type='mention',
-                    target_type='post',
-                    target_id=updated_post.id
-                )
-
-                # --- 3. ADD THIS SOCKET LOGIC ---
-                if new_notification:
-                    session.flush() # Flush to get notification ID
-                    
-                    # B. Manually attach objects for the serializer
-                    new_notification.actor = requesting_user
-                    new_notification.target_object = updated_post
-                    
-                    # C. Serialize the data
-                    serialized_data = serialize_notification(new_notification)
-                    
-                    # D. Emit to the specific user's room
-                    socketio.emit(
-                        'new_notification',
-                        serialized_data,
-                        to=f"user_{user.id}"
-                    )
+    # Check if the mentions were part of this update
+    if mentioned_users is not None:
+        # Don't notify users who were *already* mentioned; self-mentions are skipped by create_many
+        new_notifications = Notification.create_many(
+            session,
+            [user.id for user in mentioned_users if user.id not in old_mention_ids],
+            actor_user_id=requesting_user_id,
+            action_type='mention',
+            target_type='post',
+            target_id=updated_post.id
+        )
+        if new_notifications:
+            emits = []
+            for new_notification in new_notifications:
+                # Every notification is serialized against the same author and post
+                new_notification.actor = requesting_user
+                new_notification.target_object = updated_post
+                emits.append((f"user_{new_notification.recipient_user_id}", serialize_notification(new_notification)))
+
+            # Queued for the users' personal rooms in one insert; they are sent after commit
+            enqueue_socket_emits(session, 'new_notification', emits)
 
     return updated_post
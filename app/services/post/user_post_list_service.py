@@ -1,75 +1,66 @@
-import math
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, select, or_, and_, exists, literal
-from app.models import User, Post, Follower, PostLike # --- Import PostLike
+from sqlalchemy.orm import Session
+from sqlalchemy import select, tuple_
+from app.models import User, Post
 from app.exceptions import UserNotFoundError
-from utils.model_utils.enums import PostVisibility
+from app.services.post.post_cache_service import get_many, apply_liked_overlay
+from app.services.counts.count_service import COUNT_EXACT, resolve_count, page_totals, user_posts_counters
+from utils.app_utils.pagination_utils import encode_cursor, decode_cursor
 
-def get_posts_for_user_profile(session: Session, username: str, requesting_user_id: int | None, page: int, per_page: int) -> dict:
+def get_posts_for_user_profile(
+    session: Session, username: str, requesting_user_id: int | None, page: int, per_page: int,
+    cursor: str | None = None, count_mode: str | None = None
+) -> dict:
     """
-    Fetches a paginated list of posts for a specific user's profile, respecting visibility
-    and including the 'is_liked' status for the requesting user.
+    Fetches a paginated list of serialized posts for a specific user's profile, respecting visibility
+    and including the 'is_liked' status for the requesting user. Post bodies come from the post cache.
+    Uses keyset pagination on (created_at, id) when a cursor is given, page number otherwise.
     """
     target_user = User.get_by_identifier(session, identifier=username)
     if not target_user:
         raise UserNotFoundError("User not found.")
 
-    # --- 1. DEFINE THE 'is_liked' SUBQUERY (IF USER IS LOGGED IN) ---
-    query_fields = [Post]
-    if requesting_user_id:
-        is_liked_subquery = (
-            select(literal(True))
-            .where(PostLike.post_id == Post.id)
-            .where(PostLike.user_id == requesting_user_id)
-            .exists()
-            .label("is_liked_by_requester")
-        )
-        query_fields.append(is_liked_subquery)
+    # --- 1. SELECT ONLY IDS AND VERSIONS; THE 'is_liked' STATUS IS RESOLVED PER PAGE ---
+    query_fields = [Post.id, Post.created_at, Post.updated_at]
 
-    # --- 2. UPDATE THE BASE QUERY TO SELECT THE NEW FIELD ---
-    base_query = select(*query_fields).where(Post.user_id == target_user.id)
-    
-    # Your visibility logic remains the same.
-    visibility_conditions = [Post.visibility == PostVisibility.PUBLIC]
-    if requesting_user_id:
-        if requesting_user_id == target_user.id:
-            visibility_conditions.append(Post.visibility.in_([PostVisibility.FOLLOWERS_ONLY, PostVisibility.PRIVATE]))
-        else:
-            is_follower_subquery = select(exists().where(
-                and_(Follower.follower_id == requesting_user_id, Follower.followed_id == target_user.id)
-            )).scalar_subquery()
-            visibility_conditions.append(and_(Post.visibility == PostVisibility.FOLLOWERS_ONLY, is_follower_subquery))
-    
-    base_query = base_query.where(or_(*visibility_conditions))
+    # --- 2. BUILD THE BASE QUERY ---
+    # The visibilities the requester may see are resolved once instead of per row.
+    visibilities = Post.get_visible_visibilities(session, target_user.id, requesting_user_id)
+    base_query = select(*query_fields).where(Post.user_id == target_user.id, Post.visibility.in_(visibilities))
 
-    # The count query remains the same.
-    count_query = select(func.count()).select_from(base_query.subquery())
-    total_items = session.execute(count_query).scalar() or 0
-    total_pages = math.ceil(total_items / per_page) if per_page > 0 else 0
+    # The total is served from the author's maintained per-visibility post counters.
+    total_items, total_pages = page_totals(
+        resolve_count(session, count_mode or COUNT_EXACT, base_query, counters=user_posts_counters(target_user.id, visibilities)),
+        per_page
+    )
 
-    # --- 3. ADD EAGER LOADING TO THE FINAL QUERY ---
+    # --- 3. PAGINATE; THE BODIES COME FROM THE POST CACHE ---
     posts_query = (
         base_query
-        .options(joinedload(Post.user), joinedload(Post.hashtags)) # Performance optimization
-        .order_by(Post.created_at.desc())
-        .limit(per_page)
-        .offset((page - 1) * per_page)
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .limit(per_page + 1)
     )
+    if cursor:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        posts_query = posts_query.where(tuple_(Post.created_at, Post.id) < tuple_(cursor_created_at, cursor_id))
+    else:
+        posts_query = posts_query.offset((page - 1) * per_page)
     
     # --- 4. PROCESS THE RESULTS (TUPLES) INSTEAD OF SCALARS ---
-    results = session.execute(posts_query).unique().all()
-    
-    posts = []
-    for row in results:
-        post = row[0]
-        # Attach the 'is_liked' boolean if the user is logged in
-        if requesting_user_id:
-            post.is_liked_by_requester = row.is_liked_by_requester
-        posts.append(post)
+    results = session.execute(posts_query).all()
+    has_more = len(results) > per_page
+    results = results[:per_page]
+
+    bodies = get_many(session, [row.id for row in results], versions={row.id: row.updated_at for row in results})
+    # Attach the 'is_liked' boolean with one lookup for the whole page (False for anonymous users)
+    apply_liked_overlay(session, requesting_user_id, bodies)
+    posts = [bodies[row.id] for row in results if row.id in bodies]
+
+    next_cursor = encode_cursor(results[-1].created_at, results[-1].id) if has_more and results else None
 
     return {
         "posts": posts,
         "totalPages": total_pages,
         "currentPage": page,
-        "totalItems": total_items
+        "totalItems": total_items,
+        "nextCursor": next_cursor
     }
\ No newline at end of file
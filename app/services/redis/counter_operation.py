@@ -0,0 +1,117 @@
+from app.extensions import redis_client
+import logging
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# Maintained row counts (e.g. a user's followers) kept as plain Redis integers.
+# Counters are only adjusted while they exist: a missing counter is recomputed exactly
+# by the reader, so an increment can never turn a missing counter into a wrong one.
+#
+# Every counter has a version key (<counter>:v) that each increment bumps. A reader that
+# recomputes a missing counter reads the version before counting and only stores its
+# count if the version is unchanged, so a write that landed between the reader's snapshot
+# and the store can neither be lost nor be applied twice.
+_INCREMENT_EXISTING_SCRIPT = """
+local n = #KEYS / 2
+local ttl = tonumber(ARGV[n + 1])
+for i = 1, n do
+    redis.call('INCR', KEYS[n + i])
+    redis.call('EXPIRE', KEYS[n + i], ttl)
+    if redis.call('EXISTS', KEYS[i]) == 1 then
+        redis.call('INCRBY', KEYS[i], ARGV[i])
+    end
+end
+return 1
+"""
+_increment_existing = redis_client.register_script(_INCREMENT_EXISTING_SCRIPT)
+
+# Stores a recomputed count only if no increment ran since the reader read the version.
+_INIT_IF_UNCHANGED_SCRIPT = """
+local n = #KEYS / 2
+local ttl = tonumber(ARGV[2 * n + 1])
+for i = 1, n do
+    local version = redis.call('GET', KEYS[n + i]) or ''
+    if version == ARGV[n + i] then
+        redis.call('SET', KEYS[i], ARGV[i], 'EX', ttl, 'NX')
+    end
+end
+return 1
+"""
+_init_if_unchanged = redis_client.register_script(_INIT_IF_UNCHANGED_SCRIPT)
+
+
+def _version_key(key: str) -> str:
+    return f"{key}:v"
+
+
+def get_counters(keys: list[str]) -> dict[str, int]:
+    """Reads the given counters with one MGET. Missing counters are absent from the result."""
+    if not keys:
+        return {}
+    try:
+        values = redis_client.mget(keys)
+    except RedisError as e:
+        logger.error(f"Failed to read counters {keys}: {e}")
+        return {}
+    return {key: int(value) for key, value in zip(keys, values) if value is not None}
+
+
+def get_counter_versions(keys: list[str]) -> dict[str, str] | None:
+    """
+    Reads the version of each counter ('' if it has none) with one MGET, to be passed
+    to init_counters. Returns None if Redis is unavailable.
+    """
+    if not keys:
+        return {}
+    try:
+        values = redis_client.mget([_version_key(key) for key in keys])
+    except RedisError as e:
+        logger.error(f"Failed to read counter versions {keys}: {e}")
+        return None
+    return {key: value.decode() if isinstance(value, bytes) else (value or '') for key, value in zip(keys, values)}
+
+
+def init_counters(values: dict[str, int], versions: dict[str, str], ttl_seconds: int) -> None:
+    """
+    Stores freshly computed counts, unless a counter was created in the meantime or was
+    incremented since its version was read (the count may then be missing that write).
+    The TTL bounds the drift from increments that were lost, e.g. while Redis was unavailable.
+    """
+    values = {key: value for key, value in values.items() if key in versions}
+    if not values:
+        return
+    keys = list(values.keys())
+    try:
+        _init_if_unchanged(
+            keys=keys + [_version_key(key) for key in keys],
+            args=list(values.values()) + [versions[key] for key in keys] + [ttl_seconds]
+        )
+    except RedisError as e:
+        logger.error(f"Failed to initialize counters {keys}: {e}")
+
+
+def increment_counters(amounts: dict[str, int], ttl_seconds: int) -> None:
+    """
+    Adds the given (possibly negative) amounts to every counter that exists and bumps
+    the version of each, so concurrent recomputes are discarded.
+    """
+    amounts = {key: amount for key, amount in amounts.items() if amount}
+    if not amounts:
+        return
+    keys = list(amounts.keys())
+    try:
+        _increment_existing(keys=keys + [_version_key(key) for key in keys], args=list(amounts.values()) + [ttl_seconds])
+    except RedisError as e:
+        # A missed increment is healed when the counter expires; never fail the write.
+        logger.error(f"Failed to increment counters {amounts}: {e}")
+
+
+def delete_counters(keys: list[str]) -> None:
+    """Drops counters so they are recomputed on the next read."""
+    if not keys:
+        return
+    try:
+        redis_client.delete(*keys)
+    except RedisError as e:
+        logger.error(f"Failed to delete counters {keys}: {e}")
@@ -0,0 +1,90 @@
+from app.extensions import redis_client
+
+# Pages of post-id sorted sets (timelines, author recent posts, the public ring) in the same
+# (score, id) DESC order as the SQL keyset paths, so a cursor of (score, id) neither skips nor
+# repeats posts that share a score.
+#
+# Redis orders members of equal score by their bytes ("10" < "9"), not by id, so the script
+# reads every member of a boundary score, sorts the candidates by (score, id) and cuts the page
+# from them. Ties are rare (posts created in the same transaction share created_at), so this
+# costs one extra ZRANGEBYSCORE on the score at each edge of the page.
+_KEYSET_PAGE_SCRIPT = """
+local count = tonumber(ARGV[1])
+local offset = tonumber(ARGV[2])
+local before_score, before_id = nil, nil
+if ARGV[3] ~= '' then
+    before_score = tonumber(ARGV[3])
+    before_id = tonumber(ARGV[4])
+end
+
+local candidates = {}
+local function add(rows, last_score)
+    for i = 1, #rows, 2 do
+        local score = tonumber(rows[i + 1])
+        if last_score == nil or score ~= last_score then
+            table.insert(candidates, {tonumber(rows[i]), score, rows[i + 1]})
+        end
+    end
+end
+
+local needed = offset + count
+local rows
+if before_score ~= nil then
+    -- Posts sharing the cursor's score that sort after the cursor's id
+    local ties = redis.call('ZRANGEBYSCORE', KEYS[1], ARGV[3], ARGV[3], 'WITHSCORES')
+    for i = 1, #ties, 2 do
+        if tonumber(ties[i]) < before_id then
+            table.insert(candidates, {tonumber(ties[i]), before_score, ties[i + 1]})
+        end
+    end
+    rows = redis.call('ZREVRANGEBYSCORE', KEYS[1], '(' .. ARGV[3], '-inf', 'WITHSCORES', 'LIMIT', 0, needed)
+else
+    rows = redis.call('ZREVRANGE', KEYS[1], 0, needed - 1, 'WITHSCORES')
+end
+
+if #rows == needed * 2 and needed > 0 then
+    -- The read may have stopped inside a group of equal scores; take the whole group
+    local last_score = tonumber(rows[#rows])
+    add(rows, last_score)
+    local group = redis.call('ZRANGEBYSCORE', KEYS[1], rows[#rows], rows[#rows], 'WITHSCORES')
+    add(group, nil)
+else
+    add(rows, nil)
+end
+
+table.sort(candidates, function(a, b)
+    if a[2] ~= b[2] then
+        return a[2] > b[2]
+    end
+    return a[1] > b[1]
+end)
+
+local page = {}
+for i = offset + 1, math.min(offset + count, #candidates) do
+    table.insert(page, tostring(candidates[i][1]))
+    table.insert(page, candidates[i][3])
+end
+return page
+"""
+_keyset_page = redis_client.register_script(_KEYSET_PAGE_SCRIPT)
+
+
+def queue_keyset_page(pipe, key: str, count: int, offset: int = 0, before: tuple[float, int] | None = None) -> None:
+    """
+    Queues the read of a page of (post_id, score) entries, newest first, on a pipeline.
+    Decode the reply with parse_keyset_page.
+
+    Arguments:
+        pipe: The pipeline to queue the read on.
+        key: The sorted set of post ids.
+        count: The maximum number of entries to return.
+        offset: The number of newest entries to skip (page-number mode).
+        before: Only return entries strictly older than this (score, post_id) (cursor mode).
+    """
+    before_score, before_id = before if before is not None else ("", "")
+    _keyset_page(keys=[key], args=[count, offset, before_score, before_id], client=pipe)
+
+
+def parse_keyset_page(reply: list) -> list[tuple[int, float]]:
+    """Decodes a queued keyset page into (post_id, score) entries."""
+    return [(int(reply[i]), float(reply[i + 1])) for i in range(0, len(reply), 2)]
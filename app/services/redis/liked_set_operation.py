@@ -0,0 +1,126 @@
+from app.extensions import redis_client
+import logging
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# Per-user sets of liked post ids, used to answer "which of these posts has the user liked"
+# without touching post_likes. A set is only authoritative while it exists:
+# - PLACEHOLDER_MEMBER keeps an empty set materialized (post ids start at 1).
+# - OVERFLOW_MEMBER marks users with too many likes to cache; their lookups go to Postgres.
+PLACEHOLDER_MEMBER = "0"
+OVERFLOW_MEMBER = "-1"
+
+#
+# Each set has a generation key (liked:<uid>:gen) that every committed like or unlike bumps.
+# A reader materializing the set reads the generation before querying post_likes and only
+# stores its snapshot if the generation is unchanged, so a like committed while it was
+# loading is never dropped.
+
+# Adds or removes a liked post id only when the set is materialized, so a like can never
+# create a partial set that would then be taken as complete.
+_UPDATE_EXISTING_SCRIPT = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+if ARGV[1] == 'add' then
+    redis.call('SADD', KEYS[1], ARGV[2])
+else
+    redis.call('SREM', KEYS[1], ARGV[2])
+end
+return 1
+"""
+_update_existing = redis_client.register_script(_UPDATE_EXISTING_SCRIPT)
+
+# Replaces the set with a snapshot unless a like or unlike was recorded since the snapshot began.
+_REPLACE_IF_UNCHANGED_SCRIPT = """
+local generation = redis.call('GET', KEYS[2]) or ''
+if generation ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+-- SADD in slices, as unpack() is limited by the Lua stack size
+for i = 3, #ARGV, 1000 do
+    redis.call('SADD', KEYS[1], unpack(ARGV, i, math.min(i + 999, #ARGV)))
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+_replace_if_unchanged = redis_client.register_script(_REPLACE_IF_UNCHANGED_SCRIPT)
+
+
+def _liked_set_key(user_id: int) -> str:
+    return f"liked:{user_id}"
+
+
+def _generation_key(user_id: int) -> str:
+    return f"liked:{user_id}:gen"
+
+
+def get_liked_flags(user_id: int, post_ids: list[int]) -> tuple[list[bool] | None, bool]:
+    """
+    Checks the given post ids against a user's liked set in one round trip.
+
+    Returns:
+        A tuple of (flags, needs_materializing). flags is None when the set cannot answer:
+        it is missing (needs_materializing is True), marked as overflowed, or Redis is unavailable.
+    """
+    key = _liked_set_key(user_id)
+    try:
+        flags = redis_client.smismember(key, [OVERFLOW_MEMBER, PLACEHOLDER_MEMBER, *post_ids])
+    except RedisError as e:
+        logger.error(f"Failed to read liked set of user {user_id}: {e}")
+        return None, False
+
+    is_overflowed, is_materialized = flags[0], flags[1]
+    if is_overflowed:
+        return None, False
+    if not is_materialized:
+        return None, True
+    return [bool(flag) for flag in flags[2:]], False
+
+
+def get_liked_set_generation(user_id: int) -> str | None:
+    """
+    Reads the generation of a user's liked set ('' if it has none), to be passed to
+    replace_liked_set. Returns None if Redis is unavailable.
+    """
+    try:
+        return redis_client.get(_generation_key(user_id)) or ''
+    except RedisError as e:
+        logger.error(f"Failed to read liked set generation of user {user_id}: {e}")
+        return None
+
+
+def replace_liked_set(user_id: int, post_ids: list[int] | None, generation: str, ttl_seconds: int) -> None:
+    """
+    Materializes a user's liked set, unless a like or unlike was recorded since the
+    generation was read. Passing None stores an overflow marker instead, so the next
+    lookups go straight to Postgres until the marker expires.
+    """
+    members = [OVERFLOW_MEMBER] if post_ids is None else [PLACEHOLDER_MEMBER, *post_ids]
+    try:
+        _replace_if_unchanged(
+            keys=[_liked_set_key(user_id), _generation_key(user_id)],
+            args=[generation, ttl_seconds, *members]
+        )
+    except RedisError as e:
+        logger.error(f"Failed to materialize liked set of user {user_id}: {e}")
+
+
+def add_liked_post(user_id: int, post_id: int, ttl_seconds: int) -> None:
+    """Records a committed like in the user's liked set if it is materialized."""
+    try:
+        _update_existing(keys=[_liked_set_key(user_id), _generation_key(user_id)], args=["add", post_id, ttl_seconds])
+    except RedisError as e:
+        logger.error(f"Failed to add post {post_id} to liked set of user {user_id}: {e}")
+
+
+def remove_liked_post(user_id: int, post_id: int, ttl_seconds: int) -> None:
+    """Removes a committed unlike from the user's liked set if it is materialized."""
+    try:
+        _update_existing(keys=[_liked_set_key(user_id), _generation_key(user_id)], args=["remove", post_id, ttl_seconds])
+    except RedisError as e:
+        logger.error(f"Failed to remove post {post_id} from liked set of user {user_id}: {e}")
@@ -0,0 +1,62 @@
+from app.extensions import redis_client
+import json
+import logging
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# Lower-cased username -> {"id", "displayName"} for resolving @mentions, shared by every app process.
+# Usernames that do not exist are cached too, as an empty string, so repeated mentions of a
+# missing user do not reach Postgres. Entries must be dropped when a username is taken, changed,
+# or its account deleted.
+_NEGATIVE_ENTRY = ""
+
+
+def _mention_key(username: str) -> str:
+    return f"mention_user:{username}"
+
+
+def get_mention_entries(usernames: list[str]) -> dict[str, dict | None]:
+    """
+    Reads the cached entries for the given lower-cased usernames with one MGET.
+    Known-missing usernames map to None; uncached ones are absent.
+    """
+    if not usernames:
+        return {}
+    try:
+        values = redis_client.mget([_mention_key(username) for username in usernames])
+    except RedisError as e:
+        logger.error(f"Failed to read {len(usernames)} cached mention entries: {e}")
+        return {}
+
+    entries = {}
+    for username, value in zip(usernames, values):
+        if value is not None:
+            entries[username] = None if value == _NEGATIVE_ENTRY else json.loads(value)
+    return entries
+
+
+def set_mention_entries(entries: dict[str, dict | None], ttl_seconds: int, negative_ttl_seconds: int) -> None:
+    """Stores resolved entries, and None for usernames that do not exist."""
+    if not entries:
+        return
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for username, entry in entries.items():
+            if entry is None:
+                pipe.set(_mention_key(username), _NEGATIVE_ENTRY, ex=negative_ttl_seconds)
+            else:
+                pipe.set(_mention_key(username), json.dumps(entry), ex=ttl_seconds)
+        pipe.execute()
+    except RedisError as e:
+        logger.error(f"Failed to cache {len(entries)} mention entries: {e}")
+
+
+def delete_mention_entries(usernames: list[str]) -> None:
+    """Drops the cached entries of the given lower-cased usernames."""
+    if not usernames:
+        return
+    try:
+        redis_client.delete(*[_mention_key(username) for username in usernames])
+    except RedisError as e:
+        logger.error(f"Failed to invalidate cached mention entries {usernames}: {e}")
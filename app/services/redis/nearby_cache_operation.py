@@ -0,0 +1,60 @@
+from app.extensions import redis_client
+import json
+import logging
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# Results of spatial queries, keyed by the geohash tile their query point was snapped to,
+# so every request from the same tile shares one query until the entry expires.
+# - nearby_posts: first pages of public nearby posts as [post_id, distance] rows, per radius and page size.
+# - nearby_users: users near a grid cell as [user_id, distance_km] rows, per radius.
+# Entries are never invalidated; readers re-check visibility or account status when hydrating.
+
+
+def _nearby_key(geohash: str, radius: int, limit: int) -> str:
+    return f"nearby_posts:{geohash}:{radius}:{limit}"
+
+
+def _nearby_users_key(geohash: str, radius: int) -> str:
+    return f"nearby_users:{geohash}:{radius}"
+
+
+def get_nearby_page(geohash: str, radius: int, limit: int) -> list[tuple[int, float]] | None:
+    """Returns the cached (post_id, distance) rows of a tile, or None on a miss."""
+    try:
+        value = redis_client.get(_nearby_key(geohash, radius, limit))
+    except RedisError as e:
+        logger.error(f"Failed to read nearby page for tile {geohash}: {e}")
+        return None
+    if value is None:
+        return None
+    return [(post_id, distance) for post_id, distance in json.loads(value)]
+
+
+def set_nearby_page(geohash: str, radius: int, limit: int, rows: list[tuple[int, float]], ttl_seconds: int) -> None:
+    """Caches the (post_id, distance) rows of a tile for ttl_seconds."""
+    try:
+        redis_client.set(_nearby_key(geohash, radius, limit), json.dumps(rows), ex=ttl_seconds)
+    except RedisError as e:
+        logger.error(f"Failed to cache nearby page for tile {geohash}: {e}")
+
+
+def get_nearby_users(geohash: str, radius: int) -> list[tuple[int, int]] | None:
+    """Returns the cached (user_id, distance_km) rows of a grid cell, or None on a miss."""
+    try:
+        value = redis_client.get(_nearby_users_key(geohash, radius))
+    except RedisError as e:
+        logger.error(f"Failed to read nearby users for cell {geohash}: {e}")
+        return None
+    if value is None:
+        return None
+    return [(user_id, distance_km) for user_id, distance_km in json.loads(value)]
+
+
+def set_nearby_users(geohash: str, radius: int, rows: list[tuple[int, int]], ttl_seconds: int) -> None:
+    """Caches the (user_id, distance_km) rows of a grid cell for ttl_seconds."""
+    try:
+        redis_client.set(_nearby_users_key(geohash, radius), json.dumps(rows), ex=ttl_seconds)
+    except RedisError as e:
+        logger.error(f"Failed to cache nearby users for cell {geohash}: {e}")
@@ -0,0 +1,60 @@
+from app.extensions import redis_client
+import json
+import logging
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# Serialized post bodies shared by every app process.
+# Each key holds {"version": <updated_at>, "body": <serialized post>, "expiresAt": <unix time>};
+# readers discard entries whose version does not match the row they are about to show.
+# expiresAt matches the key's TTL, so in-process copies of an entry expire with it.
+
+
+def _post_body_key(post_id: int) -> str:
+    return f"post_body:{post_id}"
+
+
+def get_post_bodies(post_ids: list[int]) -> dict[int, tuple[str, dict, float]]:
+    """
+    Reads the cached (version, body, expires_at) entries for the given post ids with one MGET.
+    Missing ids are simply absent; an empty dict is returned if Redis is unavailable.
+    """
+    if not post_ids:
+        return {}
+    try:
+        values = redis_client.mget([_post_body_key(post_id) for post_id in post_ids])
+    except RedisError as e:
+        logger.error(f"Failed to read {len(post_ids)} cached post bodies: {e}")
+        return {}
+
+    entries = {}
+    for post_id, value in zip(post_ids, values):
+        if value is not None:
+            entry = json.loads(value)
+            entries[post_id] = (entry["version"], entry["body"], entry.get("expiresAt", 0.0))
+    return entries
+
+
+def set_post_bodies(entries: dict[int, tuple[str, dict, float]], ttl_seconds: int) -> None:
+    """Stores (version, body, expires_at) entries for the given post ids."""
+    if not entries:
+        return
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for post_id, (version, body, expires_at) in entries.items():
+            value = json.dumps({"version": version, "body": body, "expiresAt": expires_at})
+            pipe.set(_post_body_key(post_id), value, ex=ttl_seconds)
+        pipe.execute()
+    except RedisError as e:
+        logger.error(f"Failed to cache {len(entries)} post bodies: {e}")
+
+
+def delete_post_bodies(post_ids: list[int]) -> None:
+    """Drops the cached bodies of the given posts."""
+    if not post_ids:
+        return
+    try:
+        redis_client.delete(*[_post_body_key(post_id) for post_id in post_ids])
+    except RedisError as e:
+        logger.error(f"Failed to invalidate cached post bodies {post_ids}: {e}")
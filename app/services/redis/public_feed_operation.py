@@ -0,0 +1,88 @@
+from app.extensions import redis_client
+import logging
+from redis.exceptions import RedisError
+from app.services.redis.keyset_page_operation import queue_keyset_page, parse_keyset_page
+
+logger = logging.getLogger(__name__)
+
+# The public feed is identical for every viewer, so one shared ring buffer (capped sorted set)
+# of the newest public post ids, scored by creation time, is kept for all of them.
+PUBLIC_FEED_IDS_KEY = "feed:public:ids"
+# Set while the ring holds every public post, so a short page from it is the end of the feed.
+# Otherwise (the ring is at its cap, or removals left it short of it) older pages come from Postgres.
+PUBLIC_FEED_COMPLETE_KEY = "feed:public:complete"
+
+# Adds a post to the ring buffer if it is materialized and evicts the oldest ids beyond the cap.
+# Evicting an id means the ring no longer holds every public post.
+# A missing ring is rebuilt from Postgres on read.
+_ADD_TO_RING_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[2])
+if redis.call('ZREMRANGEBYRANK', KEYS[1], 0, -(tonumber(ARGV[3]) + 1)) > 0 then
+    redis.call('DEL', KEYS[2])
+end
+return 1
+"""
+_add_to_ring = redis_client.register_script(_ADD_TO_RING_SCRIPT)
+
+
+def add_public_post(post_id: int, score: float, max_length: int) -> None:
+    """Adds a newly public post to the shared public feed ring buffer."""
+    try:
+        _add_to_ring(keys=[PUBLIC_FEED_IDS_KEY, PUBLIC_FEED_COMPLETE_KEY], args=[score, post_id, max_length])
+    except RedisError as e:
+        logger.error(f"Failed to add post {post_id} to the public feed cache: {e}")
+
+
+def remove_public_posts(post_ids: list[int]) -> None:
+    """Removes posts from the public feed, e.g. on delete or visibility change."""
+    if not post_ids:
+        return
+    try:
+        redis_client.zrem(PUBLIC_FEED_IDS_KEY, *post_ids)
+    except RedisError as e:
+        logger.error(f"Failed to remove posts {post_ids} from the public feed cache: {e}")
+
+
+def replace_public_ring(entries: list[tuple[int, float]], complete: bool) -> None:
+    """
+    Atomically replaces the ring buffer with the given (post_id, score) entries.
+    complete tells whether the entries are every public post.
+    """
+    try:
+        pipe = redis_client.pipeline(transaction=True)
+        pipe.delete(PUBLIC_FEED_IDS_KEY, PUBLIC_FEED_COMPLETE_KEY)
+        if entries:
+            pipe.zadd(PUBLIC_FEED_IDS_KEY, {str(post_id): score for post_id, score in entries})
+            if complete:
+                pipe.set(PUBLIC_FEED_COMPLETE_KEY, 1)
+        pipe.execute()
+    except RedisError as e:
+        logger.error(f"Failed to rebuild the public feed cache: {e}")
+
+
+def get_public_page(count: int, offset: int = 0, before: tuple[float, int] | None = None) -> tuple[list[tuple[int, float]], bool] | None:
+    """
+    Reads a page of (post_id, score) entries from the ring buffer, newest first.
+    With before, only entries strictly older than that (score, post_id) are returned.
+
+    Returns:
+        A tuple of (entries, complete), where complete tells whether the ring holds every
+        public post, or None if the ring is not materialized or Redis is unavailable.
+    """
+    try:
+        pipe = redis_client.pipeline(transaction=True)
+        pipe.zcard(PUBLIC_FEED_IDS_KEY)
+        pipe.exists(PUBLIC_FEED_COMPLETE_KEY)
+        queue_keyset_page(pipe, PUBLIC_FEED_IDS_KEY, count, offset=0 if before is not None else offset, before=before)
+        length, complete, entries = pipe.execute()
+    except RedisError as e:
+        logger.error(f"Failed to read the public feed cache: {e}")
+        return None
+
+    if not length:
+        return None
+    return parse_keyset_page(entries), bool(complete)
+
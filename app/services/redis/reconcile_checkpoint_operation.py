@@ -0,0 +1,37 @@
+from app.extensions import redis_client
+import logging
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# Progress of counter reconciliation runs: the first post id the next chunk starts at.
+# A run saves it after every committed chunk and deletes it when it finishes, so an
+# interrupted run resumes where it stopped. Without Redis a run simply starts over.
+
+
+def _checkpoint_key(counter: str) -> str:
+    return f"reconcile_checkpoint:{counter}"
+
+
+def get_checkpoint(counter: str) -> int | None:
+    """Returns the post id an interrupted run of the counter stopped at, or None."""
+    try:
+        value = redis_client.get(_checkpoint_key(counter))
+    except RedisError as e:
+        logger.error(f"Failed to read the {counter} reconcile checkpoint: {e}")
+        return None
+    return int(value) if value is not None else None
+
+
+def set_checkpoint(counter: str, next_post_id: int) -> None:
+    try:
+        redis_client.set(_checkpoint_key(counter), next_post_id)
+    except RedisError as e:
+        logger.error(f"Failed to save the {counter} reconcile checkpoint: {e}")
+
+
+def delete_checkpoint(counter: str) -> None:
+    try:
+        redis_client.delete(_checkpoint_key(counter))
+    except RedisError as e:
+        logger.error(f"Failed to delete the {counter} reconcile checkpoint: {e}")
@@ -0,0 +1,254 @@
+from app.extensions import redis_client
+import logging
+from redis.exceptions import RedisError
+from app.services.redis.keyset_page_operation import queue_keyset_page, parse_keyset_page
+
+logger = logging.getLogger(__name__)
+
+# Number of timeline keys touched per script call / pipeline command during fan-out.
+FANOUT_CHUNK_SIZE = 1000
+
+# Adds a post to every timeline that is already materialized, then trims it to its cap.
+# Timelines that do not exist are skipped: they are rebuilt from Postgres on their next read,
+# so creating them here would leave a partial timeline behind.
+_PUSH_TO_EXISTING_SCRIPT = """
+for i, key in ipairs(KEYS) do
+    if redis.call('EXISTS', key) == 1 then
+        redis.call('ZADD', key, ARGV[1], ARGV[2])
+        redis.call('ZREMRANGEBYRANK', key, 0, -(tonumber(ARGV[3]) + 1))
+    end
+end
+return 1
+"""
+_push_to_existing = redis_client.register_script(_PUSH_TO_EXISTING_SCRIPT)
+
+
+def _timeline_key(user_id: int) -> str:
+    return f"timeline:{user_id}"
+
+
+def _chunks(items: list, size: int = FANOUT_CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def push_post_to_timelines(user_ids: list[int], post_id: int, score: float, max_length: int) -> None:
+    """
+    Pushes a post id into the timeline sorted set of each given user.
+
+    Arguments:
+        user_ids: The users whose timelines should receive the post.
+        post_id: The internal id of the post.
+        score: The post's creation time as a Unix timestamp.
+        max_length: The number of entries each timeline is capped at.
+    """
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for chunk in _chunks(list(user_ids)):
+            _push_to_existing(keys=[_timeline_key(uid) for uid in chunk], args=[score, post_id, max_length], client=pipe)
+        pipe.execute()
+    except RedisError as e:
+        # A missed push only makes the timeline stale until it is rebuilt; never fail the write.
+        logger.error(f"Failed to fan out post {post_id} to {len(user_ids)} timelines: {e}")
+
+
+def push_entries_to_timelines(user_ids: list[int], entries: list[tuple[int, float]], max_length: int) -> None:
+    """
+    Pushes several (post_id, score) entries into the timeline of each given user that is
+    already materialized. Used to backfill followers' timelines when an author goes back to push.
+    """
+    if not user_ids or not entries:
+        return
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for chunk in _chunks(list(user_ids)):
+            keys = [_timeline_key(uid) for uid in chunk]
+            for post_id, score in entries:
+                _push_to_existing(keys=keys, args=[score, post_id, max_length], client=pipe)
+            pipe.execute()
+    except RedisError as e:
+        logger.error(f"Failed to backfill {len(entries)} posts into {len(user_ids)} timelines: {e}")
+
+
+def add_entries_to_timeline(user_id: int, entries: list[tuple[int, float]], max_length: int) -> None:
+    """
+    Adds several (post_id, score) entries to a single timeline if it is already materialized.
+    Used to backfill a timeline when the user follows someone new.
+    """
+    if not entries:
+        return
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for post_id, score in entries:
+            _push_to_existing(keys=[_timeline_key(user_id)], args=[score, post_id, max_length], client=pipe)
+        pipe.execute()
+    except RedisError as e:
+        logger.error(f"Failed to backfill timeline for user {user_id}: {e}")
+
+
+def remove_posts_from_timelines(user_ids: list[int], post_ids: list[int]) -> None:
+    """
+    Removes the given post ids from the timeline of each given user.
+    """
+    if not user_ids or not post_ids:
+        return
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for uid in user_ids:
+            pipe.zrem(_timeline_key(uid), *post_ids)
+        pipe.execute()
+    except RedisError as e:
+        logger.error(f"Failed to prune {len(post_ids)} posts from {len(user_ids)} timelines: {e}")
+
+
+def replace_timeline(user_id: int, entries: list[tuple[int, float]], ttl_seconds: int) -> None:
+    """
+    Atomically replaces a user's timeline with the given (post_id, score) entries.
+    """
+    key = _timeline_key(user_id)
+    try:
+        pipe = redis_client.pipeline(transaction=True)
+        pipe.delete(key)
+        if entries:
+            pipe.zadd(key, {str(post_id): score for post_id, score in entries})
+            pipe.expire(key, ttl_seconds)
+        pipe.execute()
+    except RedisError as e:
+        logger.error(f"Failed to rebuild timeline for user {user_id}: {e}")
+
+
+def get_timeline_page(
+    user_id: int, count: int, ttl_seconds: int, offset: int = 0, before: tuple[float, int] | None = None
+) -> tuple[list[tuple[int, float]], int] | None:
+    """
+    Reads a page of (post_id, score) entries from a user's timeline, newest first
+    (score DESC, post_id DESC).
+
+    Arguments:
+        user_id: The owner of the timeline.
+        count: The maximum number of entries to return.
+        ttl_seconds: The idle expiry that is refreshed on every read.
+        offset: The number of newest entries to skip (page-number mode).
+        before: Only return entries strictly older than this (score, post_id) (cursor mode).
+
+    Returns:
+        A tuple of (entries, timeline_length), or None if the timeline is not
+        materialized or Redis is unavailable, in which case the caller should rebuild it.
+    """
+    key = _timeline_key(user_id)
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.exists(key)
+        pipe.zcard(key)
+        queue_keyset_page(pipe, key, count, offset=0 if before is not None else offset, before=before)
+        pipe.expire(key, ttl_seconds)
+        exists, length, entries, _ = pipe.execute()
+    except RedisError as e:
+        logger.error(f"Failed to read timeline for user {user_id}: {e}")
+        return None
+
+    if not exists:
+        return None
+    return parse_keyset_page(entries), length
+
+
+#----------------------------------------------------------------
+# Pull side of the hybrid feed: authors with very large follower counts are not
+# fanned out. Their recent posts are kept in a per-author sorted set and merged
+# into followers' feeds at read time.
+#----------------------------------------------------------------
+PULL_AUTHORS_KEY = "timeline:pull_authors"
+METRICS_KEY = "timeline:metrics"
+
+
+def _author_posts_key(author_id: int) -> str:
+    return f"author_posts:{author_id}"
+
+
+def add_to_author_recent_posts(author_id: int, post_id: int, score: float, max_length: int) -> None:
+    """Adds a post to its author's capped list of recent follower-visible posts."""
+    key = _author_posts_key(author_id)
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.zadd(key, {str(post_id): score})
+        pipe.zremrangebyrank(key, 0, -(max_length + 1))
+        pipe.execute()
+    except RedisError as e:
+        logger.error(f"Failed to add post {post_id} to recent posts of author {author_id}: {e}")
+
+
+def remove_from_author_recent_posts(author_id: int, post_ids: list[int]) -> None:
+    """Removes posts from their author's list of recent posts."""
+    if not post_ids:
+        return
+    try:
+        redis_client.zrem(_author_posts_key(author_id), *post_ids)
+    except RedisError as e:
+        logger.error(f"Failed to remove posts from recent posts of author {author_id}: {e}")
+
+
+def get_author_recent_posts(author_ids: list[int], count: int, before: tuple[float, int] | None = None) -> dict[int, list[tuple[int, float]]]:
+    """
+    Reads up to `count` of the newest (post_id, score) entries for each author in one round trip,
+    in the timeline's (score DESC, post_id DESC) order, optionally older than a (score, post_id) cursor.
+    Returns an empty dict if Redis is unavailable.
+    """
+    if not author_ids:
+        return {}
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for author_id in author_ids:
+            queue_keyset_page(pipe, _author_posts_key(author_id), count, before=before)
+        results = pipe.execute()
+    except RedisError as e:
+        logger.error(f"Failed to read recent posts for {len(author_ids)} authors: {e}")
+        return {}
+
+    return {author_id: parse_keyset_page(entries) for author_id, entries in zip(author_ids, results)}
+
+
+def set_pull_author(author_id: int, is_pull_author: bool) -> bool:
+    """
+    Marks or unmarks an author as served by pull (read-time merge) instead of push.
+    Returns True if this changed the author's mode.
+    """
+    try:
+        if is_pull_author:
+            return redis_client.sadd(PULL_AUTHORS_KEY, author_id) == 1
+        return redis_client.srem(PULL_AUTHORS_KEY, author_id) == 1
+    except RedisError as e:
+        logger.error(f"Failed to update pull status of author {author_id}: {e}")
+        return False
+
+
+def get_pull_author_ids() -> set[int]:
+    """Returns the ids of all authors currently served by pull."""
+    try:
+        return {int(member) for member in redis_client.smembers(PULL_AUTHORS_KEY)}
+    except RedisError as e:
+        logger.error(f"Failed to read pull authors: {e}")
+        return set()
+
+
+def increment_timeline_metrics(**counters: int) -> None:
+    """
+    Increments push/pull volume counters, e.g.
+    increment_timeline_metrics(push_posts=1, push_deliveries=120).
+    """
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for field, amount in counters.items():
+            if amount:
+                pipe.hincrby(METRICS_KEY, field, amount)
+        pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Failed to record timeline metrics {counters}: {e}")
+
+
+def get_timeline_metrics() -> dict[str, int]:
+    """Returns the accumulated push/pull volume counters."""
+    try:
+        return {field: int(value) for field, value in redis_client.hgetall(METRICS_KEY).items()}
+    except RedisError as e:
+        logger.error(f"Failed to read timeline metrics: {e}")
+        return {}
@@ -0,0 +1,96 @@
+from app.extensions import redis_client
+import logging
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# Hashtag usage is counted in time buckets: one hash of tag_name -> uses per bucket.
+# Every use is written to its minute, hour and day bucket at once, so the coarser levels
+# are always rolled up and a window is read from a fixed, small number of hashes.
+# Each bucket expires once it can no longer fall into the longest window of its level.
+BUCKET_LEVELS = {
+    # level: (bucket size in seconds, retention in seconds)
+    "m": (60, 2 * 3600),
+    "h": (3600, 2 * 86400),
+    "d": (86400, 8 * 86400),
+}
+
+
+def bucket_start(level: str, timestamp: float) -> int:
+    """Returns the start (epoch seconds) of the bucket of the given level containing the timestamp."""
+    size = BUCKET_LEVELS[level][0]
+    return int(timestamp) // size * size
+
+
+# Adds an amount to some tags of one bucket. Uses that are taken back (the post was edited
+# or deleted) are only subtracted from a bucket that still exists, and a tag whose count
+# drops to zero is removed, so the ranking never sees zero or negative counts.
+_ADJUST_BUCKET_SCRIPT = """
+local amount = tonumber(ARGV[1])
+if amount < 0 and redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+for i = 3, #ARGV do
+    if redis.call('HINCRBY', KEYS[1], ARGV[i], amount) <= 0 then
+        redis.call('HDEL', KEYS[1], ARGV[i])
+    end
+end
+redis.call('EXPIREAT', KEYS[1], ARGV[2])
+return 1
+"""
+_adjust_bucket = redis_client.register_script(_ADJUST_BUCKET_SCRIPT)
+
+
+def _bucket_key(level: str, start: int) -> str:
+    return f"trending:{level}:{start}"
+
+
+def record_hashtag_usage(tag_names: list[str], timestamp: float, amount: int = 1) -> None:
+    """
+    Counts one use of each tag (or takes one back, with amount=-1) in the minute, hour and
+    day buckets of the timestamp with one pipeline.
+    """
+    if not tag_names:
+        return
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for level, (_, retention) in BUCKET_LEVELS.items():
+            start = bucket_start(level, timestamp)
+            _adjust_bucket(keys=[_bucket_key(level, start)], args=[amount, start + retention, *tag_names], client=pipe)
+        pipe.execute()
+    except RedisError as e:
+        logger.error(f"Failed to record hashtag usage for {tag_names}: {e}")
+
+
+def get_bucket_counts(level: str, starts: list[int]) -> list[dict[str, int]] | None:
+    """
+    Reads the given buckets of one level with one pipeline, in the order of the starts.
+    Missing buckets are returned as empty dicts. Returns None if Redis is unavailable.
+    """
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for start in starts:
+            pipe.hgetall(_bucket_key(level, start))
+        buckets = pipe.execute()
+    except RedisError as e:
+        logger.error(f"Failed to read trending buckets: {e}")
+        return None
+    return [{tag_name: int(count) for tag_name, count in bucket.items()} for bucket in buckets]
+
+
+def replace_buckets(level: str, buckets: dict[int, dict[str, int]]) -> None:
+    """Atomically replaces the given buckets of one level, e.g. when rebuilding them from Postgres."""
+    if not buckets:
+        return
+    retention = BUCKET_LEVELS[level][1]
+    try:
+        pipe = redis_client.pipeline(transaction=True)
+        for start, counts in buckets.items():
+            key = _bucket_key(level, start)
+            pipe.delete(key)
+            if counts:
+                pipe.hset(key, mapping=counts)
+                pipe.expireat(key, start + retention)
+        pipe.execute()
+    except RedisError as e:
+        logger.error(f"Failed to rebuild trending buckets of level '{level}': {e}")
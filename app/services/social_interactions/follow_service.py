@@ -3,8 +3,10 @@
 from sqlalchemy.orm import Session
 from app.models import User, Follower, Notification
 from app.exceptions import UserNotFoundError
-from app.extensions import socketio
-from app.resources.notitifications.notification_list_resource import serialize_notification
+from app.services.outbox.outbox_service import enqueue_socket_emit
+from app.services.notitifcation.notification_serializer import serialize_notification
+from app.services.post.timeline_service import backfill_author_into_timeline, prune_author_from_timeline
+from app.services.counts.count_service import adjust_counts, followers_counter, following_counter
 
 def follow_user_service(session: Session, follower_id: int, followed_username: str):
     """
@@ -34,6 +36,10 @@ def follow_user_service(session: Session, follower_id: int, followed_username: s
         followed_id=user_to_follow.id
     )
 
+    # Copy the author's recent posts into the follower's home timeline.
+    backfill_author_into_timeline(session, follower_id=follower_id, author_id=user_to_follow.id)
+    adjust_counts(session, {followers_counter(user_to_follow.id): 1, following_counter(follower_id): 1})
+
     # --- 4. Create a Notification ---
     # This is a key side effect of the follow action.
     new_notification=Notification.create(
@@ -56,12 +62,8 @@ def follow_user_service(session: Session, follower_id: int, followed_username: s
         # C. Serialize the data
         serialized_data = serialize_notification(new_notification)
         
-        # D. Emit to the specific user's room
-        socketio.emit(
-            'new_notification',
-            serialized_data,
-            to=f"user_{user_to_follow.id}"
-        )
+        # D. Queue the emit to the specific user's room; it is sent after commit
+        enqueue_socket_emit(session, 'new_notification', serialized_data, room=f"user_{user_to_follow.id}")
     
     return True
 
@@ -83,6 +85,10 @@ def unfollow_user_service(session: Session, follower_id: int, followed_username:
     if not was_deleted:
         # This provides clear feedback if the user wasn't following them in the first place.
         raise ValueError("You are not currently following this user.")
+
+    # Remove the author's posts from the former follower's home timeline.
+    prune_author_from_timeline(session, follower_id=follower_id, author_id=user_to_unfollow.id)
+    adjust_counts(session, {followers_counter(user_to_unfollow.id): -1, following_counter(follower_id): -1})
         
     # Note: We typically don't delete the original "follow" notification.
     
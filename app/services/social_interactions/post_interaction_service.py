@@ -1,88 +1,125 @@
-from sqlalchemy.orm import Session
-from app.models import Post, PostLike, Notification, User
+from datetime import timedelta
+from flask import current_app
+from sqlalchemy import select
+from sqlalchemy.orm import Session, make_transient_to_detached
+from app.models import PostLike, Notification, User
 from app.exceptions import PostNotFoundError, UserNotFoundError
 from uuid import UUID
 
-from app.extensions import socketio
-from app.resources.notitifications.notification_list_resource import serialize_notification
+from app.services.outbox.outbox_service import enqueue_socket_emit
+from app.services.notitifcation.notification_serializer import serialize_notification
+from app.services.post.liked_status_service import record_liked_status
+from app.services.notitifcation.notification_actor_service import attach_recent_actors
+
+def _attach_actor(session: Session, user_id: int, result) -> User:
+    """Attaches the liking user, as returned by the like statement, without loading it again."""
+    actor = User(id=user_id, username=result.username, display_name=result.display_name, profile_picture_url=result.profile_picture_url)
+    make_transient_to_detached(actor)
+    return session.merge(actor, load=False)
+
+def _should_emit(actor_count: int) -> bool:
+    """Pushes a rollup to the author at 1, 2, 4, 8, ... actors, so a viral post does not flood their socket."""
+    return actor_count & (actor_count - 1) == 0
+
+def _refill_recent_likers(session: Session, notification: Notification, post_id: int, recent_limit: int, window_seconds: int) -> None:
+    """Reloads the recent actors of a like rollup whose recent actors were all taken back, from the window's likes."""
+    window_start = notification.aggregation_window_start
+    query = (
+        select(PostLike.user_id)
+        .where(
+            PostLike.post_id == post_id,
+            PostLike.user_id != notification.recipient_user_id,
+            PostLike.created_at >= window_start,
+            PostLike.created_at < window_start + timedelta(seconds=window_seconds)
+        )
+        .order_by(PostLike.created_at.desc(), PostLike.user_id.desc())
+        .limit(recent_limit)
+    )
+    actor_ids = list(session.execute(query).scalars().all())
+    notification.recent_actor_ids = actor_ids
+    notification.actor_user_id = actor_ids[0] if actor_ids else None
 
 def like_post_service(session: Session, user_id: int, post_public_id: UUID) -> bool:
     """
     Handles the business logic for a user liking a post.
+    Idempotent: returns True if the like was created, False if the user had already liked the post.
 
     This includes:
-    1. Finding the post.
-    2. Checking if the user has already liked the post.
-    3. Creating the PostLike record.
-    4. Atomically incrementing the post's like_count.
+    1. Creating the PostLike record and recording a +1 like count delta, in one statement
+       that also resolves the post and the user (PostLike.add_by_public_id).
+    2. Adding the like to the author's aggregated like notification if the like is new.
     """
 
-    # --- 1. Get the actor (the user liking the post) ---
-    actor_user = session.get(User, user_id)
-    if not actor_user:
-        raise UserNotFoundError("User not found.")
-    
-    # --- 2. Find the Post ---
-    post = session.query(Post).filter_by(public_id=post_public_id).first()
-    if not post:
+    # --- 1. Like the Post ---
+    result = PostLike.add_by_public_id(session, user_id, post_public_id, current_app.config['LIKE_COUNTER_SHARDS'])
+    if result is None:
         raise PostNotFoundError("The post you are trying to like does not exist.")
+    if result.username is None:
+        raise UserNotFoundError("User not found.")
+    if not result.changed:
+        return False
+    record_liked_status(session, user_id, result.id, is_liked=True)
 
-    # --- 3. Check for Existing Like ---
-    # The service layer enforces the business rule that a user cannot like a post twice.
-    if PostLike.exists(session, user_id=user_id, post_id=post.id):
-        raise ValueError("You have already liked this post.")
-
-    # --- 4. Create the Like and Update Counter ---
-    PostLike.create(session, user_id=user_id, post_id=post.id)
-    post.like_count += 1
-
-    # --- Create Notification (if not liking your own post) ---
-    if user_id != post.user_id:
-        new_notification = Notification.create(
+    # --- 2. Update the Author's Like Notification (if not liking your own post) ---
+    # Likes of one post within a window share a single rollup notification
+    if user_id != result.user_id:
+        config = current_app.config
+        notification = Notification.aggregate(
             session=session,
-            recipient_user_id=post.user_id,
+            recipient_user_id=result.user_id,
             actor_user_id=user_id,
             action_type='like',
             target_type='post',
-            target_id=post.id
+            target_id=result.id,
+            window_seconds=config['NOTIFICATION_AGGREGATION_WINDOW_SECONDS'],
+            recent_limit=config['NOTIFICATION_RECENT_ACTORS'],
+            occurred_at=result.liked_at
         )
-        # --- A. ADD THIS SOCKET LOGIC ---
-        if new_notification:
-            session.flush() # Flush to get notification ID
-            
-            # B. Manually attach objects for the serializer
-            new_notification.actor = actor_user
-            new_notification.target_object = post
-            
-            # C. Serialize the data
-            serialized_data = serialize_notification(new_notification)
-            
-            # D. Emit to the post author's user room
-            socketio.emit(
-                'new_notification',
-                serialized_data,
-                to=f"user_{post.user_id}"
-            )
+        if _should_emit(notification.actor_count):
+            # Attach what the serializer reads, from the row the like statement returned
+            notification.actor = _attach_actor(session, user_id, result)
+            notification.target_object = {"id": str(result.public_id), "content": result.content}
+            attach_recent_actors(session, [notification])
+
+            serialized_data = serialize_notification(notification)
+
+            # Queue the emit to the post author's user room; it is sent after commit
+            enqueue_socket_emit(session, 'new_notification', serialized_data, room=f"user_{result.user_id}")
     
     return True
 
 def unlike_post_service(session: Session, user_id: int, post_public_id: UUID) -> bool:
     """
     Handles the business logic for a user unliking a post.
+    Idempotent: returns True if a like was removed, False if the user had not liked the post.
+    The like and its -1 like count delta are removed in one statement (PostLike.remove_by_public_id),
+    and the user is taken back out of the like notification the like was counted in, so that
+    liking again does not count them twice.
     """
-    post = session.query(Post).filter_by(public_id=post_public_id).first()
-    if not post:
+    config = current_app.config
+    result = PostLike.remove_by_public_id(session, user_id, post_public_id, config['LIKE_COUNTER_SHARDS'])
+    if result is None:
         raise PostNotFoundError("The post you are trying to unlike does not exist.")
+    if not result.changed:
+        return False
 
-    # The model's delete method returns True if a like was actually deleted.
-    was_deleted = PostLike.delete(session, user_id=user_id, post_id=post.id)
-    
-    if not was_deleted:
-        raise ValueError("You have not liked this post.")
+    record_liked_status(session, user_id, result.id, is_liked=False)
 
-    # Decrement the counter only if a like was successfully removed.
-    # Ensure the count does not go below zero.
-    if post.like_count > 0:
-        post.like_count -= 1
-        
+    if result.liked_at is not None:
+        notification = Notification.remove_actor(
+            session=session,
+            recipient_user_id=result.user_id,
+            actor_user_id=user_id,
+            action_type='like',
+            target_type='post',
+            target_id=result.id,
+            window_seconds=config['NOTIFICATION_AGGREGATION_WINDOW_SECONDS'],
+            occurred_at=result.liked_at
+        )
+        # The remaining actors are all older than the ones kept in recent_actor_ids
+        if notification is not None and not notification.recent_actor_ids:
+            _refill_recent_likers(
+                session, notification, result.id,
+                config['NOTIFICATION_RECENT_ACTORS'], config['NOTIFICATION_AGGREGATION_WINDOW_SECONDS']
+            )
     return True
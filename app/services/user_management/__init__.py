@@ -8,6 +8,8 @@ from .user_settings_service import (
 from .user_onboarding_service import complete_user_onboarding
 from .user_details_service import get_user_details_service
 from .user_connection_service import get_user_connections_service
+from .user_search_service import search_users_service
+from .nearby_users_service import get_nearby_users_service
 from .verify_email_service import verify_email_with_token
 from .resend_verification_email_service import resend_verification_email
 
@@ -15,6 +17,7 @@ from .resend_verification_email_service import resend_verification_email
 __all__ = [
     'register_new_user', 'request_password_reset', 'reset_user_password', 'get_user_profile_by_username',
     'get_user_details_service', 'update_user_settings_service', 'delete_user_service', 'verify_email_with_token',
-    'resend_verification_email', 'complete_user_onboarding', 'get_user_connections_service'
+    'resend_verification_email', 'complete_user_onboarding', 'get_user_connections_service', 'search_users_service',
+    'get_nearby_users_service'
 
 ]
\ No newline at end of file
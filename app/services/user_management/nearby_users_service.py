@@ -0,0 +1,117 @@
+import math
+from flask import current_app
+from sqlalchemy import select, func, cast, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+from geoalchemy2.functions import ST_DWithin, ST_Distance, ST_MakePoint, ST_SetSRID
+from app.models import User, Follower
+from app.services.redis.nearby_cache_operation import get_nearby_users, set_nearby_users
+from utils.app_utils.geohash_utils import encode_geohash, decode_geohash_center
+from utils.model_utils import UserStatus
+
+# This service layer suggests people near the requester, from the locations users shared (users.location).
+# For privacy, every location is rounded to a coarse geohash grid (NEARBY_USERS_GRID_PRECISION) before
+# any distance is shown: the requester's point is snapped to its cell's center, and each result's
+# distance is measured between cell centers and rounded up to whole kilometers. Since the query
+# depends only on the cell, its nearest users are cached per cell and shared by every requester there;
+# the requester's follows are removed from that shared list with a set difference against followers.
+
+_CANDIDATES = 200 # Users kept per cell; enough that removing the requester's follows still fills a page
+
+
+def _requester_location(session: Session, user_id: int) -> tuple[float, float] | None:
+    query = select(func.ST_Y(User.location), func.ST_X(User.location)).where(User.id == user_id, User.location.isnot(None))
+    return session.execute(query).first()
+
+
+def _cell_candidates(session: Session, cell: str, radius: int, precision: int) -> list[tuple[int, int]]:
+    """Returns the active users within radius of the cell's center as (user_id, distance_km), nearest first."""
+    cell_latitude, cell_longitude = decode_geohash_center(cell)
+    point = func.geography(ST_SetSRID(ST_MakePoint(cell_longitude, cell_latitude), 4326))
+    location = func.geography(User.location)
+    user_cell = func.geography(func.ST_PointFromGeoHash(func.ST_GeoHash(User.location, precision)))
+
+    query = (
+        select(User.id, ST_Distance(user_cell, point).label("cell_distance"))
+        .where(
+            User.location.isnot(None),
+            ST_DWithin(location, point, radius),
+            User.account_status == UserStatus.ACTIVE
+        )
+        .order_by(location.op("<->")(point), User.id)
+        .limit(_CANDIDATES)
+    )
+    rows = [(row.id, max(1, math.ceil(row.cell_distance / 1000))) for row in session.execute(query).all()]
+    # Order by the rounded distance too, so exact locations cannot be inferred from the ranking
+    rows.sort(key=lambda row: (row[1], row[0]))
+    return rows
+
+
+def _exclude_followed(session: Session, candidate_ids: list[int], requesting_user_id: int) -> set[int]:
+    """Returns the candidates the requester does not follow yet: candidates EXCEPT followed users."""
+    candidates = select(func.unnest(cast(candidate_ids, ARRAY(Integer))))
+    followed_users = select(Follower.followed_id).where(Follower.follower_id == requesting_user_id)
+    return set(session.execute(candidates.except_(followed_users)).scalars())
+
+
+def get_nearby_users_service(
+    session: Session, requesting_user_id: int, radius: int, limit: int,
+    latitude: float | None = None, longitude: float | None = None
+) -> dict:
+    """
+    Returns active users near a point who the requester does not follow, nearest first, with their
+    distance rounded to the grid. The point defaults to the requester's own location.
+
+    Raises ValueError if no point is given and the requester has no location, for invalid
+    coordinates, or a radius out of range.
+    """
+    if latitude is None or longitude is None:
+        location = _requester_location(session, requesting_user_id)
+        if location is None:
+            raise ValueError("A location is required: send 'lat' and 'lng' or set one in your settings.")
+        latitude, longitude = location
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        raise ValueError("Invalid latitude or longitude values.")
+
+    config = current_app.config
+    max_radius = config['NEARBY_USERS_MAX_RADIUS_METERS']
+    if not 0 < radius <= max_radius:
+        raise ValueError(f"Radius must be between 1 and {max_radius} meters.")
+
+    # 1. --- The nearest users of the requester's grid cell, shared by everyone in it ---
+    precision = config['NEARBY_USERS_GRID_PRECISION']
+    cell = encode_geohash(latitude, longitude, precision)
+    candidates = get_nearby_users(cell, radius)
+    if candidates is None:
+        candidates = _cell_candidates(session, cell, radius, precision)
+        set_nearby_users(cell, radius, candidates, config['NEARBY_USERS_CACHE_TTL_SECONDS'])
+    if not candidates:
+        return {"users": []}
+
+    # 2. --- Remove the requester and the users they follow ---
+    remaining_ids = _exclude_followed(session, [user_id for user_id, _ in candidates], requesting_user_id)
+    remaining_ids.discard(requesting_user_id)
+    page = [(user_id, distance_km) for user_id, distance_km in candidates if user_id in remaining_ids][:limit]
+    if not page:
+        return {"users": []}
+
+    # 3. --- Load the page; cached candidates may have been deactivated or cleared their location since ---
+    user_query = (
+        select(User.id, User.username, User.display_name, User.profile_picture_url)
+        .where(
+            User.id.in_([user_id for user_id, _ in page]),
+            User.account_status == UserStatus.ACTIVE,
+            User.location.isnot(None)
+        )
+    )
+    users = {row.id: row for row in session.execute(user_query).all()}
+
+    return {"users": [
+        {
+            "username": users[user_id].username,
+            "authorName": users[user_id].display_name,
+            "authorAvatarUrl": users[user_id].profile_picture_url,
+            "distanceKm": distance_km,
+        }
+        for user_id, distance_km in page if user_id in users
+    ]}
@@ -4,6 +4,7 @@ from datetime import date
 from app.models import User
 from app.exceptions import UserAlreadyExistsError, InvalidEmailFormatError
 from app.services.account_management.email_change_service import send_account_verification_email_service
+from app.services.mentions.mention_service import invalidate_mention_cache
 from utils.app_utils import validate_email, validate_password, PASSWORD_ERROR_STRING
 
 def register_new_user(session: Session, username: str, email: str, 
@@ -60,6 +61,7 @@ def register_new_user(session: Session, username: str, email: str,
         display_name=display_name
     )
     session.flush()  # Ensure the user is created before proceeding
+    invalidate_mention_cache(session, new_user.username) # The name may be cached as missing
 
     # 4. --- Send Verification Email ---
     send_account_verification_email_service(session=session, user=new_user)
@@ -1,16 +1,22 @@
-import math
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy import select, tuple_
 from app.models import User, Follower
 from app.exceptions import UserNotFoundError
+from app.services.counts.count_service import COUNT_EXACT, resolve_count, page_totals, follow_counters
+from utils.app_utils.pagination_utils import encode_cursor, decode_cursor
 
 def get_user_connections_service(
     session: Session,
     target_username: str,
     connection_type: str,
     page: int,
-    per_page: int) -> dict:
-    
+    per_page: int,
+    cursor: str | None = None,
+    count_mode: str | None = None) -> dict:
+    """
+    Fetches a user's followers or followings ordered by username.
+    Uses keyset pagination on (username, id) when a cursor is given, page number otherwise.
+    """
     # 1. Find the target user
     target_user = session.execute(
         select(User).where(User.username == target_username)
@@ -37,25 +43,35 @@ def get_user_connections_service(
     else:
         raise ValueError("Invalid connection type specified.")
 
-    # 3. Get the total count for pagination
-    # We create a subquery from the base to count from
-    count_query = select(func.count()).select_from(base_query.subquery())
-    total_items = session.execute(count_query).scalar() or 0
-    total_pages = math.ceil(total_items / per_page) if total_items > 0 else 1
+    # 3. Get the total count for pagination from the user's maintained follower/following counter
+    total_items, total_pages = page_totals(
+        resolve_count(session, count_mode or COUNT_EXACT, base_query, counters=follow_counters(target_user.id, connection_type)),
+        per_page
+    )
+    if total_items == 0:
+        total_pages = 1
 
     # 4. Get the paginated list of users
     paginated_query = (
         base_query
-        .order_by(User.username)
-        .limit(per_page)
-        .offset((page - 1) * per_page)
+        .order_by(User.username, User.id)
+        .limit(per_page + 1)
     )
+    if cursor:
+        cursor_username, cursor_id = decode_cursor(cursor)
+        paginated_query = paginated_query.where(tuple_(User.username, User.id) > tuple_(cursor_username, cursor_id))
+    else:
+        paginated_query = paginated_query.offset((page - 1) * per_page)
     
     users = session.execute(paginated_query).scalars().all()
+    has_more = len(users) > per_page
+    users = users[:per_page]
+    next_cursor = encode_cursor(users[-1].username, users[-1].id) if has_more and users else None
 
     return {
         "users": users,
         "totalPages": total_pages,
         "currentPage": page,
-        "totalItems": total_items
+        "totalItems": total_items,
+        "nextCursor": next_cursor
     }
\ No newline at end of file
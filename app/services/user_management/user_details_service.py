@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import select
 from app.models import User
 from app.exceptions import UserNotFoundError
@@ -7,18 +7,20 @@ def get_user_details_service(session: Session, user_id: int) -> User:
     """
     Fetches a user by their ID, eagerly loading all relationships
     needed for full serialization (followers, following, posts).
+    Each collection is loaded with its own batched query; joining all three
+    would return followers x following x posts rows for a single user.
     """
     query = (
         select(User)
         .options(
-            joinedload(User.followers),
-            joinedload(User.followed),
-            joinedload(User.posts)
+            selectinload(User.followers),
+            selectinload(User.followed),
+            selectinload(User.posts)
         )
         .where(User.id == user_id)
     )
     
-    user = session.execute(query).unique().scalar_one_or_none()
+    user = session.execute(query).scalar_one_or_none()
     
     if not user:
         raise UserNotFoundError("User not found.")
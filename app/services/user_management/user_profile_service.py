@@ -1,8 +1,8 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, select, desc, or_, and_, exists
+from sqlalchemy import select, and_, exists
 from app.models import User, Post, Follower
 from app.exceptions import UserNotFoundError
-from utils.model_utils.enums import PostVisibility
+from app.services.counts.count_service import maintained_count, follow_counters, user_posts_counters
 
 # This service layer contains the business logic for fetching user profile data.
 
@@ -20,28 +20,14 @@ def get_user_profile_by_username(session: Session, username: str, requesting_use
         raise UserNotFoundError("User not found.")
 
     # 2. --- Get Follower and Following Counts ---
-    follower_count_query = select(func.count(Follower.follower_id)).where(Follower.followed_id == user.id)
-    follower_count = session.execute(follower_count_query).scalar()
-
-    following_count_query = select(func.count(Follower.followed_id)).where(Follower.follower_id == user.id)
-    following_count = session.execute(following_count_query).scalar()
+    # Served from maintained counters; they are only recounted when missing from Redis.
+    follower_count = maintained_count(session, follow_counters(user.id, 'followers'))
+    following_count = maintained_count(session, follow_counters(user.id, 'following'))
 
     # 3. --- Get the User's Posts count ---
-    posts_count_query = select(func.count(Post.id)).where(Post.user_id == user.id)
-    
     # 4. --- Handle Post Visibility ---
-    visibility_conditions = [Post.visibility == PostVisibility.PUBLIC]
-    if requesting_user_id:
-        if requesting_user_id == user.id: # The user is viewing their own profile
-            visibility_conditions.append(Post.visibility.in_([PostVisibility.FOLLOWERS_ONLY, PostVisibility.PRIVATE]))
-        else: # A different user is viewing the profile
-            is_follower_subquery = select(exists().where(
-                and_(Follower.follower_id == requesting_user_id, Follower.followed_id == user.id)
-            )).scalar_subquery()
-            visibility_conditions.append(and_(Post.visibility == PostVisibility.FOLLOWERS_ONLY, is_follower_subquery))
-
-    posts_count_query = posts_count_query.where(or_(*visibility_conditions))
-    posts_count = session.execute(posts_count_query).scalar()
+    visibilities = Post.get_visible_visibilities(session, user.id, requesting_user_id)
+    posts_count = maintained_count(session, user_posts_counters(user.id, visibilities))
 
     # 5. --- CHECK 'isFollowing' STATUS ---
     is_following = False
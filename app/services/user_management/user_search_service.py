@@ -0,0 +1,179 @@
+import logging
+import threading
+import time
+from flask import current_app
+from sqlalchemy import select, func, exists, or_
+from sqlalchemy.orm import Session
+from app.extensions import db
+from app.models import User, Follower
+from utils.model_utils import UserStatus
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+logger = logging.getLogger(__name__)
+
+# This service layer answers the user typeahead. Most keystrokes are 1 to 3 characters long and
+# would match a large part of the table, so those are answered from an in-process prefix index
+# of the most-followed users, rebuilt in the background every USER_SEARCH_PREFIX_REFRESH_SECONDS. Longer queries
+# use the trigram indexes on lower(username) and lower(display_name). Accounts the requester
+# follows are ranked first in both paths.
+
+_PREFIX_CANDIDATES = 50 # Users kept per prefix; more than a page so the follow boost can reorder them
+
+
+class _PrefixIndex:
+    """Maps 1 to max_prefix character prefixes of usernames and display names to popular users."""
+
+    def __init__(self):
+        self.entries: dict[str, list[dict]] | None = None # None until the first build finished
+        self.built_at = 0.0
+        self._lock = threading.Lock()
+
+    def is_stale(self, refresh_seconds: int) -> bool:
+        return time.monotonic() - self.built_at > refresh_seconds
+
+    def refresh_in_background(self, app: 'Flask') -> None:
+        """Starts a rebuild unless one is running. Requests keep reading the previous index meanwhile."""
+        if not self._lock.acquire(blocking=False):
+            return
+        threading.Thread(target=self._refresh, args=(app,), daemon=True).start()
+
+    def _refresh(self, app: 'Flask') -> None:
+        try:
+            with app.app_context():
+                try:
+                    self.entries = self._build(db.session, app.config['USER_SEARCH_PREFIX_POPULAR_USERS'], app.config['USER_SEARCH_MAX_PREFIX'])
+                    self.built_at = time.monotonic()
+                finally:
+                    db.session.remove()
+        except Exception as e:
+            logger.error(f"Failed to rebuild the user search prefix index: {e}", exc_info=True)
+        finally:
+            self._lock.release()
+
+    @staticmethod
+    def _build(session: Session, popular_users: int, max_prefix: int) -> dict[str, list[dict]]:
+        follower_counts = (
+            select(Follower.followed_id, func.count().label("follower_count"))
+            .group_by(Follower.followed_id)
+            .order_by(func.count().desc())
+            .limit(popular_users)
+            .subquery()
+        )
+        query = (
+            select(User.id, User.username, User.display_name, User.profile_picture_url)
+            .join(follower_counts, follower_counts.c.followed_id == User.id)
+            .where(User.account_status == UserStatus.ACTIVE)
+            .order_by(follower_counts.c.follower_count.desc(), User.id)
+        )
+        entries = {}
+        for row in session.execute(query).all():
+            user = _user_entry(row)
+            prefixes = set()
+            for name in (row.username, row.display_name or ""):
+                name = name.lower()
+                prefixes.update(name[:length] for length in range(1, min(max_prefix, len(name)) + 1))
+            for prefix in prefixes:
+                users = entries.setdefault(prefix, [])
+                if len(users) < _PREFIX_CANDIDATES: # Rows arrive most-followed first
+                    users.append(user)
+        return entries
+
+
+_prefix_index = _PrefixIndex()
+
+
+def _user_entry(row) -> dict:
+    return {"id": row.id, "username": row.username, "displayName": row.display_name, "avatarUrl": row.profile_picture_url}
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _serialize(user: dict, requesting_user_id: int | None, followed_ids: set[int]) -> dict:
+    return {
+        "username": user["username"],
+        "authorName": user["displayName"],
+        "authorAvatarUrl": user["avatarUrl"],
+        "isFollowing": user["id"] in followed_ids,
+        "isSelf": user["id"] == requesting_user_id,
+    }
+
+
+def _search_short_prefix(session: Session, prefix: str, requesting_user_id: int | None, limit: int) -> tuple[list[dict], set[int]]:
+    """Answers a short prefix from the prefix index, plus the requester's own follows matching it."""
+    candidates = _prefix_index.entries.get(prefix, [])
+
+    followed_matches = []
+    if requesting_user_id is not None:
+        # Followed accounts rank first even if they are not popular; the follows of one user are a small range
+        pattern = f"{_escape_like(prefix)}%"
+        followed_query = (
+            select(User.id, User.username, User.display_name, User.profile_picture_url)
+            .join(Follower, Follower.followed_id == User.id)
+            .where(
+                Follower.follower_id == requesting_user_id,
+                User.account_status == UserStatus.ACTIVE,
+                or_(func.lower(User.username).like(pattern), func.lower(User.display_name).like(pattern))
+            )
+            .order_by(User.username)
+            .limit(limit)
+        )
+        followed_matches = [_user_entry(row) for row in session.execute(followed_query).all()]
+
+    followed_ids = {user["id"] for user in followed_matches}
+    results = followed_matches + [user for user in candidates if user["id"] not in followed_ids]
+    return results[:limit], followed_ids
+
+
+def _search_trigram(session: Session, query_text: str, requesting_user_id: int | None, limit: int) -> tuple[list[dict], set[int]]:
+    """Answers a longer query from the trigram indexes."""
+    lower_username = func.lower(User.username)
+    username_prefix = lower_username.like(f"{_escape_like(query_text)}%")
+
+    ordering = [username_prefix.desc(), func.similarity(lower_username, query_text).desc(), User.username]
+    columns = [User.id, User.username, User.display_name, User.profile_picture_url]
+    if requesting_user_id is not None:
+        is_followed = exists().where(Follower.follower_id == requesting_user_id, Follower.followed_id == User.id)
+        columns.append(is_followed.label("is_followed"))
+        ordering.insert(0, is_followed.desc())
+
+    query = (
+        select(*columns)
+        .where(
+            User.account_status == UserStatus.ACTIVE,
+            or_(username_prefix, func.lower(User.display_name).like(f"%{_escape_like(query_text)}%"))
+        )
+        .order_by(*ordering)
+        .limit(limit)
+    )
+    rows = session.execute(query).all()
+
+    users = [_user_entry(row) for row in rows]
+    followed_ids = {row.id for row in rows if requesting_user_id is not None and row.is_followed}
+    return users, followed_ids
+
+
+def search_users_service(session: Session, query_text: str, requesting_user_id: int | None, limit: int) -> dict:
+    """
+    Returns the users matching a typeahead query on username or display name, followed accounts first.
+    Raises ValueError for an empty query.
+    """
+    query_text = (query_text or "").strip().lstrip("@").lower()
+    if not query_text:
+        raise ValueError("Search query cannot be empty.")
+
+    config = current_app.config
+    if _prefix_index.is_stale(config['USER_SEARCH_PREFIX_REFRESH_SECONDS']):
+        _prefix_index.refresh_in_background(current_app._get_current_object())
+
+    # Until the prefix index is first built, short prefixes fall back to the database as well
+    if len(query_text) <= config['USER_SEARCH_MAX_PREFIX'] and _prefix_index.entries is not None:
+        users, followed_ids = _search_short_prefix(session, query_text, requesting_user_id, limit)
+    else:
+        users, followed_ids = _search_trigram(session, query_text, requesting_user_id, limit)
+
+    return {"users": [_serialize(user, requesting_user_id, followed_ids) for user in users]}
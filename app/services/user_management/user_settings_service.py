@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from app.models import User
 from app.exceptions import UserNotFoundError, InvalidCredentialsError
+from app.services.mentions.mention_service import invalidate_mention_cache
 
 # This service layer contains the business logic for updating user settings.
 
@@ -24,7 +25,8 @@ def update_user_settings_service(session: Session, user_id: int, settings_data:
         "display_name", 
         "bio", 
         "profile_picture_url", 
-        "country"
+        "country",
+        "location_coords"
     }
 
     fields_to_strip = {"display_name", "bio", "profile_picture_url"}
@@ -43,6 +45,8 @@ def update_user_settings_service(session: Session, user_id: int, settings_data:
     if profile_update_data:
         # Delegate the actual update to the lean model method.
         User.update(session, user_id=user_id, **profile_update_data)
+        if "display_name" in profile_update_data:
+            invalidate_mention_cache(session, user.username) # Mention entries carry the display name
 
     # 3. --- Update Notification Preferences (JSONB field) ---
     # The service layer handles the logic for updating the JSONB field directly.
@@ -70,5 +74,6 @@ def delete_user_service(session: Session, user_id: int, password: str) -> bool:
         raise InvalidCredentialsError("Incorrect password.")
 
     # Delegate the final deletion to the lean model method.
+    invalidate_mention_cache(session, user.username)
     return User.delete(session, user_id=user_id)
 
@@ -0,0 +1,31 @@
+"""add a geography index on posts.location for nearby posts
+
+Revision ID: 3c41e07b9a52
+Revises: 12bba1f4d8b9
+Create Date: 2026-10-16 13:58:21.417630
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c41e07b9a52'
+down_revision = '12bba1f4d8b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_posts_location_geography', 'posts', [sa.text('geography(location)')],
+            unique=False, postgresql_using='gist', postgresql_where=sa.text('location IS NOT NULL'),
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_posts_location_geography', table_name='posts', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,30 @@
+"""add the like_count_deltas table for write-behind like counters
+
+Revision ID: 5f0a9c3d7e21
+Revises: b7e2d5a1c904
+Create Date: 2026-10-16 15:02:13.558120
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5f0a9c3d7e21'
+down_revision = 'b7e2d5a1c904'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('like_count_deltas',
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('shard', sa.SmallInteger(), nullable=False),
+    sa.Column('delta', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('post_id', 'shard')
+    )
+
+
+def downgrade():
+    op.drop_table('like_count_deltas')
@@ -0,0 +1,38 @@
+"""add trigram indexes on the lower-cased user names for the typeahead
+
+Revision ID: 7d978b55a9bb
+Revises: aae1262743f7
+Create Date: 2026-10-16 12:31:45.902118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7d978b55a9bb'
+down_revision = 'aae1262743f7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_users_username_trgm', 'users', [sa.text('lower(username) gin_trgm_ops')],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'idx_users_display_name_trgm', 'users', [sa.text('lower(display_name) gin_trgm_ops')],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade():
+    # The pg_trgm extension is left installed; other objects may depend on it.
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_users_display_name_trgm', table_name='users', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_users_username_trgm', table_name='users', postgresql_concurrently=True, if_exists=True)
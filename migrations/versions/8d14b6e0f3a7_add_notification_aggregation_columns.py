@@ -0,0 +1,43 @@
+"""add aggregation columns and the rollup index to notifications
+
+Revision ID: 8d14b6e0f3a7
+Revises: 5f0a9c3d7e21
+Create Date: 2026-10-16 15:41:36.902274
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '8d14b6e0f3a7'
+down_revision = '5f0a9c3d7e21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('notifications', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('actor_count', sa.Integer(), server_default='1', nullable=False))
+        batch_op.add_column(sa.Column('recent_actor_ids', postgresql.ARRAY(sa.Integer()), nullable=True))
+        batch_op.add_column(sa.Column('aggregation_window_start', sa.TIMESTAMP(timezone=True), nullable=True))
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_notifications_aggregation', 'notifications',
+            ['recipient_user_id', 'action_type', 'target_type', 'target_id', 'aggregation_window_start'],
+            unique=True, postgresql_where=sa.text('aggregation_window_start IS NOT NULL'),
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('uq_notifications_aggregation', table_name='notifications', postgresql_concurrently=True, if_exists=True)
+
+    with op.batch_alter_table('notifications', schema=None) as batch_op:
+        batch_op.drop_column('aggregation_window_start')
+        batch_op.drop_column('recent_actor_ids')
+        batch_op.drop_column('actor_count')
@@ -0,0 +1,41 @@
+"""add a generated full-text search vector on posts.content
+
+Revision ID: aae1262743f7
+Revises: fe858422f98b
+Create Date: 2026-10-16 11:48:03.117264
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'aae1262743f7'
+down_revision = 'fe858422f98b'
+branch_labels = None
+depends_on = None
+
+
+# Adding a stored generated column rewrites the posts table under an exclusive lock,
+# so this revision should run in a maintenance window on large installations.
+
+def upgrade():
+    op.add_column('posts', sa.Column(
+        'search_vector', postgresql.TSVECTOR(),
+        sa.Computed("to_tsvector('english', coalesce(content, ''))", persisted=True), nullable=True
+    ))
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_posts_search_vector', 'posts', ['search_vector'],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_posts_search_vector', table_name='posts', postgresql_concurrently=True, if_exists=True)
+
+    op.drop_column('posts', 'search_vector')
@@ -0,0 +1,31 @@
+"""add a geography index on users.location for nearby people
+
+Revision ID: b7e2d5a1c904
+Revises: 3c41e07b9a52
+Create Date: 2026-10-16 14:26:47.205913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2d5a1c904'
+down_revision = '3c41e07b9a52'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_users_location_geography', 'users', [sa.text('geography(location)')],
+            unique=False, postgresql_using='gist', postgresql_where=sa.text('location IS NOT NULL'),
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_users_location_geography', table_name='users', postgresql_concurrently=True, if_exists=True)
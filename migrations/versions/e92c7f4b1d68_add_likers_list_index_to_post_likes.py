@@ -0,0 +1,33 @@
+"""replace the post_likes post_id index with one ordered for the likers list
+
+Revision ID: e92c7f4b1d68
+Revises: 8d14b6e0f3a7
+Create Date: 2026-10-16 16:05:52.731149
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e92c7f4b1d68'
+down_revision = '8d14b6e0f3a7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_post_likes_post_created_at', 'post_likes', ['post_id', sa.literal_column('created_at DESC'), sa.literal_column('user_id DESC')],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        # The new index leads with post_id, so it also serves the foreign key
+        op.drop_index('idx_post_likes_post_id', table_name='post_likes', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index('idx_post_likes_post_id', 'post_likes', ['post_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('idx_post_likes_post_created_at', table_name='post_likes', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,79 @@
+"""add composite and partial indexes for the hot read paths
+
+Revision ID: f22609aa99e1
+Revises: 7453acc8a3de
+Create Date: 2026-10-16 10:12:41.208311
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f22609aa99e1'
+down_revision = '7453acc8a3de'
+branch_labels = None
+depends_on = None
+
+
+# CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction, so every statement
+# runs in an autocommit block. The new indexes are built before the ones they replace
+# are dropped, so the read paths are never left without an index.
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        # Profile list and timeline rebuilds: user_id = ? ORDER BY created_at DESC, id DESC
+        op.create_index(
+            'idx_posts_user_created_at', 'posts',
+            ['user_id', sa.literal_column('created_at DESC'), sa.literal_column('id DESC')],
+            unique=False, postgresql_include=['visibility', 'updated_at'], postgresql_concurrently=True, if_not_exists=True
+        )
+        # Public feed and ring buffer rebuilds: visibility = PUBLIC ORDER BY created_at DESC, id DESC
+        op.create_index(
+            'idx_posts_public_created_at', 'posts',
+            [sa.literal_column('created_at DESC'), sa.literal_column('id DESC')],
+            unique=False, postgresql_include=['updated_at'], postgresql_where=sa.text("visibility = 'PUBLIC'"),
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'idx_notifications_recipient_created_at', 'notifications',
+            ['recipient_user_id', sa.literal_column('created_at DESC'), sa.literal_column('id DESC')],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'idx_notifications_recipient_unread', 'notifications', ['recipient_user_id'],
+            unique=False, postgresql_where=sa.text('is_read = false'), postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'idx_followers_followed_created_at', 'followers',
+            ['followed_id', sa.literal_column('created_at DESC')],
+            unique=False, postgresql_include=['follower_id'], postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'idx_followers_follower_created_at', 'followers',
+            ['follower_id', sa.literal_column('created_at DESC')],
+            unique=False, postgresql_include=['followed_id'], postgresql_concurrently=True, if_not_exists=True
+        )
+
+        # Superseded by the composite indexes above (same leading column)
+        op.drop_index('idx_posts_user_id', table_name='posts', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_notifications_recipient_is_read', table_name='notifications', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_followers_followed_id', table_name='followers', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index('idx_followers_followed_id', 'followers', ['followed_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(
+            'idx_notifications_recipient_is_read', 'notifications',
+            ['recipient_user_id', 'is_read', sa.literal_column('created_at DESC')],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index('idx_posts_user_id', 'posts', ['user_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+        op.drop_index('idx_followers_follower_created_at', table_name='followers', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_followers_followed_created_at', table_name='followers', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_notifications_recipient_unread', table_name='notifications', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_notifications_recipient_created_at', table_name='notifications', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_posts_public_created_at', table_name='posts', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_posts_user_created_at', table_name='posts', postgresql_concurrently=True, if_exists=True)
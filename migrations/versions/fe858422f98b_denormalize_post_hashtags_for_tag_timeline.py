@@ -0,0 +1,64 @@
+"""copy post created_at and visibility onto post_hashtags for the tag timeline
+
+Revision ID: fe858422f98b
+Revises: f22609aa99e1
+Create Date: 2026-10-16 11:02:17.540932
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'fe858422f98b'
+down_revision = 'f22609aa99e1'
+branch_labels = None
+depends_on = None
+
+# Posts whose hashtag rows are backfilled per statement; each batch commits on its own
+BACKFILL_BATCH_SIZE = 10000
+
+
+def upgrade():
+    post_visibility_enum = postgresql.ENUM(name='post_visibility_enum', create_type=False)
+
+    # With a non-volatile default, ADD COLUMN (PostgreSQL 11+) only records the default in the
+    # catalog instead of rewriting the table. Every row then holds a placeholder until the backfill.
+    op.add_column('post_hashtags', sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+    op.add_column('post_hashtags', sa.Column('visibility', post_visibility_enum, server_default='PUBLIC', nullable=False))
+
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        # Backfilled in post id ranges, each committed on its own, so no statement locks or
+        # rewrites the whole table and the dead tuples can be vacuumed as the backfill runs.
+        # The final open-ended range catches rows of posts created while it was running.
+        bind = op.get_bind()
+        min_post_id, max_post_id = bind.execute(sa.text("SELECT min(post_id), max(post_id) FROM post_hashtags")).one()
+        backfill = sa.text(
+            "UPDATE post_hashtags SET created_at = posts.created_at, visibility = posts.visibility "
+            "FROM posts WHERE posts.id = post_hashtags.post_id "
+            "AND post_hashtags.post_id >= :start AND post_hashtags.post_id < :end"
+        )
+        if min_post_id is not None:
+            for start in range(min_post_id, max_post_id + 1, BACKFILL_BATCH_SIZE):
+                bind.execute(backfill, {"start": start, "end": start + BACKFILL_BATCH_SIZE})
+            bind.execute(backfill, {"start": max_post_id + 1, "end": 2 ** 31 - 1})
+
+        # Tag timeline: hashtag_id = ? ORDER BY created_at DESC, post_id DESC
+        op.create_index(
+            'idx_posthashtags_hashtag_created_at', 'post_hashtags',
+            ['hashtag_id', sa.literal_column('created_at DESC'), sa.literal_column('post_id DESC')],
+            unique=False, postgresql_include=['visibility'], postgresql_concurrently=True, if_not_exists=True
+        )
+        # Superseded by the composite index above (same leading column)
+        op.drop_index('idx_posthashtags_hashtag_id', table_name='post_hashtags', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index('idx_posthashtags_hashtag_id', 'post_hashtags', ['hashtag_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('idx_posthashtags_hashtag_created_at', table_name='post_hashtags', postgresql_concurrently=True, if_exists=True)
+
+    op.drop_column('post_hashtags', 'visibility')
+    op.drop_column('post_hashtags', 'created_at')
@@ -87,6 +87,14 @@ wait_for_redis
 # Run database initialization and exit if it fails.
 initialize_db || exit 1
 
+# Start the outbox worker, which emits socket events recorded by committed requests.
+echo "Starting outbox worker..."
+flask outbox worker &
+
+# Start the counter flusher, which applies pending like count deltas to posts.
+echo "Starting counter flusher..."
+flask counters flush &
+
 # Start the Gunicorn server in the background.
 echo "Starting Gunicorn server..."
 exec gunicorn --bind 0.0.0.0:5000 --timeout 60 -k geventwebsocket.gunicorn.workers.GeventWebSocketWorker -w 4 run:app
@@ -0,0 +1,77 @@
+import os
+import pytest
+from flask_migrate import upgrade
+from sqlalchemy import text
+
+# Database tests run against a real PostgreSQL + PostGIS database, since what they check
+# (query plans, row locks, ON CONFLICT) only exists there. Point TEST_DATABASE_URL at a
+# disposable database: its public schema is dropped and rebuilt from the migrations.
+# Tests of the Redis caches also need TEST_REDIS_URL, a disposable Redis database that is
+# flushed after every test. Without them the tests are skipped. Benchmarks marked
+# 'benchmark' only run with RUN_BENCHMARKS=1.
+
+TEST_DATABASE_URL = os.getenv('TEST_DATABASE_URL')
+TEST_REDIS_URL = os.getenv('TEST_REDIS_URL')
+if TEST_REDIS_URL:
+    # The Redis client is created on import, so it must see the test URL first
+    os.environ['REDIS_URL'] = TEST_REDIS_URL
+
+from app import create_app
+from app.config import Config
+from app.extensions import db, redis_client
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: slow benchmark, only run with RUN_BENCHMARKS=1")
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.getenv('RUN_BENCHMARKS') == '1':
+        return
+    skip_benchmark = pytest.mark.skip(reason="benchmark; set RUN_BENCHMARKS=1 to run it")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+class TestConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = TEST_DATABASE_URL
+
+
+@pytest.fixture(scope="session")
+def app():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    app = create_app(TestConfig)
+    with app.app_context():
+        with db.engine.begin() as connection:
+            connection.execute(text("DROP SCHEMA public CASCADE"))
+            connection.execute(text("CREATE SCHEMA public"))
+        upgrade(directory=MIGRATIONS_DIR)
+        yield app
+        db.session.remove()
+
+
+@pytest.fixture
+def session(app):
+    """The app's scoped session; every table is emptied after the test."""
+    yield db.session
+    db.session.rollback()
+    tables = db.session.execute(text(
+        "SELECT string_agg(quote_ident(tablename), ', ') FROM pg_tables "
+        "WHERE schemaname = 'public' AND tablename NOT IN ('alembic_version', 'spatial_ref_sys')"
+    )).scalar()
+    db.session.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+    db.session.commit()
+
+
+@pytest.fixture
+def redis(app):
+    """The app's Redis client; its database is flushed after the test."""
+    if not TEST_REDIS_URL:
+        pytest.skip("TEST_REDIS_URL is not set")
+    redis_client.flushdb()
+    yield redis_client
+    redis_client.flushdb()
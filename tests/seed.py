@@ -0,0 +1,33 @@
+from sqlalchemy import text
+from app.extensions import db
+
+# Bulk seeding helpers for the database tests. Rows are generated in SQL, so large
+# datasets cost one statement instead of one ORM object per row.
+
+
+def create_users(session, count: int) -> list[int]:
+    """Inserts active users with one statement and returns their ids."""
+    return session.execute(text(
+        "INSERT INTO users (public_id, username, email, display_name, account_status) "
+        "SELECT gen_random_uuid(), name, name || '@example.com', 'User ' || n, 'ACTIVE' "
+        "FROM generate_series(1, :count) AS n, LATERAL (SELECT 'user_' || substr(md5(random()::text), 1, 12) || '_' || n AS name) AS u "
+        "RETURNING id"
+    ), {"count": count}).scalars().all()
+
+
+def create_posts(session, user_ids: list[int], per_user: int, visibility: str = 'PUBLIC') -> list[int]:
+    """Inserts per_user posts for every user, spread over the last days, and returns their ids."""
+    return session.execute(text(
+        "INSERT INTO posts (public_id, user_id, content, visibility, created_at, updated_at) "
+        "SELECT gen_random_uuid(), u, 'post ' || n || ' by ' || u, CAST(:visibility AS post_visibility_enum), "
+        "       now() - n * interval '1 minute', now() - n * interval '1 minute' "
+        "FROM unnest(CAST(:user_ids AS integer[])) AS u, generate_series(1, :per_user) AS n RETURNING id"
+    ), {"user_ids": list(user_ids), "per_user": per_user, "visibility": visibility}).scalars().all()
+
+
+def vacuum_analyze(session, *tables: str) -> None:
+    """Refreshes statistics and visibility maps, so plans match a long-running database."""
+    session.commit()
+    with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        for table in tables:
+            connection.execute(text(f"VACUUM ANALYZE {table}"))
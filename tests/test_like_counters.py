@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import create_engine, select, func
+from sqlalchemy.orm import Session
+from app.models import Post, PostLike, LikeCountDelta, Notification
+from app.services.counters.like_counter_service import flush_like_counters
+from app.services.social_interactions.post_interaction_service import like_post_service
+from tests.conftest import TEST_DATABASE_URL
+from tests.seed import create_users, create_posts
+
+# Likes add to sharded delta rows instead of updating posts.like_count, and the flusher folds
+# the deltas in later. Concurrent likes of one post must neither lose nor double-count a like.
+
+LIKERS = 500
+WORKERS = 50
+
+
+def test_500_parallel_likes_lose_no_updates(app, session):
+    author_id, *liker_ids = create_users(session, LIKERS + 1)
+    post_id = create_posts(session, [author_id], per_user=1)[0]
+    post_public_id = session.execute(select(Post.public_id).where(Post.id == post_id)).scalar_one()
+    session.commit()
+
+    # One connection per worker, so the likes really run in parallel transactions
+    engine = create_engine(TEST_DATABASE_URL, pool_size=WORKERS, max_overflow=0)
+
+    def like(user_id: int) -> bool:
+        with app.app_context(), Session(engine) as worker_session:
+            created = like_post_service(worker_session, user_id, post_public_id)
+            worker_session.commit()
+            return created
+
+    try:
+        with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+            results = list(pool.map(like, liker_ids))
+    finally:
+        engine.dispose()
+    assert all(results)
+
+    # Pending deltas are visible before the flush...
+    assert LikeCountDelta.get_pending(session, [post_id]) == {post_id: LIKERS}
+
+    # ...and all of them land in posts.like_count after it
+    while flush_like_counters(session, batch_size=1000):
+        pass
+    session.expire_all()
+    assert session.execute(select(Post.like_count).where(Post.id == post_id)).scalar_one() == LIKERS
+    assert session.execute(select(func.count()).select_from(PostLike).where(PostLike.post_id == post_id)).scalar_one() == LIKERS
+    assert LikeCountDelta.get_pending(session, [post_id]) == {}
+
+    # Every like was counted once in the author's like rollup(s)
+    actor_count = session.execute(
+        select(func.sum(Notification.actor_count)).where(Notification.recipient_user_id == author_id)
+    ).scalar_one()
+    assert actor_count == LIKERS
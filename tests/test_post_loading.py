@@ -0,0 +1,98 @@
+import statistics
+import time
+import pytest
+from sqlalchemy import event, select, text
+from sqlalchemy.orm import joinedload
+from app.extensions import db
+from app.models import Post
+from utils.model_utils.enums import PostVisibility
+from tests.seed import create_users, create_posts, vacuum_analyze
+
+# Benchmark of the two ways of loading a feed page with its hashtags: joinedload repeats
+# every post row once per tag (and wraps the LIMIT in a subquery), while
+# Post.serialization_load_options() loads the page's tags with one batched selectinload.
+
+TAGS_PER_POST = 8
+PAGE_SIZES = (20, 50, 100)
+RUNS = 20
+
+
+@pytest.fixture
+def tagged_posts(session):
+    user_ids = create_users(session, 100)
+    post_ids = create_posts(session, user_ids, per_user=20)
+    session.execute(text(
+        "INSERT INTO hashtags (tag_name) SELECT 'tag' || n FROM generate_series(1, 50) AS n"
+    ))
+    session.execute(text(
+        "INSERT INTO post_hashtags (post_id, hashtag_id, created_at, visibility) "
+        "SELECT p.id, h.id, p.created_at, p.visibility FROM posts p "
+        "CROSS JOIN LATERAL (SELECT id FROM hashtags ORDER BY (id * p.id) % 50 LIMIT :tags) AS h"
+    ), {"tags": TAGS_PER_POST})
+    vacuum_analyze(session, "users", "posts", "hashtags", "post_hashtags")
+    return post_ids
+
+
+class _RowCounter:
+    """Counts the rows returned by each SELECT sent to the database."""
+
+    def __init__(self):
+        self.rows = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.rows.append(cursor.rowcount)
+
+
+def _page_query(per_page: int):
+    return (
+        select(Post)
+        .where(Post.visibility == PostVisibility.PUBLIC)
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .limit(per_page)
+    )
+
+
+def _load_joined(session, per_page: int) -> list[Post]:
+    query = _page_query(per_page).options(joinedload(Post.user), joinedload(Post.hashtags))
+    return session.execute(query).unique().scalars().all()
+
+
+def _load_selectin(session, per_page: int) -> list[Post]:
+    return session.execute(_page_query(per_page).options(*Post.serialization_load_options())).scalars().all()
+
+
+def _measure(session, load, per_page: int) -> tuple[list[Post], list[int], float]:
+    counter = _RowCounter()
+    event.listen(db.engine, "after_cursor_execute", counter)
+    try:
+        timings = []
+        for _ in range(RUNS):
+            session.expunge_all()
+            counter.rows.clear()
+            started = time.perf_counter()
+            posts = load(session, per_page)
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        event.remove(db.engine, "after_cursor_execute", counter)
+    return posts, list(counter.rows), statistics.median(timings)
+
+
+@pytest.mark.parametrize("per_page", PAGE_SIZES)
+def test_selectinload_does_not_multiply_post_rows(session, tagged_posts, per_page):
+    joined_posts, joined_rows, joined_ms = _measure(session, _load_joined, per_page)
+    selectin_posts, selectin_rows, selectin_ms = _measure(session, _load_selectin, per_page)
+    print(
+        f"\n{per_page} posts/page: joinedload {joined_ms:.2f} ms ({joined_rows} rows), "
+        f"selectinload {selectin_ms:.2f} ms ({selectin_rows} rows)"
+    )
+
+    # Same page, same tags
+    assert [post.id for post in joined_posts] == [post.id for post in selectin_posts]
+    assert (
+        [sorted(tag.tag_name for tag in post.hashtags) for post in joined_posts]
+        == [sorted(tag.tag_name for tag in post.hashtags) for post in selectin_posts]
+    )
+    # The joined query returns one full post row per tag; the batched load one per post
+    assert joined_rows == [per_page * TAGS_PER_POST]
+    assert selectin_rows == [per_page, per_page * TAGS_PER_POST]
@@ -0,0 +1,49 @@
+from sqlalchemy import select
+from app.models import Post
+from app.services.post.get_post_feed_service import get_post_feed_service
+from app.services.post.delete_post_service import delete_post_service
+from app.services.redis.public_feed_operation import PUBLIC_FEED_IDS_KEY
+from tests.seed import create_users, create_posts
+
+# The public feed pages through a Redis ring of the newest public post ids and falls back to
+# Postgres past its end. A ring left short of its cap by a removal must not end the feed early.
+
+RING_LENGTH = 10
+PUBLIC_POSTS = 15
+PER_PAGE = 4
+
+
+def _read_feed(session, user_id: int) -> list[str]:
+    """Pages through the whole feed by cursor and returns the post public ids in order."""
+    post_ids, cursor = [], None
+    while True:
+        page = get_post_feed_service(session, user_id, page=1, per_page=PER_PAGE, cursor=cursor)
+        post_ids += [post["id"] for post in page["posts"]]
+        cursor = page["nextCursor"]
+        if cursor is None:
+            return post_ids
+
+
+def test_feed_pages_past_a_ring_shortened_by_a_delete(app, session, redis, monkeypatch):
+    monkeypatch.setitem(app.config, 'PUBLIC_FEED_CACHE_LENGTH', RING_LENGTH)
+    author_id, viewer_id = create_users(session, 2)
+    create_posts(session, [author_id], per_user=PUBLIC_POSTS)
+    session.commit()
+
+    # Reading the first page builds a full ring; older posts are only in Postgres
+    get_post_feed_service(session, viewer_id, page=1, per_page=PER_PAGE)
+    assert redis.zcard(PUBLIC_FEED_IDS_KEY) == RING_LENGTH
+
+    newest_first = session.execute(
+        select(Post.public_id).order_by(Post.created_at.desc(), Post.id.desc())
+    ).scalars().all()
+    assert delete_post_service(session, newest_first[2], author_id)
+    session.commit()
+    assert redis.zcard(PUBLIC_FEED_IDS_KEY) == RING_LENGTH - 1
+
+    remaining = [str(public_id) for public_id in newest_first if public_id != newest_first[2]]
+    assert _read_feed(session, viewer_id) == remaining
+
+    # Page-number mode reaches the same posts past the ring's end
+    last_page = get_post_feed_service(session, viewer_id, page=3, per_page=PER_PAGE)
+    assert [post["id"] for post in last_page["posts"]] == remaining[2 * PER_PAGE:3 * PER_PAGE]
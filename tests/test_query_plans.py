@@ -0,0 +1,111 @@
+import json
+import pytest
+from sqlalchemy import select, func, text
+from sqlalchemy.dialects import postgresql
+from app.models import Post, Notification, Follower
+from utils.model_utils.enums import PostVisibility
+from tests.seed import create_users, create_posts, vacuum_analyze
+
+# Plan regression suite for the hot read paths (migration f22609aa99e1): each query must be
+# answered from its composite or partial index, on a dataset large enough that a sequential
+# scan plus sort would be chosen without it.
+
+INDEX_SCANS = ("Index Scan", "Index Only Scan")
+
+
+def _plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def _explain(session, query) -> dict:
+    compiled = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    plan = session.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def assert_uses_index(session, query, index_name: str, scan_types: tuple[str, ...] = INDEX_SCANS) -> None:
+    plan = _explain(session, query)
+    scans = [(node["Node Type"], node.get("Index Name")) for node in _plan_nodes(plan)]
+    assert any(node_type in scan_types and name == index_name for node_type, name in scans), (
+        f"expected a {' or '.join(scan_types)} on {index_name}, got:\n{json.dumps(plan, indent=2)}"
+    )
+
+
+@pytest.fixture
+def dataset(session):
+    user_ids = create_users(session, 200)
+    create_posts(session, user_ids, per_user=40)
+    create_posts(session, user_ids, per_user=10, visibility='FOLLOWERS_ONLY')
+    session.execute(text(
+        "INSERT INTO followers (follower_id, followed_id, created_at) "
+        "SELECT a, b, now() - (a + b) * interval '1 minute' "
+        "FROM unnest(CAST(:ids AS integer[])) AS a, unnest(CAST(:ids AS integer[])) AS b "
+        "WHERE a <> b AND (a + b) % 7 = 0"
+    ), {"ids": user_ids})
+    # Mostly read notifications, as on a long-running account
+    session.execute(text(
+        "INSERT INTO notifications (public_id, recipient_user_id, actor_user_id, action_type, is_read, created_at) "
+        "SELECT gen_random_uuid(), r, a, 'follow', n % 10 <> 0, now() - n * interval '1 minute' "
+        "FROM unnest(CAST(:ids AS integer[])) AS r, generate_series(1, 100) AS n, "
+        "     LATERAL (SELECT (CAST(:ids AS integer[]))[1 + (r + n) % 200] AS a) AS actor"
+    ), {"ids": user_ids})
+    vacuum_analyze(session, "users", "posts", "followers", "notifications")
+    return user_ids
+
+
+def test_public_feed_page_scans_the_public_index(session, dataset):
+    query = (
+        select(Post.id, Post.created_at, Post.updated_at)
+        .where(Post.visibility == PostVisibility.PUBLIC)
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .limit(21)
+    )
+    assert_uses_index(session, query, "idx_posts_public_created_at")
+
+
+def test_profile_page_scans_the_user_index(session, dataset):
+    query = (
+        select(Post.id, Post.created_at, Post.updated_at)
+        .where(Post.user_id == dataset[0], Post.visibility.in_([PostVisibility.PUBLIC, PostVisibility.FOLLOWERS_ONLY]))
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .limit(21)
+    )
+    assert_uses_index(session, query, "idx_posts_user_created_at")
+
+
+def test_notification_list_scans_the_recipient_index(session, dataset):
+    query = (
+        select(Notification.id)
+        .where(Notification.recipient_user_id == dataset[0])
+        .order_by(Notification.created_at.desc(), Notification.id.desc())
+        .limit(20)
+    )
+    assert_uses_index(session, query, "idx_notifications_recipient_created_at")
+
+
+def test_unread_count_uses_the_partial_index(session, dataset):
+    query = (
+        select(func.count())
+        .select_from(Notification)
+        .where(Notification.recipient_user_id == dataset[0], Notification.is_read == False)
+    )
+    assert_uses_index(session, query, "idx_notifications_recipient_unread", INDEX_SCANS + ("Bitmap Index Scan",))
+
+
+def test_fan_out_reads_followers_from_the_index(session, dataset):
+    query = select(Follower.follower_id).where(Follower.followed_id == dataset[0])
+    assert_uses_index(session, query, "idx_followers_followed_created_at")
+
+
+def test_following_list_scans_the_follower_index(session, dataset):
+    query = (
+        select(Follower.followed_id)
+        .where(Follower.follower_id == dataset[0])
+        .order_by(Follower.created_at.desc())
+        .limit(20)
+    )
+    assert_uses_index(session, query, "idx_followers_follower_created_at")
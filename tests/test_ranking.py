@@ -0,0 +1,58 @@
+import time
+import numpy as np
+import pytest
+from app.services.post.ranking import score_candidates, top_k, POST_TYPE_BOOST
+from utils.model_utils.enums import PostType
+
+# The ranked feed scores its whole candidate set per request, so scoring must stay within a
+# few milliseconds for the largest set it pulls (2 x RANKED_FEED_CANDIDATES_PER_SOURCE).
+# The timing check depends on the host, so it only runs with RUN_BENCHMARKS=1.
+
+CANDIDATES = 2000
+SCORING_BUDGET_MS = 5.0
+
+
+def _candidates(size: int, seed: int = 7) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    post_types = rng.choice([PostType.REGULAR, PostType.RATE_POST], size=size)
+    return {
+        "like_counts": rng.zipf(1.8, size).astype(np.float64),
+        "age_hours": rng.uniform(0, 72, size),
+        "author_like_counts": rng.poisson(0.5, size).astype(np.float64),
+        "is_followed": rng.random(size) < 0.5,
+        "type_boosts": np.array([POST_TYPE_BOOST[post_type] for post_type in post_types]),
+    }
+
+
+def test_top_k_returns_the_best_scores_in_order():
+    scores = np.array([0.5, 3.0, 1.0, 3.0, 2.0])
+    assert top_k(scores, 3).tolist() == [1, 3, 4]
+    assert top_k(scores, 10).tolist() == [1, 3, 4, 2, 0]
+    assert top_k(scores, 0).size == 0
+
+
+def test_recent_followed_posts_outrank_stale_unknown_ones():
+    scores = score_candidates(
+        like_counts=np.array([10.0, 10.0]),
+        age_hours=np.array([1.0, 48.0]),
+        author_like_counts=np.array([3.0, 0.0]),
+        is_followed=np.array([True, False]),
+        type_boosts=np.zeros(2),
+    )
+    assert scores[0] > scores[1]
+
+
+@pytest.mark.benchmark
+def test_scoring_2000_candidates_stays_within_budget():
+    candidates = _candidates(CANDIDATES)
+    score_candidates(**candidates) # Warm up
+
+    timings = []
+    for _ in range(200):
+        started = time.perf_counter()
+        top_k(score_candidates(**candidates), 100)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    median, p99 = np.percentile(timings, [50, 99])
+    print(f"\nscore + top_k of {CANDIDATES} candidates: median {median:.3f} ms, p99 {p99:.3f} ms")
+    assert median < SCORING_BUDGET_MS
@@ -0,0 +1,86 @@
+import json
+import os
+import statistics
+import time
+import pytest
+from sqlalchemy import text
+from app.services.post.search_service import search_posts_service
+from tests.seed import create_users, vacuum_analyze
+
+# Benchmark of /search/posts against a synthetic 5M-post corpus. Each post has ten words drawn
+# from a skewed vocabulary (word i has probability ~ (i / VOCABULARY) ^ (-2/3)), so the corpus
+# has both very common words (in about a third of all posts) and rare ones (in a few hundred).
+# Seeding takes several minutes, so it only runs with RUN_BENCHMARKS=1.
+
+CORPUS_SIZE = int(os.getenv('SEARCH_BENCHMARK_POSTS', 5_000_000))
+BATCH_SIZE = 500_000
+VOCABULARY = 20_000
+USERS = 10_000
+RUNS = 20
+# Budget for selective queries, which must be served from the GIN index
+P95_BUDGET_MS = float(os.getenv('SEARCH_BENCHMARK_P95_MS', 250))
+
+SELECTIVE_QUERIES = ("w19990", "w15000 w18000", '"w12000 w12001"', "w17000 -w0")
+COMMON_QUERIES = ("w0", "w1 w2")
+
+
+@pytest.fixture
+def corpus(session):
+    user_ids = create_users(session, USERS)
+    session.commit()
+    for start in range(0, CORPUS_SIZE, BATCH_SIZE):
+        session.execute(text(
+            "INSERT INTO posts (public_id, user_id, content, visibility, created_at, updated_at) "
+            "SELECT gen_random_uuid(), (CAST(:user_ids AS integer[]))[1 + n % :users], "
+            "       (SELECT string_agg('w' || floor(:vocabulary * power(random(), 3))::int, ' ') "
+            "        FROM generate_series(1, 10) WHERE n > 0), "
+            "       CAST(CASE WHEN n % 20 = 0 THEN 'PRIVATE' WHEN n % 7 = 0 THEN 'FOLLOWERS_ONLY' ELSE 'PUBLIC' END AS post_visibility_enum), "
+            "       now() - n * interval '1 second', now() - n * interval '1 second' "
+            "FROM generate_series(:start, :end) AS n"
+        ), {
+            "user_ids": user_ids, "users": USERS, "vocabulary": VOCABULARY,
+            "start": start + 1, "end": min(start + BATCH_SIZE, CORPUS_SIZE)
+        })
+        session.commit()
+    vacuum_analyze(session, "users", "posts")
+    return user_ids
+
+
+def _time_search(session, query_text: str, requesting_user_id: int | None) -> tuple[float, float, int]:
+    timings, results = [], 0
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        page = search_posts_service(session, query_text, requesting_user_id, per_page=20)
+        timings.append((time.perf_counter() - started) * 1000)
+        results = len(page["posts"])
+        session.rollback()
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.95) - 1], results
+
+
+def _uses_search_index(session, query_text: str) -> bool:
+    plan = session.execute(text(
+        "EXPLAIN (FORMAT JSON) SELECT id FROM posts "
+        "WHERE search_vector @@ websearch_to_tsquery('english', :q)"
+    ), {"q": query_text}).scalar()
+    return "idx_posts_search_vector" in (plan if isinstance(plan, str) else json.dumps(plan))
+
+
+@pytest.mark.benchmark
+def test_search_latency_on_a_5m_post_corpus(session, corpus):
+    report = []
+    for query_text in SELECTIVE_QUERIES + COMMON_QUERIES:
+        for requesting_user_id in (None, corpus[0]):
+            median, p95, results = _time_search(session, query_text, requesting_user_id)
+            report.append((query_text, requesting_user_id, median, p95, results))
+    print(f"\nsearch over {CORPUS_SIZE:,} posts (median / p95 of {RUNS} runs, 20 per page):")
+    for query_text, requesting_user_id, median, p95, results in report:
+        viewer = "anonymous" if requesting_user_id is None else "signed in"
+        print(f"  {query_text!r:<22} {viewer:<10} {median:8.1f} ms {p95:8.1f} ms  {results} results")
+
+    for query_text in SELECTIVE_QUERIES:
+        assert _uses_search_index(session, query_text)
+    # Common words rank every match before the LIMIT, so only selective queries have a budget
+    for query_text, _, _, p95, _ in report:
+        if query_text in SELECTIVE_QUERIES:
+            assert p95 < P95_BUDGET_MS, f"{query_text!r}: p95 {p95:.1f} ms"
@@ -7,13 +7,15 @@ from .jwt_error_handlers import (
     my_invalid_token_callback,
     unauthorized_callback,
 )
+from .lru_cache import LRUCache
+from .pagination_utils import encode_cursor, decode_cursor
 from .regex_patterns import MENTION_REGEX
 from .token_utils import TokenUtil
 from .validation_utils import validate_password, validate_email, PASSWORD_ERROR_STRING
 
 
 __all__ = [
-    'CustomApi', 'MENTION_REGEX', 'my_expired_token_callback', 'my_invalid_token_callback', 
+    'CustomApi', 'decode_cursor', 'encode_cursor', 'LRUCache', 'MENTION_REGEX', 'my_expired_token_callback', 'my_invalid_token_callback', 
     'PASSWORD_ERROR_STRING', 'require_active_user', 'send_contact_form_email', 
     'send_password_reset_email', 'send_verification_email', 'set_auth_cookies', 'TokenUtil',
     'unauthorized_callback', 'validate_email', 'validate_password'
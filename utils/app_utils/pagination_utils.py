@@ -0,0 +1,39 @@
+import base64
+import json
+from datetime import datetime
+
+#----------------------------------------------------------------
+# Opaque cursors for keyset (seek) pagination.
+# A cursor encodes the sort key and the row id of the last item on a page,
+# e.g. (created_at, id) or (username, id). Clients must treat it as opaque.
+#----------------------------------------------------------------
+
+def encode_cursor(sort_value: datetime | str | int | float, row_id: int) -> str:
+    """
+    Encodes the sort key and id of the last row on a page into a URL-safe cursor string.
+    """
+    if isinstance(sort_value, datetime):
+        payload = {"k": sort_value.isoformat(), "t": "dt", "i": row_id}
+    else:
+        payload = {"k": sort_value, "t": "raw", "i": row_id}
+
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime | str | int | float, int]:
+    """
+    Decodes a cursor produced by encode_cursor back into (sort_value, row_id).
+    Raises ValueError if the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        row_id = int(payload["i"])
+        sort_value = payload["k"]
+        if payload.get("t") == "dt":
+            sort_value = datetime.fromisoformat(sort_value)
+    except (ValueError, TypeError, KeyError, UnicodeError) as e:
+        raise ValueError("Invalid pagination cursor.") from e
+
+    return sort_value, row_id